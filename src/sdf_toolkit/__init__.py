@@ -1,33 +1,47 @@
-"""sdf_toolkit -- parse and emit Standard Delay Format (SDF) timing files."""
+"""sdf_toolkit -- parse and emit Standard Delay Format (SDF) timing files.
 
-from sdf_toolkit.analysis import (
-    DiffEntry,
-    DiffResult,
-    EndpointResult,
-    LintIssue,
-    RankedPath,
-    SDFStats,
-    TimingEdge,
-    TimingGraph,
-    VerificationResult,
-    batch_endpoint_analysis,
-    compute_slack,
-    compute_stats,
-    critical_path,
-    decompose_delay,
-    diff,
-    generate_report,
-    query,
-    rank_paths,
-    to_dot,
-    validate,
-    verify_path,
-)
-from sdf_toolkit.core import CellBuilder, SDFBuilder, SDFFile, SDFHeader
-from sdf_toolkit.core.model import DelayField, DelayFieldLike, DelayMetric, DelayMetricLike
-from sdf_toolkit.io import annotate_verilog, emit, emit_sdf, parse
-from sdf_toolkit.parser import parse_sdf, parse_sdf_file
-from sdf_toolkit.transform import ConflictStrategy, merge, normalize_delays
+The public names below are imported on first access, so that importing a
+single submodule (for example the CLI) does not pull in networkx, Jinja2
+and the rest of the analysis and I/O layers.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sdf_toolkit.analysis import (
+        DiffEntry,
+        DiffResult,
+        EndpointResult,
+        LintIssue,
+        RankedPath,
+        SDFStats,
+        TimingEdge,
+        TimingGraph,
+        VerificationResult,
+        batch_endpoint_analysis,
+        compute_slack,
+        compute_stats,
+        critical_path,
+        decompose_delay,
+        diff,
+        generate_report,
+        query,
+        rank_paths,
+        to_dot,
+        validate,
+        verify_path,
+    )
+    from sdf_toolkit.core import CellBuilder, SDFBuilder, SDFFile, SDFHeader
+    from sdf_toolkit.core.model import (
+        DelayField,
+        DelayFieldLike,
+        DelayMetric,
+        DelayMetricLike,
+    )
+    from sdf_toolkit.io import annotate_verilog, emit, emit_sdf, parse
+    from sdf_toolkit.parser import parse_sdf, parse_sdf_file
+    from sdf_toolkit.transform import ConflictStrategy, merge, normalize_delays
 
 __all__ = [
     # core
@@ -74,3 +88,66 @@ __all__ = [
     "merge",
     "normalize_delays",
 ]
+
+
+# Public name -> module __getattr__ imports it from on first access.
+_EXPORTS: dict[str, str] = {
+    "DiffEntry": "sdf_toolkit.analysis",
+    "DiffResult": "sdf_toolkit.analysis",
+    "EndpointResult": "sdf_toolkit.analysis",
+    "LintIssue": "sdf_toolkit.analysis",
+    "RankedPath": "sdf_toolkit.analysis",
+    "SDFStats": "sdf_toolkit.analysis",
+    "TimingEdge": "sdf_toolkit.analysis",
+    "TimingGraph": "sdf_toolkit.analysis",
+    "VerificationResult": "sdf_toolkit.analysis",
+    "batch_endpoint_analysis": "sdf_toolkit.analysis",
+    "compute_slack": "sdf_toolkit.analysis",
+    "compute_stats": "sdf_toolkit.analysis",
+    "critical_path": "sdf_toolkit.analysis",
+    "decompose_delay": "sdf_toolkit.analysis",
+    "diff": "sdf_toolkit.analysis",
+    "generate_report": "sdf_toolkit.analysis",
+    "query": "sdf_toolkit.analysis",
+    "rank_paths": "sdf_toolkit.analysis",
+    "to_dot": "sdf_toolkit.analysis",
+    "validate": "sdf_toolkit.analysis",
+    "verify_path": "sdf_toolkit.analysis",
+    "CellBuilder": "sdf_toolkit.core",
+    "SDFBuilder": "sdf_toolkit.core",
+    "SDFFile": "sdf_toolkit.core",
+    "SDFHeader": "sdf_toolkit.core",
+    "DelayField": "sdf_toolkit.core.model",
+    "DelayFieldLike": "sdf_toolkit.core.model",
+    "DelayMetric": "sdf_toolkit.core.model",
+    "DelayMetricLike": "sdf_toolkit.core.model",
+    "annotate_verilog": "sdf_toolkit.io",
+    "emit": "sdf_toolkit.io",
+    "emit_sdf": "sdf_toolkit.io",
+    "parse": "sdf_toolkit.io",
+    "parse_sdf": "sdf_toolkit.parser",
+    "parse_sdf_file": "sdf_toolkit.parser",
+    "ConflictStrategy": "sdf_toolkit.transform",
+    "merge": "sdf_toolkit.transform",
+    "normalize_delays": "sdf_toolkit.transform",
+}
+
+_SUBPACKAGES = frozenset({"analysis", "core", "io", "parser", "transform"})
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name, or a subpackage, on first access."""
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names alongside the module globals."""
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,10 @@
 """Analysis modules for SDF timing data."""
 
 from sdf_toolkit.analysis.diff import DiffEntry, DiffResult, diff
-from sdf_toolkit.analysis.export import to_dot
+from sdf_toolkit.analysis.export import to_dot, write_dot
+from sdf_toolkit.analysis.fused import compute_all
 from sdf_toolkit.analysis.query import query
-from sdf_toolkit.analysis.report import generate_report
+from sdf_toolkit.analysis.report import generate_report, generate_report_to
 from sdf_toolkit.analysis.stats import SDFStats, compute_stats
 from sdf_toolkit.analysis.validate import IssueSeverity, LintIssue, validate
 from sdf_toolkit.core.pathgraph import (
@@ -27,6 +28,9 @@ __all__ = [
     "diff",
     # export
     "to_dot",
+    "write_dot",
+    # fused
+    "compute_all",
     # pathgraph
     "EndpointResult",
     "RankedPath",
@@ -43,6 +47,7 @@ __all__ = [
     "query",
     # report
     "generate_report",
+    "generate_report_to",
     # stats
     "SDFStats",
     "compute_stats",
@@ -1,8 +1,27 @@
 """DOT/Graphviz export for timing graphs."""
 
-from sdf_toolkit.core.model import DelayField, DelayFieldLike, DelayMetric, DelayMetricLike
+import itertools
+from io import StringIO
+from operator import itemgetter
+from typing import TextIO
+
+from sdf_toolkit.core.model import (
+    DelayField,
+    DelayFieldLike,
+    DelayMetric,
+    DelayMetricLike,
+    DelayPaths,
+)
 from sdf_toolkit.core.pathgraph import RankedPath, TimingGraph
 
+# Extra edge attributes indexed by "is this edge on the highlighted path".
+_EDGE_STYLE = ("", ', color="red", penwidth=2.0')
+
+
+def _format_label(scalar: float | None) -> str:
+    """Format an edge delay for a DOT label, using ``?`` when it is missing."""
+    return f"{scalar:.3f}" if scalar is not None else "?"
+
 
 def to_dot(
     graph: TimingGraph,
@@ -31,40 +50,107 @@ def to_dot(
     str
         The DOT-format string.
     """
-    highlight_edges: set[tuple[str, str]] = (
-        {(edge.source, edge.sink) for edge in highlight_path.edges}
-        if highlight_path is not None
-        else set()
-    )
+    buf = StringIO()
+    write_dot(graph, buf, highlight_path, cluster_by_instance, field, metric)
+    return buf.getvalue()
+
+
+def write_dot(
+    graph: TimingGraph,
+    out: TextIO,
+    highlight_path: RankedPath | None = None,
+    cluster_by_instance: bool = False,
+    field: DelayFieldLike = DelayField.SLOW,
+    metric: DelayMetricLike = DelayMetric.MAX,
+) -> None:
+    """Write a timing graph in DOT format to a text stream.
+
+    Lines are written to *out* as they are produced, so the DOT text is
+    never held in memory as one string. The output is identical to
+    :func:`to_dot`, with no trailing newline.
+
+    Parameters
+    ----------
+    graph : TimingGraph
+        The timing graph to export.
+    out : TextIO
+        Destination stream, e.g. ``sys.stdout`` or an open file.
+    highlight_path : RankedPath | None
+        If provided, highlight these edges in red with bold penwidth.
+    cluster_by_instance : bool
+        If True, group nodes into subgraph clusters by instance prefix.
+    field : str
+        Delay field for edge labels.
+    metric : str
+        Metric for edge labels.
+
+    Examples
+    --------
+    >>> import io
+    >>> from sdf_toolkit.core.builder import SDFBuilder
+    >>> from sdf_toolkit.analysis.export import write_dot
+    >>> sdf = (
+    ...     SDFBuilder()
+    ...     .add_cell("BUF", "b0")
+    ...         .add_iopath("A", "Y", {"slow": (1.0, 2.0, 3.0)})
+    ...     .build()
+    ... )
+    >>> out = io.StringIO()
+    >>> write_dot(TimingGraph(sdf), out)
+    >>> print(out.getvalue())
+    digraph timing {
+      rankdir=LR;
+      "b0/A";
+      "b0/Y";
+      "b0/A" -> "b0/Y" [label="3.000"];
+    }
+    """
+    # Highlighted sinks per source: the edge test below is then a string
+    # lookup that fails fast for most edges, with no (source, sink) tuple
+    # built per edge. Parallel edges between highlighted pins still match.
+    highlight_sinks: dict[str, set[str]] = {}
+    if highlight_path is not None:
+        for edge in highlight_path.edges:
+            highlight_sinks.setdefault(edge.source, set()).add(edge.sink)
 
-    lines: list[str] = ["digraph timing {", "  rankdir=LR;"]
+    write = out.write
+    write("digraph timing {\n  rankdir=LR;\n")
 
     nodes = graph.nodes()
 
     if cluster_by_instance:
-        clusters: dict[str, list[str]] = {}
-        for node in sorted(nodes):
-            parts = node.rsplit("/", 1)
-            instance = parts[0] if len(parts) > 1 else ""
-            clusters.setdefault(instance, []).append(node)
-        for i, (instance, members) in enumerate(sorted(clusters.items())):
+        # Sort by (instance, node) rather than by node alone: plain node order
+        # can interleave instances ("a/B" < "a/b/c" < "a/x") and misorder them
+        # ("a-b/..." < "a/..."), which would break the grouping below.
+        keyed = sorted((node.rpartition("/")[0], node) for node in nodes)
+        for i, (instance, members) in enumerate(
+            itertools.groupby(keyed, key=itemgetter(0))
+        ):
             label = instance or "(top)"
-            lines.append(f"  subgraph cluster_{i} {{")
-            lines.append(f'    label="{label}";')
-            for node in sorted(members):
-                lines.append(f'    "{node}";')
-            lines.append("  }")
+            write(f'  subgraph cluster_{i} {{\n    label="{label}";\n')
+            out.writelines(f'    "{node}";\n' for _, node in members)
+            write("  }\n")
     else:
-        for node in sorted(nodes):
-            lines.append(f'  "{node}";')
-
-    for edge in graph.edges():
-        scalar = edge.delay.get_scalar(field, metric)
-        label = f"{scalar:.3f}" if scalar is not None else "?"
-        attrs = f'label="{label}"'
-        if (edge.source, edge.sink) in highlight_edges:
-            attrs += ', color="red", penwidth=2.0'
-        lines.append(f'  "{edge.source}" -> "{edge.sink}" [{attrs}];')
-
-    lines.append("}")
-    return "\n".join(lines)
+        out.writelines(f'  "{node}";\n' for node in sorted(nodes))
+
+    # Validate field/metric once and reuse the bound getter for every edge.
+    get_scalar = DelayPaths.scalar_getter(field, metric)
+    edges = graph.edges()
+    styles: list[str] = (
+        [
+            _EDGE_STYLE[
+                edge.source in highlight_sinks
+                and edge.sink in highlight_sinks[edge.source]
+            ]
+            for edge in edges
+        ]
+        if highlight_sinks
+        else [""] * len(edges)
+    )
+    out.writelines(
+        f'  "{edge.source}" -> "{edge.sink}" '
+        f'[label="{_format_label(get_scalar(edge.delay))}"{style}];\n'
+        for edge, style in zip(edges, styles, strict=True)
+    )
+
+    write("}")
@@ -1,9 +1,15 @@
 """Filter and query SDF files by various criteria."""
 
-import copy
+import dataclasses
 import re
+from collections.abc import Callable
 
-from sdf_toolkit.core.model import BaseEntry, DelayField, DelayFieldLike, DelayMetric, DelayMetricLike, EntryType, SDFFile
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from sdf_toolkit.core.model import BaseEntry, DelayField, DelayFieldLike, DelayMetric, DelayMetricLike, DelayPaths, EntryType, SDFFile
 
 
 def query(
@@ -30,7 +36,11 @@ def query(
     entry_types : list[EntryType] | None
         If given, only include entries of these types.
     pin_pattern : str | None
-        Regex pattern to match against from_pin or to_pin.
+        Regex pattern to match against from_pin or to_pin. When the
+        optional ``google-re2`` package is installed the pattern is matched
+        with RE2, which runs in linear time and cannot backtrack
+        catastrophically; patterns RE2 does not support (backreferences,
+        lookaround) fall back to :mod:`re`.
     min_delay : float | None
         Minimum delay threshold (inclusive).
     max_delay : float | None
@@ -43,7 +53,8 @@ def query(
     Returns
     -------
     SDFFile
-        A new SDFFile with header deep-copied and cells filtered.
+        A new SDFFile with header and matching entries copied and cells
+        filtered.
 
     Examples
     --------
@@ -68,44 +79,109 @@ def query(
     >>> "INV" in result.cells
     False
     """
-    result = SDFFile(header=copy.deepcopy(sdf.header), cells={})
+    # Header fields are plain strings, so a shallow copy is independent.
+    result = SDFFile(header=dataclasses.replace(sdf.header), cells={})
+    pin_search = _compile_pin_search(pin_pattern) if pin_pattern is not None else None
+    # Allow-lists may be long; set membership keeps each check O(1).
+    cell_type_set = frozenset(cell_types) if cell_types is not None else None
+    instance_set = frozenset(instances) if instances is not None else None
+    entry_type_set = frozenset(entry_types) if entry_types is not None else None
+    get_scalar = (
+        DelayPaths.scalar_getter(field, metric)
+        if min_delay is not None or max_delay is not None
+        else None
+    )
+
+    # With no entry-level criteria every entry matches, so skip the
+    # per-entry predicate and copy whole instances.
+    filter_entries = (
+        entry_type_set is not None or pin_search is not None or get_scalar is not None
+    )
 
     for cell_type, instances_dict in sdf.cells.items():
-        if cell_types is not None and cell_type not in cell_types:
+        if cell_type_set is not None and cell_type not in cell_type_set:
             continue
 
         for instance, entries in instances_dict.items():
-            if instances is not None and instance not in instances:
+            if instance_set is not None and instance not in instance_set:
                 continue
 
-            for entry_name, entry in entries.items():
-                if not _entry_matches(
-                    entry,
-                    entry_types=entry_types,
-                    pin_pattern=pin_pattern,
-                    min_delay=min_delay,
-                    max_delay=max_delay,
-                    field=field,
-                    metric=metric,
-                ):
-                    continue
-
-                result.cells.setdefault(cell_type, {}).setdefault(instance, {})[
-                    entry_name
-                ] = copy.deepcopy(entry)
+            # Filter the instance's entries first and only attach the
+            # surviving dict, instead of two setdefault probes per entry.
+            if filter_entries:
+                kept = {
+                    entry_name: _clone_entry(entry)
+                    for entry_name, entry in entries.items()
+                    if _entry_matches(
+                        entry,
+                        entry_types=entry_type_set,
+                        pin_search=pin_search,
+                        min_delay=min_delay,
+                        max_delay=max_delay,
+                        get_scalar=get_scalar,
+                    )
+                }
+            else:
+                kept = {
+                    entry_name: _clone_entry(entry)
+                    for entry_name, entry in entries.items()
+                }
+            if kept:
+                result.cells.setdefault(cell_type, {})[instance] = kept
 
     return result
 
 
+def _compile_pin_search(pin_pattern: str) -> Callable[[str], object]:
+    """Compile *pin_pattern* and return its ``search`` method.
+
+    RE2 is preferred when available because its matching time is linear in
+    the pin length regardless of the pattern.
+
+    Parameters
+    ----------
+    pin_pattern : str
+        The user-supplied regular expression.
+
+    Returns
+    -------
+    Callable[[str], object]
+        Function returning a match object, or None when there is no match.
+    """
+    if re2 is not None:
+        # Without this, google-re2 logs every pattern it rejects to stderr
+        # even though the pattern is then handled by ``re``.
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(pin_pattern, options).search
+        except re2.error:
+            pass
+    return re.compile(pin_pattern).search
+
+
+def _clone_entry(entry: BaseEntry) -> BaseEntry:
+    """Return a copy of *entry* that can be modified independently.
+
+    Only ``delay_paths`` is mutable, so only that container is copied; the
+    frozen ``Values`` triples inside it are shared, just as the parser
+    shares them between entries. Every other field is a string, enum,
+    bool or None.
+    """
+    paths = entry.delay_paths
+    if paths is not None:
+        paths = dataclasses.replace(paths)
+    return dataclasses.replace(entry, delay_paths=paths)
+
+
 def _entry_matches(
     entry: BaseEntry,
     *,
-    entry_types: list[EntryType] | None,
-    pin_pattern: str | None,
+    entry_types: frozenset[EntryType] | None,
+    pin_search: Callable[[str], object] | None,
     min_delay: float | None,
     max_delay: float | None,
-    field: DelayFieldLike,
-    metric: DelayMetricLike,
+    get_scalar: Callable[[DelayPaths], float | None] | None,
 ) -> bool:
     """Check whether a single entry passes all filter criteria.
 
@@ -113,18 +189,18 @@ def _entry_matches(
     ----------
     entry : BaseEntry
         The entry to check.
-    entry_types : list[EntryType] | None
+    entry_types : frozenset[EntryType] | None
         Allowed entry types, or None to allow all.
-    pin_pattern : str | None
-        Regex pattern to match against from_pin or to_pin.
+    pin_search : Callable[[str], object] | None
+        Bound ``search`` of the compiled pin pattern, applied to from_pin
+        and to_pin.
     min_delay : float | None
         Minimum delay threshold (inclusive).
     max_delay : float | None
         Maximum delay threshold (inclusive).
-    field : str
-        Delay field for scalar extraction.
-    metric : str
-        Metric for scalar extraction.
+    get_scalar : Callable[[DelayPaths], float | None] | None
+        Scalar extractor from :meth:`DelayPaths.scalar_getter`; set
+        whenever a delay threshold is given.
 
     Returns
     -------
@@ -134,16 +210,11 @@ def _entry_matches(
     if entry_types is not None and entry.type not in entry_types:
         return False
 
-    if pin_pattern is not None:
-        from_match = re.search(pin_pattern, entry.from_pin or "")
-        to_match = re.search(pin_pattern, entry.to_pin or "")
-        if not from_match and not to_match:
-            return False
-
-    if min_delay is not None or max_delay is not None:
+    # Cheap attribute and numeric tests run before the regex search.
+    if get_scalar is not None:
         if entry.delay_paths is None:
             return False
-        scalar = entry.delay_paths.get_scalar(field, metric)
+        scalar = get_scalar(entry.delay_paths)
         if scalar is None:
             return False
         if min_delay is not None and scalar < min_delay:
@@ -151,4 +222,9 @@ def _entry_matches(
         if max_delay is not None and scalar > max_delay:
             return False
 
+    if pin_search is not None:
+        from_pin = entry.from_pin or ""
+        if not pin_search(from_pin) and not pin_search(entry.to_pin or ""):
+            return False
+
     return True
@@ -1,18 +1,14 @@
 """Generate human-readable timing reports from SDF files."""
 
 from io import StringIO
+from typing import TextIO
 
 from rich.console import Console
 from rich.table import Table
 
-from sdf_toolkit.analysis.stats import compute_stats
-from sdf_toolkit.analysis.validate import validate
+from sdf_toolkit.analysis.fused import compute_all
 from sdf_toolkit.core.model import DelayField, DelayFieldLike, DelayMetric, DelayMetricLike, SDFFile
-from sdf_toolkit.core.pathgraph import (
-    TimingGraph,
-    batch_endpoint_analysis,
-    compute_slack,
-)
+from sdf_toolkit.core.pathgraph import batch_endpoint_analysis
 
 
 def _format_float(value: float | None) -> str:
@@ -83,7 +79,71 @@ def generate_report(
     True
     """
     buf = StringIO()
-    console = Console(file=buf, force_terminal=False, width=120)
+    generate_report_to(sdf, buf, field, metric, top_n_paths, period)
+    return buf.getvalue()
+
+
+def generate_report_to(
+    sdf: SDFFile,
+    out: TextIO,
+    field: DelayFieldLike = DelayField.SLOW,
+    metric: DelayMetricLike = DelayMetric.MAX,
+    top_n_paths: int = 10,
+    period: float | None = None,
+) -> None:
+    """Write a human-readable timing report to a text stream.
+
+    Each section is written to *out* as soon as it is rendered, so the
+    full report is never held in memory as one string.
+
+    Parameters
+    ----------
+    sdf : SDFFile
+        The SDF file to analyze.
+    out : TextIO
+        Destination stream, e.g. ``sys.stdout`` or an open file.
+    field : str
+        Delay field to use for analysis.
+    metric : str
+        Metric to use for analysis.
+    top_n_paths : int
+        Number of top critical endpoint pairs to show.
+    period : float | None
+        Optional clock period for slack analysis.
+
+    Examples
+    --------
+    >>> import io
+    >>> from sdf_toolkit.core.builder import SDFBuilder
+    >>> from sdf_toolkit.analysis.report import generate_report_to
+    >>> sdf = (
+    ...     SDFBuilder()
+    ...     .set_header(timescale="1ps")
+    ...     .add_cell("BUF", "b0")
+    ...         .add_iopath("A", "Y", {
+    ...             "slow": {"min": 1.0, "avg": 2.0, "max": 3.0},
+    ...         })
+    ...     .build()
+    ... )
+    >>> out = io.StringIO()
+    >>> generate_report_to(sdf, out)
+    >>> "Statistics" in out.getvalue()
+    True
+    """
+    # Plain-text output: skip rich's per-cell highlighting, markup and emoji
+    # passes, which also keeps names such as ``d[3]`` verbatim.
+    console = Console(
+        file=out,
+        force_terminal=False,
+        width=120,
+        highlight=False,
+        markup=False,
+        emoji=False,
+        log_time=False,
+        log_path=False,
+    )
+    # Statistics, validation and the timing graph share one traversal.
+    stats, issues, graph = compute_all(sdf, field, metric)
 
     # Section 1: Header summary
     header_table = Table(title="SDF Header")
@@ -94,7 +154,6 @@ def generate_report(
     console.print(header_table)
 
     # Section 2: Statistics
-    stats = compute_stats(sdf, field, metric)
     stats_table = Table(title="Statistics")
     stats_table.add_column("Metric")
     stats_table.add_column("Value")
@@ -108,7 +167,6 @@ def generate_report(
     console.print(stats_table)
 
     # Section 3: Validation issues
-    issues = validate(sdf)
     if issues:
         issues_table = Table(title="Validation Issues")
         issues_table.add_column("Severity")
@@ -127,7 +185,6 @@ def generate_report(
         console.print(issues_table)
 
     # Section 4: Top N critical endpoint pairs
-    graph = TimingGraph(sdf)
     endpoint_results = batch_endpoint_analysis(graph, field, metric)
     top_results = endpoint_results[:top_n_paths]
 
@@ -157,8 +214,12 @@ def generate_report(
         slack_table.add_column("Slack")
         slack_table.add_column("Status")
         for result in top_results:
-            slack = compute_slack(
-                graph, result.source, result.sink, period, field, metric
+            # compute_slack() is period minus the critical path scalar,
+            # which batch_endpoint_analysis already found for this pair.
+            slack = (
+                period - result.critical_delay
+                if result.critical_delay is not None
+                else None
             )
             if slack is not None:
                 status = "VIOLATION" if slack < 0 else "OK"
@@ -173,5 +234,3 @@ def generate_report(
                 status,
             )
         console.print(slack_table)
-
-    return buf.getvalue()
@@ -1,9 +1,10 @@
 """Aggregate statistics over SDF delay values."""
 
 import statistics
+from collections import Counter
 from dataclasses import dataclass
 
-from sdf_toolkit.core.model import DelayField, DelayFieldLike, DelayMetric, DelayMetricLike, SDFFile
+from sdf_toolkit.core.model import DelayField, DelayFieldLike, DelayMetric, DelayMetricLike, DelayPaths, EntryType, SDFFile
 
 
 @dataclass
@@ -88,7 +89,8 @@ def compute_stats(
     >>> stats.delay_max
     6.0
     """
-    entry_type_counts: dict[str, int] = {}
+    type_counts: Counter[EntryType] = Counter()
+    get_scalar = DelayPaths.scalar_getter(field, metric)
     scalars: list[float] = []
     total_instances = 0
     total_entries = 0
@@ -98,21 +100,68 @@ def compute_stats(
         for entries in instances.values():
             total_entries += len(entries)
             for entry in entries.values():
-                type_key = str(entry.type)
-                entry_type_counts[type_key] = entry_type_counts.get(type_key, 0) + 1
+                type_counts[entry.type] += 1
 
                 if entry.delay_paths is not None:
-                    scalar = entry.delay_paths.get_scalar(field, metric)
+                    scalar = get_scalar(entry.delay_paths)
                     if scalar is not None:
                         scalars.append(scalar)
 
+    return _build_stats(
+        len(sdf.cells), total_instances, total_entries, type_counts, scalars
+    )
+
+
+def _build_stats(
+    total_cells: int,
+    total_instances: int,
+    total_entries: int,
+    type_counts: Counter[EntryType],
+    scalars: list[float],
+) -> SDFStats:
+    """Assemble an SDFStats from counters gathered during a traversal.
+
+    Parameters
+    ----------
+    total_cells : int
+        Number of unique cell types.
+    total_instances : int
+        Total number of instances.
+    total_entries : int
+        Total number of timing entries.
+    type_counts : Counter[EntryType]
+        Count of entries keyed by entry type; keys are converted to
+        strings once here rather than per entry.
+    scalars : list[float]
+        Extracted delay scalars to aggregate.
+
+    Returns
+    -------
+    SDFStats
+        Aggregate statistics.
+    """
+    delay_min = delay_max = delay_mean = delay_median = None
+    if scalars:
+        # One sort yields min, max and median together; fmean sums the
+        # floats with fsum instead of the exact Fraction arithmetic used
+        # by statistics.mean.
+        ordered = sorted(scalars)
+        n = len(ordered)
+        mid = n // 2
+        delay_min = ordered[0]
+        delay_max = ordered[-1]
+        delay_mean = statistics.fmean(ordered)
+        delay_median = (
+            ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+        )
+
     return SDFStats(
-        total_cells=len(sdf.cells),
+        total_cells=total_cells,
         total_instances=total_instances,
         total_entries=total_entries,
-        entry_type_counts=entry_type_counts,
-        delay_min=min(scalars) if scalars else None,
-        delay_max=max(scalars) if scalars else None,
-        delay_mean=statistics.mean(scalars) if scalars else None,
-        delay_median=statistics.median(scalars) if scalars else None,
+        entry_type_counts={str(k): v for k, v in type_counts.items()},
+        delay_min=delay_min,
+        delay_max=delay_max,
+        delay_mean=delay_mean,
+        delay_median=delay_median,
     )
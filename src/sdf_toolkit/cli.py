@@ -5,44 +5,84 @@ display file summaries, compose path delays, verify expected delays,
 and decompose delay segments.
 """
 
-import json
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import itertools
+import os
+import pickle
+import stat
+import sys
+import tempfile
 from collections import Counter
+from collections.abc import Callable
 from enum import StrEnum
 from pathlib import Path  # noqa: TC003 - required at runtime by Typer
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, BinaryIO, TextIO
 
 import typer
+from rich.columns import Columns
 from rich.console import Console
 from rich.table import Table
 
-from sdf_toolkit.analysis.export import to_dot
+from sdf_toolkit.core.builder import values_from_input
 from sdf_toolkit.core.model import (
     BaseEntry,
     DelayPaths,
     EntryType,
     SDFFile,
     SDFHeader,
-    Values,
-)
-from sdf_toolkit.core.pathgraph import (
-    TimingGraph,
-    batch_endpoint_analysis,
-    compute_slack,
-    critical_path,
-    decompose_delay,
-    rank_paths,
-    verify_path,
 )
+from sdf_toolkit.io import jsonio
 from sdf_toolkit.io.sdfparse import emit as sdf_emit
-from sdf_toolkit.parser.parser import parse_sdf
+from sdf_toolkit.io.verilog import VerilogBackend
+from sdf_toolkit.parser.parser import parse_sdf_file
+
+if TYPE_CHECKING:
+    # The graph layer pulls in networkx; commands import it on first use.
+    from sdf_toolkit.core.pathgraph import TimingGraph
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
+try:
+    _PACKAGE_VERSION = importlib.metadata.version("sdf_toolkit")
+except importlib.metadata.PackageNotFoundError:
+    _PACKAGE_VERSION = "unknown"
+
+# Bump when the pickled model layout changes (e.g. Values/DelayPaths gained
+# __slots__), so development installs with an unchanged version string do
+# not unpickle old graphs into the new classes.
+_GRAPH_CACHE_FORMAT = 3
+
+PrettyOption = Annotated[
+    bool,
+    typer.Option("--pretty", help="Indent JSON output instead of printing it compact."),
+]
+
+NoCacheOption = Annotated[
+    bool,
+    typer.Option(
+        "--no-cache", help="Re-parse the SDF file instead of using the cache."
+    ),
+]
+
+SDFFileArgument = Annotated[Path, typer.Argument(help="Path to the SDF file.")]
+SourcePinArgument = Annotated[str, typer.Argument(help="Source pin name.")]
+SinkPinArgument = Annotated[str, typer.Argument(help="Sink pin name.")]
+FieldOption = Annotated[
+    str, typer.Option("--field", help="Delay field (nominal, fast, slow, ...).")
+]
+MetricOption = Annotated[str, typer.Option("--metric", help="Metric (min, avg, max).")]
+
 
 def _load_sdf(sdf_file: Path) -> SDFFile:
     """Parse an SDF file and return the SDFFile object.
 
+    The file is read through :func:`parse_sdf_file`, which decodes it
+    straight from a memory map instead of via ``Path.read_text``.
+
     Parameters
     ----------
     sdf_file : Path
@@ -53,24 +93,243 @@ def _load_sdf(sdf_file: Path) -> SDFFile:
     SDFFile
         The parsed SDF file.
     """
-    return parse_sdf(sdf_file.read_text())
+    return parse_sdf_file(sdf_file)
+
+
+def _graph_cache_path(sdf_file: Path) -> Path:
+    """Return the cache file for the parsed graph of *sdf_file*.
+
+    The key covers the resolved path of the SDF file, the installed
+    package version and the cache format, so upgrading the toolkit or
+    changing the pickled model layout never reuses a stale entry. The
+    file's modification time and size are stored inside the cache file
+    instead, so that editing a file overwrites its entry rather than
+    leaving the old one behind.
+
+    Parameters
+    ----------
+    sdf_file : Path
+        Resolved path to the SDF file.
+
+    Returns
+    -------
+    Path
+        Location of the pickle under the user cache directory.
+    """
+    raw_key = f"{_GRAPH_CACHE_FORMAT}:{_PACKAGE_VERSION}:{sdf_file}"
+    return _user_cache_file(raw_key, ".pkl")
+
+
+def _user_cache_file(raw_key: str, suffix: str) -> Path:
+    """Return the file for *raw_key* under the per-user cache directory.
+
+    Parameters
+    ----------
+    raw_key : str
+        Everything the cached value depends on.
+    suffix : str
+        File name suffix, e.g. ``".pkl"``.
+
+    Returns
+    -------
+    Path
+        ``$XDG_CACHE_HOME/sdf_toolkit/<hash><suffix>``.
+    """
+    key = hashlib.blake2b(raw_key.encode(), digest_size=8).hexdigest()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "sdf_toolkit" / f"{key}{suffix}"
+
+
+def _write_cache_file(cache_path: Path, dump: Callable[[BinaryIO], object]) -> None:
+    """Atomically write a cache file with *dump*, ignoring OS errors.
+
+    The temporary file is removed again if writing or renaming it fails.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Destination of the cache file.
+    dump : Callable[[BinaryIO], object]
+        Writes the cached value to the binary file it is given.
+    """
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(  # noqa: SIM115
+            dir=cache_path.parent, suffix=".tmp", delete=False
+        )
+    except OSError:
+        return
+    tmp_path = Path(tmp.name)
+    try:
+        with tmp:
+            dump(tmp)
+        tmp_path.replace(cache_path)
+    except (OSError, pickle.PicklingError):
+        pass
+    finally:
+        # Already gone after a successful replace().
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Return whether *st* is owned by this user and not writable by others.
+
+    Pickles can run arbitrary code when loaded, so a cache entry is only
+    trusted if nobody else could have planted it. Platforms without POSIX
+    ownership (Windows) are trusted as-is.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
 
 
-def _load_graph(sdf_file: Path) -> tuple[SDFFile, TimingGraph]:
+def _load_graph(
+    sdf_file: Path, *, use_cache: bool = True
+) -> tuple[SDFFile, "TimingGraph"]:
     """Parse an SDF file and return the SDFFile and its TimingGraph.
 
+    Parsing dominates the runtime of the graph commands, so the result is
+    memoized in-process and pickled to a per-user cache, and reused while
+    the file is unchanged. The returned objects may therefore be shared
+    between calls and must not be modified.
+
     Parameters
     ----------
     sdf_file : Path
         Path to the SDF file.
+    use_cache : bool
+        Use the in-process and on-disk caches.
+
+    Returns
+    -------
+    tuple[SDFFile, TimingGraph]
+        The parsed SDF file and its timing graph.
+    """
+    if not use_cache:
+        from sdf_toolkit.core.pathgraph import TimingGraph
+
+        sdf = _load_sdf(sdf_file)
+        return sdf, TimingGraph(sdf)
+
+    st = sdf_file.stat()
+    return _load_graph_cached(sdf_file.resolve(), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_graph_cached(
+    sdf_file: Path, mtime_ns: int, size: int
+) -> tuple[SDFFile, "TimingGraph"]:
+    """Load the graph for one version of *sdf_file* via the on-disk cache.
+
+    The modification time and size are part of the ``lru_cache`` key so
+    that an edited file misses the memo. On disk they are pickled ahead of
+    the graph, and an entry for another version of the file is rebuilt
+    without unpickling the graph. Cache failures are never fatal; the file
+    is simply parsed again. A cache file (or directory) owned by another
+    user or writable by group or others is ignored rather than unpickled.
+
+    Parameters
+    ----------
+    sdf_file : Path
+        Resolved path to the SDF file.
+    mtime_ns : int
+        Modification time of the file in nanoseconds.
+    size : int
+        Size of the file in bytes.
 
     Returns
     -------
     tuple[SDFFile, TimingGraph]
         The parsed SDF file and its timing graph.
     """
+    cache_path = _graph_cache_path(sdf_file)
+    stamp = (mtime_ns, size)
+    try:
+        with cache_path.open("rb") as f:
+            if (
+                _is_private(os.fstat(f.fileno()))
+                and _is_private(cache_path.parent.stat())
+                and pickle.load(f) == stamp
+            ):
+                return pickle.load(f)
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+        ValueError,
+    ):
+        # Missing, corrupt or written by an incompatible version; rebuild it.
+        pass
+
+    from sdf_toolkit.core.pathgraph import TimingGraph
+
     sdf = _load_sdf(sdf_file)
-    return sdf, TimingGraph(sdf)
+    graph = TimingGraph(sdf)
+
+    def dump(f: BinaryIO) -> None:
+        pickle.dump(stamp, f, protocol=5)
+        pickle.dump((sdf, graph), f, protocol=5)
+
+    _write_cache_file(cache_path, dump)
+    return sdf, graph
+
+
+def _annotate_cache_path(
+    sdf_file: Path,
+    verilog_file: Path,
+    field: str,
+    metric: str,
+    backend: str,
+    backend_version: str,
+) -> Path:
+    """Return the cache file for one ``annotate`` invocation.
+
+    Unlike the graph cache, the key hashes the contents of both input
+    files rather than their modification times: annotated libraries are
+    often regenerated by build tools that touch files without changing
+    them. Files pulled in with ```include`` are not part of the key.
+
+    Parameters
+    ----------
+    sdf_file : Path
+        Path to the SDF timing file.
+    verilog_file : Path
+        Path to the Verilog cell library file.
+    field : str
+        Delay field for worst-case selection.
+    metric : str
+        Metric for worst-case selection.
+    backend : str
+        Verilog front end.
+    backend_version : str
+        Version of the front end (the Yosys banner), so that upgrading
+        Yosys invalidates its cached output.
+
+    Returns
+    -------
+    Path
+        Location of the annotated Verilog under the user cache directory.
+    """
+    sdf_digest = hashlib.blake2b(sdf_file.read_bytes()).hexdigest()
+    verilog_digest = hashlib.blake2b(verilog_file.read_bytes()).hexdigest()
+    raw_key = (
+        f"annotate:{_PACKAGE_VERSION}:{sdf_digest}:{verilog_digest}"
+        f":{field}:{metric}:{backend}:{backend_version}"
+    )
+    return _user_cache_file(raw_key, ".v")
+
+
+# Above this many instances, ``info`` lists them as columns, not a table.
+_INFO_TABLE_MAX_INSTANCES = 200
+
+_ENTRY_TYPES: dict[str, EntryType] = {et.value: et for et in EntryType}
+
+# Entry keys that _entry_from_dict rebuilds instead of passing through.
+_ENTRY_DICT_CONVERTED = frozenset({"delay_paths", "type"})
 
 
 class OutputFormat(StrEnum):
@@ -80,6 +339,71 @@ class OutputFormat(StrEnum):
     sdf = "sdf"
 
 
+def _entry_type_from_str(value: str) -> EntryType:
+    """Convert a type string back to EntryType.
+
+    Known values are resolved with a plain dict lookup instead of going
+    through the enum constructor for every entry. Unknown values still
+    raise the enum's ``ValueError``.
+    """
+    entry_type = _ENTRY_TYPES.get(value)
+    return entry_type if entry_type is not None else EntryType(value)
+
+
+def _delay_paths_from_dict(
+    data: dict[str, dict[str, float | None] | None],
+) -> DelayPaths:
+    """Build a DelayPaths from its ``to_dict`` form.
+
+    Triples are converted by :func:`~sdf_toolkit.core.builder.values_from_input`,
+    so the CLI and the builder accept and reject the same keys.
+
+    Parameters
+    ----------
+    data : dict[str, dict[str, float | None] | None]
+        Mapping of delay field name to a ``{"min", "avg", "max"}`` dict.
+
+    Returns
+    -------
+    DelayPaths
+        The reconstructed DelayPaths object.
+
+    Raises
+    ------
+    TypeError
+        If a triple has keys other than ``min``, ``avg`` and ``max``.
+    """
+    return DelayPaths(
+        **{
+            name: None if triple is None else values_from_input(name, triple)
+            for name, triple in data.items()
+        }
+    )
+
+
+def _entry_from_dict(entry_dict: dict[str, object]) -> BaseEntry:
+    """Reconstruct a BaseEntry from a dictionary produced by ``BaseEntry.to_dict``.
+
+    Parameters
+    ----------
+    entry_dict : dict[str, object]
+        The dictionary representation of one entry.
+
+    Returns
+    -------
+    BaseEntry
+        The reconstructed entry.
+    """
+    # Convert delay_paths back to DelayPaths
+    dp_dict = entry_dict.get("delay_paths")
+    delay_paths = _delay_paths_from_dict(dp_dict) if dp_dict is not None else None
+    return BaseEntry(
+        **{k: v for k, v in entry_dict.items() if k not in _ENTRY_DICT_CONVERTED},
+        type=_entry_type_from_str(entry_dict.get("type", "iopath")),
+        delay_paths=delay_paths,
+    )
+
+
 def _sdffile_from_dict(data: dict[str, object]) -> SDFFile:
     """Reconstruct an SDFFile from a dictionary produced by ``SDFFile.to_dict``.
 
@@ -94,31 +418,16 @@ def _sdffile_from_dict(data: dict[str, object]) -> SDFFile:
         The reconstructed SDFFile object.
     """
     header = SDFHeader(**data.get("header", {}))  # type: ignore[arg-type]
-    cells: dict[str, dict[str, dict[str, BaseEntry]]] = {}
-    for cell_type, instances in data.get("cells", {}).items():  # type: ignore[union-attr]
-        cells[cell_type] = {}
-        for instance, entries in instances.items():
-            cells[cell_type][instance] = {}
-            for name, entry_dict in entries.items():
-                fields = dict(entry_dict)
-                # Convert delay_paths back to DelayPaths
-                dp_dict = fields.pop("delay_paths", None)
-                delay_paths = None
-                if dp_dict is not None:
-                    delay_paths = DelayPaths(
-                        **{
-                            k: Values(**v) if v is not None else None
-                            for k, v in dp_dict.items()
-                        }
-                    )
-                # Convert type string back to EntryType
-                entry_type = fields.pop("type", "iopath")
-                entry = BaseEntry(
-                    **fields,
-                    type=EntryType(entry_type),
-                    delay_paths=delay_paths,
-                )
-                cells[cell_type][instance][name] = entry
+    cells: dict[str, dict[str, dict[str, BaseEntry]]] = {
+        cell_type: {
+            instance: {
+                name: _entry_from_dict(entry_dict)
+                for name, entry_dict in entries.items()
+            }
+            for instance, entries in instances.items()
+        }
+        for cell_type, instances in data.get("cells", {}).items()  # type: ignore[union-attr]
+    }
     return SDFFile(header=header, cells=cells)
 
 
@@ -136,10 +445,8 @@ def _delay_paths_from_json(json_str: str) -> DelayPaths:
     DelayPaths
         The reconstructed DelayPaths object.
     """
-    data: dict[str, dict[str, float | None] | None] = json.loads(json_str)
-    return DelayPaths(
-        **{k: Values(**v) if v is not None else None for k, v in data.items()}
-    )
+    data: dict[str, dict[str, float | None] | None] = jsonio.loads(json_str)
+    return _delay_paths_from_dict(data)
 
 
 @app.command()
@@ -156,12 +463,13 @@ def parse(
         str,
         typer.Option("--timescale", "-t", help="Timescale for SDF output."),
     ] = "1ps",
+    pretty: PrettyOption = False,
 ) -> None:
     """Parse an SDF file and output as JSON or SDF."""
     sdf = _load_sdf(sdf_file)
 
     if fmt == OutputFormat.json:
-        typer.echo(json.dumps(sdf.to_dict(), indent=2))
+        jsonio.echo(sdf.to_dict(), pretty=pretty)
     else:
         typer.echo(sdf_emit(sdf, timescale=timescale))
 
@@ -178,7 +486,7 @@ def emit(
     ] = "1ps",
 ) -> None:
     """Convert a JSON file (produced by ``parse --format json``) back to SDF."""
-    data = json.loads(json_file.read_text())
+    data = jsonio.loads(json_file.read_bytes())
     sdf = _sdffile_from_dict(data)
     typer.echo(sdf_emit(sdf, timescale=timescale))
 
@@ -202,14 +510,19 @@ def info(
     console.print(header_table)
 
     # Cell summary
-    instance_names: list[str] = []
-    entry_type_counts: Counter[str] = Counter()
-
-    for cell_instances in sdf.cells.values():
-        for instance_name, entries in cell_instances.items():
-            instance_names.append(instance_name)
-            for entry in entries.values():
-                entry_type_counts[str(entry.type)] += 1
+    instance_names = [
+        instance_name
+        for cell_instances in sdf.cells.values()
+        for instance_name in cell_instances
+    ]
+    # Keyed by the EntryType itself; converted to text only for display.
+    # Counter consumes the flat generator in C instead of a += per entry.
+    entry_type_counts: Counter[EntryType] = Counter(
+        entry.type
+        for cell_instances in sdf.cells.values()
+        for entries in cell_instances.values()
+        for entry in entries.values()
+    )
 
     summary_table = Table(title="Cell Summary")
     summary_table.add_column("Metric", style="cyan")
@@ -222,10 +535,14 @@ def info(
     type_table.add_column("Type", style="cyan")
     type_table.add_column("Count", style="green")
     for entry_type, count in sorted(entry_type_counts.items()):
-        type_table.add_row(entry_type, str(count))
+        type_table.add_row(str(entry_type), str(count))
     console.print(type_table)
 
-    # Instance list
+    # Instance list. A one-column table costs an add_row per instance, so
+    # large designs are laid out as plain columns in one rendering pass.
+    if len(instance_names) > _INFO_TABLE_MAX_INSTANCES:
+        console.print(Columns(instance_names, title="Instances"), style="cyan")
+        return
     instance_table = Table(title="Instances")
     instance_table.add_column("Instance", style="cyan")
     for inst in instance_names:
@@ -235,57 +552,47 @@ def info(
 
 @app.command()
 def compose(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    source: Annotated[
-        str,
-        typer.Argument(help="Source pin name."),
-    ],
-    sink: Annotated[
-        str,
-        typer.Argument(help="Sink pin name."),
-    ],
+    sdf_file: SDFFileArgument,
+    source: SourcePinArgument,
+    sink: SinkPinArgument,
     verbose: Annotated[
         bool,
         typer.Option("--verbose", "-v", help="Show full path details."),
     ] = False,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", "-n", help="Maximum number of paths to show."),
+    ] = 0,
+    pretty: PrettyOption = False,
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Compose delays along all paths from source to sink."""
-    _sdf, graph = _load_graph(sdf_file)
+    _sdf, graph = _load_graph(sdf_file, use_cache=not no_cache)
 
-    if verbose:
-        paths = graph.find_paths(source, sink)
-        for i, path in enumerate(paths):
+    # Print each path as it is enumerated instead of collecting them all.
+    results = graph.iter_composed(source, sink)
+    if limit > 0:
+        results = itertools.islice(results, limit)
+    for i, (path, composed) in enumerate(results):
+        if verbose:
             typer.echo(f"Path {i + 1}:")
             for edge in path:
                 typer.echo(
                     f"  {edge.source} -> {edge.sink}"
                     f" ({edge.entry_type}, {edge.cell_type})"
                 )
-            composed = graph.compose_delay(path)
-            typer.echo(f"  Composed: {json.dumps(composed.to_dict(), indent=2)}")
-    else:
-        delays = graph.compose(source, sink)
-        for i, delay in enumerate(delays):
-            typer.echo(f"Path {i + 1}: {json.dumps(delay.to_dict(), indent=2)}")
+            typer.echo(f"  Composed: {jsonio.dumps(composed.to_dict(), pretty=pretty)}")
+        else:
+            typer.echo(
+                f"Path {i + 1}: {jsonio.dumps(composed.to_dict(), pretty=pretty)}"
+            )
 
 
 @app.command()
 def verify(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    source: Annotated[
-        str,
-        typer.Argument(help="Source pin name."),
-    ],
-    sink: Annotated[
-        str,
-        typer.Argument(help="Sink pin name."),
-    ],
+    sdf_file: SDFFileArgument,
+    source: SourcePinArgument,
+    sink: SinkPinArgument,
     expected: Annotated[
         str,
         typer.Option(
@@ -300,9 +607,13 @@ def verify(
         float,
         typer.Option("--tolerance", help="Absolute tolerance for comparison."),
     ] = 1e-9,
+    pretty: PrettyOption = False,
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Verify that composed path delay matches an expected value."""
-    _sdf, graph = _load_graph(sdf_file)
+    from sdf_toolkit.core.pathgraph import verify_path
+
+    _sdf, graph = _load_graph(sdf_file, use_cache=not no_cache)
 
     expected_delay = _delay_paths_from_json(expected)
     result = verify_path(graph, source, sink, expected_delay, tolerance=tolerance)
@@ -312,9 +623,11 @@ def verify(
     else:
         typer.echo("FAIL")
 
-    typer.echo(f"Expected: {json.dumps(expected_delay.to_dict(), indent=2)}")
+    typer.echo(f"Expected: {jsonio.dumps(expected_delay.to_dict(), pretty=pretty)}")
     for i, actual in enumerate(result.actual):
-        typer.echo(f"Actual path {i + 1}: {json.dumps(actual.to_dict(), indent=2)}")
+        typer.echo(
+            f"Actual path {i + 1}: {jsonio.dumps(actual.to_dict(), pretty=pretty)}"
+        )
 
     raise typer.Exit(code=0 if result.passed else 1)
 
@@ -341,39 +654,31 @@ def decompose(
             ),
         ),
     ],
+    pretty: PrettyOption = False,
 ) -> None:
     """Compute the unknown delay segment from total and known delays."""
+    from sdf_toolkit.core.pathgraph import decompose_delay
+
     total_delay = _delay_paths_from_json(total)
     known_delay = _delay_paths_from_json(known)
     result = decompose_delay(total_delay, known_delay)
-    typer.echo(json.dumps(result.to_dict(), indent=2))
+    jsonio.echo(result.to_dict(), pretty=pretty)
 
 
 @app.command(name="critical-path")
 def critical_path_cmd(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    source: Annotated[
-        str,
-        typer.Argument(help="Source pin name."),
-    ],
-    sink: Annotated[
-        str,
-        typer.Argument(help="Sink pin name."),
-    ],
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, …)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    sdf_file: SDFFileArgument,
+    source: SourcePinArgument,
+    sink: SinkPinArgument,
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
+    pretty: PrettyOption = False,
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Find the critical (slowest) path from source to sink."""
-    _sdf, graph = _load_graph(sdf_file)
+    from sdf_toolkit.core.pathgraph import critical_path
+
+    _sdf, graph = _load_graph(sdf_file, use_cache=not no_cache)
 
     cp = critical_path(graph, source, sink, field, metric)
     if cp is None:
@@ -384,31 +689,16 @@ def critical_path_cmd(
     for edge in cp.edges:
         scalar = edge.delay.get_scalar(field, metric)
         typer.echo(f"  {edge.source} -> {edge.sink}  {scalar}")
-    typer.echo(f"Delay: {json.dumps(cp.delay.to_dict(), indent=2)}")
+    typer.echo(f"Delay: {jsonio.dumps(cp.delay.to_dict(), pretty=pretty)}")
 
 
 @app.command(name="rank-paths")
 def rank_paths_cmd(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    source: Annotated[
-        str,
-        typer.Argument(help="Source pin name."),
-    ],
-    sink: Annotated[
-        str,
-        typer.Argument(help="Sink pin name."),
-    ],
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, …)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    sdf_file: SDFFileArgument,
+    source: SourcePinArgument,
+    sink: SinkPinArgument,
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
     descending: Annotated[
         bool,
         typer.Option("--descending/--ascending", help="Sort order."),
@@ -417,11 +707,18 @@ def rank_paths_cmd(
         int,
         typer.Option("--limit", "-n", help="Maximum number of paths to show."),
     ] = 0,
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Worker processes for scoring."),
+    ] = 1,
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Rank all paths from source to sink by scalar delay."""
-    _sdf, graph = _load_graph(sdf_file)
+    from sdf_toolkit.core.pathgraph import rank_paths
 
-    ranked = rank_paths(graph, source, sink, field, metric, descending)
+    _sdf, graph = _load_graph(sdf_file, use_cache=not no_cache)
+
+    ranked = rank_paths(graph, source, sink, field, metric, descending, n_jobs=jobs)
     if limit > 0:
         ranked = ranked[:limit]
 
@@ -436,33 +733,21 @@ def rank_paths_cmd(
 
 @app.command()
 def slack(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    source: Annotated[
-        str,
-        typer.Argument(help="Source pin name."),
-    ],
-    sink: Annotated[
-        str,
-        typer.Argument(help="Sink pin name."),
-    ],
+    sdf_file: SDFFileArgument,
+    source: SourcePinArgument,
+    sink: SinkPinArgument,
     period: Annotated[
         float,
         typer.Argument(help="Clock period or timing constraint."),
     ],
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, …)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Compute slack for the critical path: period - critical_delay."""
-    _sdf, graph = _load_graph(sdf_file)
+    from sdf_toolkit.core.pathgraph import compute_slack
+
+    _sdf, graph = _load_graph(sdf_file, use_cache=not no_cache)
 
     result = compute_slack(graph, source, sink, period, field, metric)
     if result is None:
@@ -476,10 +761,7 @@ def slack(
 
 @app.command()
 def dot(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
+    sdf_file: SDFFileArgument,
     output: Annotated[
         Path | None,
         typer.Option("--output", "-o", help="Output file (default: stdout)."),
@@ -496,17 +778,15 @@ def dot(
         bool,
         typer.Option("--cluster/--no-cluster", help="Cluster nodes by instance."),
     ] = False,
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, …)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Export the timing graph as DOT (Graphviz) format."""
-    _sdf, graph = _load_graph(sdf_file)
+    from sdf_toolkit.analysis.export import write_dot
+    from sdf_toolkit.core.pathgraph import critical_path
+
+    _sdf, graph = _load_graph(sdf_file, use_cache=not no_cache)
 
     highlight = None
     if highlight_source is not None and highlight_sink is not None:
@@ -514,19 +794,24 @@ def dot(
             graph, highlight_source, highlight_sink, field, metric
         )
 
-    dot_str = to_dot(
-        graph,
-        highlight_path=highlight,
-        cluster_by_instance=cluster,
-        field=field,
-        metric=metric,
-    )
+    # Stream straight to the file or stdout instead of building the string.
+    def emit_dot(out: TextIO) -> None:
+        write_dot(
+            graph,
+            out,
+            highlight_path=highlight,
+            cluster_by_instance=cluster,
+            field=field,
+            metric=metric,
+        )
 
     if output is not None:
-        output.write_text(dot_str)
+        with output.open("w") as f:
+            emit_dot(f)
         typer.echo(f"Written to {output}")
     else:
-        typer.echo(dot_str)
+        emit_dot(sys.stdout)
+        sys.stdout.write("\n")
 
 
 @app.command()
@@ -543,38 +828,72 @@ def annotate(
         Path | None,
         typer.Option("--output", "-o", help="Output file (default: stdout)."),
     ] = None,
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, ...)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
+    backend: Annotated[
+        VerilogBackend,
+        typer.Option(
+            "--backend",
+            help="Verilog front end (scan is built in and needs no Yosys).",
+        ),
+    ] = VerilogBackend.YOSYS,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help=(
+                "Re-run the annotation instead of using the cache. Use this"
+                " after editing files pulled in with `include, which the"
+                " cache does not track."
+            ),
+        ),
+    ] = False,
 ) -> None:
-    """Annotate a Verilog cell library with SDF timing specify blocks."""
-    from sdf_toolkit.io.annotate import annotate_verilog
-
-    result = annotate_verilog(
-        sdf_path=sdf_file,
-        verilog_path=verilog_file,
-        output_path=output,
-        field_name=field,
-        metric=metric,
-    )
+    """Annotate a Verilog cell library with SDF timing specify blocks.
+
+    The annotated text is cached per user, keyed on the contents of both
+    input files, the selection options and the Yosys version, so re-running
+    on unchanged inputs skips parsing and Yosys entirely.
+    """
+    from sdf_toolkit.io.annotate import annotate_verilog, yosys_version
+
+    backend_version: str | None = ""
+    if backend == VerilogBackend.YOSYS:
+        # Without Yosys there is nothing to key on; annotating reports it.
+        backend_version = yosys_version()
+
+    cache_path = None
+    result = None
+    if not no_cache and backend_version is not None:
+        cache_path = _annotate_cache_path(
+            sdf_file, verilog_file, field, metric, backend, backend_version
+        )
+        # A missing, unreadable or corrupt entry is annotated and rewritten.
+        with contextlib.suppress(OSError, UnicodeDecodeError):
+            result = cache_path.read_bytes().decode()
+
+    if result is None:
+        result = annotate_verilog(
+            sdf_path=sdf_file,
+            verilog_path=verilog_file,
+            field_name=field,
+            metric=metric,
+            backend=backend,
+        )
+        if cache_path is not None:
+            data = result.encode()
+            _write_cache_file(cache_path, lambda f: f.write(data))
 
     if output is None:
         typer.echo(result)
     else:
+        output.write_text(result)
         typer.echo(f"Written to {output}")
 
 
 @app.command()
 def normalize(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
+    sdf_file: SDFFileArgument,
     target: Annotated[
         str,
         typer.Option("--target", help="Target timescale (e.g. 1ns, 1ps)."),
@@ -583,6 +902,7 @@ def normalize(
         OutputFormat,
         typer.Option("--format", "-f", help="Output format."),
     ] = OutputFormat.json,
+    pretty: PrettyOption = False,
 ) -> None:
     """Normalize all delays in an SDF file to a target timescale."""
     from sdf_toolkit.transform.normalize import normalize_delays
@@ -591,27 +911,36 @@ def normalize(
     result = normalize_delays(sdf, target)
 
     if fmt == OutputFormat.json:
-        typer.echo(json.dumps(result.to_dict(), indent=2))
+        jsonio.echo(result.to_dict(), pretty=pretty)
     else:
         typer.echo(sdf_emit(result, timescale=target))
 
 
 @app.command()
 def lint(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
+    sdf_file: SDFFileArgument,
     severity: Annotated[
         str,
         typer.Option("--severity", help="Filter by severity: error, warning, or all."),
     ] = "all",
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help=(
+                "Worker threads for entry checks. Only faster on free-threaded"
+                " (no-GIL) Python builds."
+            ),
+        ),
+    ] = 1,
 ) -> None:
     """Validate an SDF file and report structural/semantic issues."""
     from sdf_toolkit.analysis.validate import validate
 
     sdf = _load_sdf(sdf_file)
-    issues = validate(sdf)
+    issues = validate(sdf, n_jobs=jobs)
 
     if severity != "all":
         issues = [i for i in issues if i.severity == severity]
@@ -641,18 +970,9 @@ def lint(
 
 @app.command()
 def stats(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, ...)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    sdf_file: SDFFileArgument,
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
 ) -> None:
     """Compute aggregate statistics over delay values."""
     from sdf_toolkit.analysis.stats import compute_stats
@@ -685,10 +1005,7 @@ def stats(
 
 @app.command(name="query")
 def query_cmd(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
+    sdf_file: SDFFileArgument,
     cell_type: Annotated[
         list[str] | None,
         typer.Option("--cell-type", help="Filter by cell type (repeatable)."),
@@ -713,18 +1030,13 @@ def query_cmd(
         float | None,
         typer.Option("--max-delay", help="Maximum delay threshold."),
     ] = None,
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, ...)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
     fmt: Annotated[
         OutputFormat,
         typer.Option("--format", "-f", help="Output format."),
     ] = OutputFormat.json,
+    pretty: PrettyOption = False,
 ) -> None:
     """Filter and query SDF file entries."""
     from sdf_toolkit.analysis.query import query
@@ -746,7 +1058,7 @@ def query_cmd(
     )
 
     if fmt == OutputFormat.json:
-        typer.echo(json.dumps(result.to_dict(), indent=2))
+        jsonio.echo(result.to_dict(), pretty=pretty)
     else:
         typer.echo(sdf_emit(result, timescale=result.header.timescale or "1ps"))
 
@@ -859,6 +1171,7 @@ def merge_cmd(
         OutputFormat,
         typer.Option("--format", "-f", help="Output format."),
     ] = OutputFormat.json,
+    pretty: PrettyOption = False,
 ) -> None:
     """Merge two or more SDF files into one."""
     from sdf_toolkit.transform.merge import ConflictStrategy, merge
@@ -871,32 +1184,26 @@ def merge_cmd(
     )
 
     if fmt == OutputFormat.json:
-        typer.echo(json.dumps(result.to_dict(), indent=2))
+        jsonio.echo(result.to_dict(), pretty=pretty)
     else:
         typer.echo(sdf_emit(result, timescale=result.header.timescale or "1ps"))
 
 
 @app.command(name="batch-analysis")
 def batch_analysis_cmd(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, ...)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    sdf_file: SDFFileArgument,
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
     limit: Annotated[
         int,
         typer.Option("--limit", "-n", help="Maximum number of results to show."),
     ] = 20,
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Analyze all startpoint-to-endpoint pairs in the timing graph."""
-    _sdf, graph = _load_graph(sdf_file)
+    from sdf_toolkit.core.pathgraph import batch_endpoint_analysis
+
+    _sdf, graph = _load_graph(sdf_file, use_cache=not no_cache)
 
     results = batch_endpoint_analysis(graph, field, metric)
     if limit > 0:
@@ -927,18 +1234,9 @@ def batch_analysis_cmd(
 
 @app.command()
 def report(
-    sdf_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the SDF file."),
-    ],
-    field: Annotated[
-        str,
-        typer.Option("--field", help="Delay field (nominal, fast, slow, ...)."),
-    ] = "slow",
-    metric: Annotated[
-        str,
-        typer.Option("--metric", help="Metric (min, avg, max)."),
-    ] = "max",
+    sdf_file: SDFFileArgument,
+    field: FieldOption = "slow",
+    metric: MetricOption = "max",
     top_n: Annotated[
         int,
         typer.Option("--top-n", help="Number of top critical paths to show."),
@@ -949,17 +1247,17 @@ def report(
     ] = None,
 ) -> None:
     """Generate a comprehensive timing report."""
-    from sdf_toolkit.analysis.report import generate_report
+    from sdf_toolkit.analysis.report import generate_report_to
 
     sdf = _load_sdf(sdf_file)
-    text = generate_report(
+    generate_report_to(
         sdf,
+        sys.stdout,
         field=field,
         metric=metric,
         top_n_paths=top_n,
         period=period,
     )
-    typer.echo(text)
 
 
 def main() -> None:
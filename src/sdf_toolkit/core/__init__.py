@@ -9,8 +9,10 @@ from sdf_toolkit.core.builder import (
     make_path_constraint,
     make_port,
     make_timing_check,
+    values_from_input,
 )
 from sdf_toolkit.core.model import (
+    DELAY_FIELDS,
     BaseEntry,
     CellsDict,
     DelayField,
@@ -42,6 +44,7 @@ from sdf_toolkit.core.utils import get_scale_fs, get_scale_seconds
 
 __all__ = [
     # model -- data classes and type aliases
+    "DELAY_FIELDS",
     "BaseEntry",
     "CellsDict",
     "DelayField",
@@ -77,6 +80,7 @@ __all__ = [
     "make_path_constraint",
     "make_port",
     "make_timing_check",
+    "values_from_input",
     # utils
     "get_scale_fs",
     "get_scale_seconds",
@@ -1,14 +1,17 @@
 """Programmatic builder for constructing SDFFile objects."""
 
+from collections.abc import Callable, Iterable
+from functools import partial
 from typing import TypeVar
 
 from sdf_toolkit.core.model import (
+    DELAY_FIELDS,
     BaseEntry,
     CellsDict,
-    DelayField,
     DelayPaths,
     Device,
     EdgeType,
+    EntryType,
     Hold,
     Interconnect,
     Iopath,
@@ -28,16 +31,67 @@ from sdf_toolkit.core.model import (
 _TC = TypeVar("_TC", bound=TimingCheck)
 _BE = TypeVar("_BE", bound=BaseEntry)
 
-# Delays can be passed as a pre-built DelayPaths or as a nested dict.
-DelaysInput = DelayPaths | dict[str, dict[str, float | None]]
+# One field's triple: a {"min", "avg", "max"} dict, a Values, or a positional
+# (min, avg, max) tuple, which avoids allocating an inner dict per field.
+TripleInput = (
+    dict[str, float | None] | Values | tuple[float | None, float | None, float | None]
+)
+
+# Delays can be passed as a pre-built DelayPaths or as a dict of triples.
+DelaysInput = DelayPaths | dict[str, TripleInput]
+
+
+# Plain-str names, so error messages show "slow" rather than the enum repr.
+_DELAY_FIELD_SET = frozenset(field.value for field in DELAY_FIELDS)
+_VALUES_KEYS = frozenset({"min", "avg", "max"})
+
+
+def values_from_input(name: str, triple: TripleInput) -> Values:
+    """Build a Values from any accepted triple form.
+
+    Parameters
+    ----------
+    name : str
+        Delay field the triple belongs to, used in the error message.
+    triple : TripleInput
+        A ``{"min", "avg", "max"}`` dict (keys optional), a Values, or a
+        positional ``(min, avg, max)`` tuple.
+
+    Returns
+    -------
+    Values
+        The triple; a Values input is returned as-is.
+
+    Raises
+    ------
+    TypeError
+        If a dict triple has keys other than ``min``, ``avg`` and ``max``.
+
+    Examples
+    --------
+    >>> values_from_input("slow", {"min": 1.0, "max": 2.0})
+    Values(min=1.0, avg=None, max=2.0)
+    """
+    if isinstance(triple, Values):
+        return triple
+    if not isinstance(triple, dict):
+        return Values(*triple)
+    if not triple.keys() <= _VALUES_KEYS:
+        unexpected = ", ".join(sorted(triple.keys() - _VALUES_KEYS))
+        msg = f"Unexpected keys in {name!r} delay values: {unexpected}"
+        raise TypeError(msg)
+    return Values(triple.get("min"), triple.get("avg"), triple.get("max"))
 
 
 def _resolve_delays(delays: DelaysInput) -> DelayPaths:
-    """Accept DelayPaths passthrough or convert from nested dict."""
+    """Accept DelayPaths passthrough or convert from a dict of triples."""
     if isinstance(delays, DelayPaths):
         return delays
     return DelayPaths(
-        **{name: Values(**delays[name]) for name in DelayField if name in delays}
+        **{
+            name: values_from_input(name, delays[name])
+            for name in delays.keys() & _DELAY_FIELD_SET
+        }
     )
 
 
@@ -178,6 +232,42 @@ def make_path_constraint(
     )
 
 
+def _make_single_pin_record(
+    make: Callable[[str, DelaysInput], BaseEntry],
+) -> Callable[[str, str | None, DelaysInput], BaseEntry]:
+    """Adapt a single-pin factory to the (from_pin, to_pin, delays) form."""
+
+    def factory(pin: str, _to_pin: str | None, delays: DelaysInput) -> BaseEntry:
+        return make(pin, delays)
+
+    return factory
+
+
+# Entry factories keyed by entry type, used by SDFBuilder.add_entries.
+# Single-pin kinds (port, device, width) take their pin from ``from_pin``.
+_RECORD_FACTORIES: dict[
+    EntryType, Callable[[str, str | None, DelaysInput], BaseEntry]
+] = {
+    EntryType.IOPATH: make_iopath,
+    EntryType.INTERCONNECT: make_interconnect,
+    EntryType.PATHCONSTRAINT: make_path_constraint,
+    EntryType.PORT: _make_single_pin_record(make_port),
+    EntryType.DEVICE: _make_single_pin_record(make_device),
+    EntryType.WIDTH: _make_single_pin_record(
+        lambda pin, delays: make_timing_check(Width, pin, pin, delays)
+    ),
+    EntryType.SETUP: partial(make_timing_check, Setup),
+    EntryType.HOLD: partial(make_timing_check, Hold),
+    EntryType.REMOVAL: partial(make_timing_check, Removal),
+    EntryType.RECOVERY: partial(make_timing_check, Recovery),
+    EntryType.SETUPHOLD: partial(make_timing_check, SetupHold),
+}
+
+# One flat SDFBuilder.add_entries record: cell type, instance, entry type,
+# from pin, to pin and delays.
+EntryRecord = tuple[str, str, EntryType | str, str, str | None, DelaysInput]
+
+
 class SDFBuilder:
     """Fluent builder for constructing SDFFile objects from scratch.
 
@@ -197,6 +287,8 @@ class SDFBuilder:
     True
     """
 
+    __slots__ = ("_cells", "_header_kwargs")
+
     def __init__(self) -> None:
         self._header_kwargs: dict[str, str] = {}
         self._cells: CellsDict = {}
@@ -237,6 +329,58 @@ class SDFBuilder:
         entries: dict[str, BaseEntry] = cell_instances.setdefault(instance, {})
         return CellBuilder(self, entries)
 
+    def add_entries(self, records: Iterable[EntryRecord]) -> "SDFBuilder":
+        """Add many entries at once from flat records.
+
+        Equivalent to calling ``add_cell(...).add_<kind>(...)`` per record,
+        but without creating a CellBuilder or going through the fluent
+        method chain for every entry. Name collisions are resolved the same
+        way as in :meth:`CellBuilder.add_entry`.
+
+        Parameters
+        ----------
+        records : Iterable[EntryRecord]
+            ``(cell_type, instance, entry_type, from_pin, to_pin, delays)``
+            tuples. ``entry_type`` is an EntryType or its string value;
+            single-pin kinds (port, device, width) use ``from_pin`` and
+            ignore ``to_pin``.
+
+        Returns
+        -------
+        SDFBuilder
+            This builder instance for method chaining.
+
+        Raises
+        ------
+        ValueError
+            If a record has an unknown entry type.
+
+        Examples
+        --------
+        >>> sdf = (
+        ...     SDFBuilder()
+        ...     .add_entries([
+        ...         ("BUF", "b0", "iopath", "A", "Y", {"slow": (1.0, 2.0, 3.0)}),
+        ...         ("BUF", "b0", "port", "A", None, {"slow": (0.1, 0.1, 0.1)}),
+        ...     ])
+        ...     .build()
+        ... )
+        >>> sorted(sdf.cells["BUF"]["b0"])
+        ['iopath_A_Y', 'port_A']
+        """
+        cell_builders: dict[tuple[str, str], CellBuilder] = {}
+        for cell_type, instance, entry_type, from_pin, to_pin, delays in records:
+            factory = _RECORD_FACTORIES.get(entry_type)  # type: ignore[arg-type]
+            if factory is None:
+                msg = f"Unknown entry type {entry_type!r}"
+                raise ValueError(msg)
+            cell_builder = cell_builders.get((cell_type, instance))
+            if cell_builder is None:
+                cell_builder = self.add_cell(cell_type, instance)
+                cell_builders[cell_type, instance] = cell_builder
+            cell_builder.add_entry(factory(from_pin, to_pin, delays))
+        return self
+
     def build(self) -> SDFFile:
         """Build and return the completed SDFFile.
 
@@ -258,6 +402,8 @@ class CellBuilder:
     Use ``add_cell()`` or ``build()`` to move on after adding entries.
     """
 
+    __slots__ = ("_entries", "_name_counts", "_parent")
+
     def __init__(
         self,
         parent: SDFBuilder,
@@ -265,6 +411,10 @@ class CellBuilder:
     ) -> None:
         self._parent = parent
         self._entries = entries
+        # Next collision suffix to try per base name, so repeated names
+        # do not re-probe _1, _2, ... from the start each time. Created on
+        # the first collision, since most cells never have one.
+        self._name_counts: dict[str, int] | None = None
 
     def add_entry(self, entry: BaseEntry) -> "CellBuilder":
         """Store a pre-built entry and return self for chaining.
@@ -281,15 +431,23 @@ class CellBuilder:
         CellBuilder
             This builder instance for method chaining.
         """
+        entries = self._entries
         base_name = entry.name
-        key = base_name
-        if key in self._entries:
-            counter = 1
-            while f"{base_name}_{counter}" in self._entries:
-                counter += 1
-            key = f"{base_name}_{counter}"
-            entry.name = key
-        self._entries[key] = entry
+        # Common case: the name is free and a single hash probe stores it.
+        if entries.setdefault(base_name, entry) is entry:
+            return self
+        # The entries dict may be shared with another CellBuilder for the
+        # same cell, so keep probing from the remembered suffix.
+        name_counts = self._name_counts
+        if name_counts is None:
+            name_counts = self._name_counts = {}
+        counter = name_counts.get(base_name, 1)
+        while f"{base_name}_{counter}" in entries:
+            counter += 1
+        name_counts[base_name] = counter + 1
+        key = f"{base_name}_{counter}"
+        entry.name = key
+        entries[key] = entry
         return self
 
     def add_cell(self, cell_type: str, instance: str) -> "CellBuilder":
@@ -335,7 +493,9 @@ class CellBuilder:
         to_pin : str
             The output pin name.
         delays : DelaysInput
-            Delay values as DelayPaths or a dict keyed by field name.
+            Delay values as DelayPaths or a dict keyed by field name whose
+            values are ``{"min", "avg", "max"}`` dicts, Values, or
+            ``(min, avg, max)`` tuples.
         from_pin_edge : EdgeType | None
             Optional edge type for the input pin.
         to_pin_edge : EdgeType | None
@@ -360,6 +520,17 @@ class CellBuilder:
         >>> entry = sdf.cells["INV"]["i0"]["iopath_A_Y"]
         >>> entry.delay_paths.nominal.max
         1.5
+
+        Triples may also be given positionally as ``(min, avg, max)``:
+
+        >>> sdf = (
+        ...     SDFBuilder()
+        ...     .add_cell("INV", "i0")
+        ...         .add_iopath("A", "Y", {"slow": (0.5, None, 1.5)})
+        ...     .build()
+        ... )
+        >>> sdf.cells["INV"]["i0"]["iopath_A_Y"].delay_paths.slow
+        Values(min=0.5, avg=None, max=1.5)
         """
         return self.add_entry(
             make_iopath(
@@ -131,9 +131,13 @@ class SDFHeader:
         return self.to_dict().items()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Values:
-    """Min/avg/max timing value triple."""
+    """Min/avg/max timing value triple.
+
+    Frozen, because the parser shares one instance between every entry
+    with the same triple.
+    """
 
     min: float | None = None
     avg: float | None = None
@@ -300,7 +304,7 @@ class Values:
         return hash((self.min, self.avg, self.max))
 
 
-@dataclass
+@dataclass(slots=True)
 class DelayPaths:
     """Collection of delay paths (nominal, fast, slow, etc.)."""
 
@@ -347,6 +351,58 @@ class DelayPaths:
             return None
         return getattr(values, metric)
 
+    @staticmethod
+    def scalar_getter(
+        field: DelayFieldLike = DelayField.SLOW,
+        metric: DelayMetricLike = DelayMetric.MAX,
+    ) -> Callable[["DelayPaths"], float | None]:
+        """Return a function extracting one scalar from any DelayPaths.
+
+        Equivalent to ``lambda dp: dp.get_scalar(field, metric)``, but
+        *field* and *metric* are validated once here rather than on every
+        call, and the lookups use C-level attribute getters. Intended for
+        loops that extract the same scalar from many entries.
+
+        Parameters
+        ----------
+        field : str
+            One of the ``DelayField`` values (nominal, fast, slow, …).
+        metric : str
+            One of the ``DelayMetric`` values (min, avg, max).
+
+        Returns
+        -------
+        Callable[[DelayPaths], float | None]
+            Function returning the scalar, or None if the field is None.
+
+        Raises
+        ------
+        ValueError
+            If *field* or *metric* is not a valid name.
+
+        Examples
+        --------
+        >>> get = DelayPaths.scalar_getter("slow", "max")
+        >>> get(DelayPaths(slow=Values(min=1.0, avg=2.0, max=3.0)))
+        3.0
+        >>> get(DelayPaths()) is None
+        True
+        """
+        if field not in DelayField.__members__.values():
+            msg = f"Invalid field {field!r}, expected one of {tuple(DelayField)}"
+            raise ValueError(msg)
+        if metric not in DelayMetric.__members__.values():
+            msg = f"Invalid metric {metric!r}, expected one of {tuple(DelayMetric)}"
+            raise ValueError(msg)
+        get_field = operator.attrgetter(field)
+        get_metric = operator.attrgetter(metric)
+
+        def getter(delay_paths: "DelayPaths") -> float | None:
+            values = get_field(delay_paths)
+            return None if values is None else get_metric(values)
+
+        return getter
+
     def to_dict(self) -> dict[str, dict[str, float | None]]:
         """Return non-None delay paths as a dictionary."""
         return {
@@ -446,6 +502,10 @@ class DelayPaths:
         return True
 
 
+# DelayPaths fields in declaration order, so DelayPaths(*values) lines up.
+DELAY_FIELDS: tuple[DelayField, ...] = tuple(DelayField)
+
+
 @dataclass
 class BaseEntry:
     """Base class for all SDF timing entries."""
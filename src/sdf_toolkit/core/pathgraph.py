@@ -7,11 +7,16 @@ for path finding, delay composition, and verification.
 import functools
 import itertools
 import operator
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import networkx as nx
 
-from sdf_toolkit.core.model import DelayField, DelayFieldLike, DelayMetric, DelayMetricLike, DelayPaths, EntryType, SDFFile
+from sdf_toolkit.core.model import BaseEntry, DelayField, DelayFieldLike, DelayMetric, DelayMetricLike, DelayPaths, EntryType, SDFFile
+
+# Below this many paths a process pool costs more than it saves.
+_PARALLEL_MIN_PATHS = 1024
 
 
 @dataclass(frozen=True)
@@ -132,6 +137,11 @@ def _edge_from_attrs(
     TimingEdge
         The constructed timing edge.
     """
+    # Edges added through TimingGraph carry their TimingEdge, built once,
+    # so path finding and DOT export share the same objects.
+    edge = attrs.get("timing_edge")
+    if edge is not None:
+        return edge  # type: ignore[return-value]
     return TimingEdge(
         source=source,
         sink=sink,
@@ -150,13 +160,15 @@ class TimingGraph:
 
     Parameters
     ----------
-    sdf : SDFFile
-        The parsed SDF file to build the graph from.
+    sdf : SDFFile | None
+        The parsed SDF file to build the graph from. If omitted the graph
+        starts empty and is filled with :meth:`add_entry`.
     """
 
-    def __init__(self, sdf: SDFFile) -> None:
+    def __init__(self, sdf: SDFFile | None = None) -> None:
         self._graph: nx.MultiDiGraph = nx.MultiDiGraph()
-        self._build(sdf)
+        if sdf is not None:
+            self._build(sdf)
 
     def _build(self, sdf: SDFFile) -> None:
         """Populate the graph from SDF cells.
@@ -175,36 +187,82 @@ class TimingGraph:
 
         for cell_type, instances in sdf.cells.items():
             for instance, entries in instances.items():
-                for _entry_name, entry in entries.items():
-                    if entry.type not in (EntryType.IOPATH, EntryType.INTERCONNECT):
-                        continue
-
-                    if entry.from_pin is None or entry.to_pin is None:
-                        continue
-
-                    if entry.delay_paths is None:
-                        continue
-
-                    if entry.type == EntryType.INTERCONNECT:
-                        source = entry.from_pin
-                        sink = entry.to_pin
-                    else:
-                        source = _qualify_pin(instance, entry.from_pin, divider)
-                        sink = _qualify_pin(instance, entry.to_pin, divider)
-
-                    self._graph.add_edge(
-                        source,
-                        sink,
-                        delay=entry.delay_paths,
-                        entry_type=entry.type,
-                        cell_type=cell_type,
-                        instance=instance,
-                    )
+                for entry in entries.values():
+                    self.add_entry(entry, cell_type, instance, divider)
+
+    def add_entry(
+        self, entry: BaseEntry, cell_type: str, instance: str, divider: str = "/"
+    ) -> None:
+        """Add the edge for a single entry, if it describes one.
+
+        Only IOPATH and INTERCONNECT entries with both pins and delay
+        paths produce an edge; everything else is ignored. This lets a
+        caller that already walks the SDF cells build the graph in the
+        same pass.
+
+        Parameters
+        ----------
+        entry : BaseEntry
+            The timing entry.
+        cell_type : str
+            Cell type the entry belongs to.
+        instance : str
+            Instance the entry belongs to.
+        divider : str
+            Hierarchy divider used to qualify IOPATH pins.
+
+        Examples
+        --------
+        >>> from sdf_toolkit.core.builder import make_iopath
+        >>> graph = TimingGraph()
+        >>> graph.add_entry(
+        ...     make_iopath("A", "Y", {"slow": {"max": 1.0}}), "BUF", "b0"
+        ... )
+        >>> sorted(graph.nodes())
+        ['b0/A', 'b0/Y']
+        """
+        if entry.type not in (EntryType.IOPATH, EntryType.INTERCONNECT):
+            return
+
+        if entry.from_pin is None or entry.to_pin is None:
+            return
+
+        if entry.delay_paths is None:
+            return
+
+        if entry.type == EntryType.INTERCONNECT:
+            source = entry.from_pin
+            sink = entry.to_pin
+        else:
+            source = _qualify_pin(instance, entry.from_pin, divider)
+            sink = _qualify_pin(instance, entry.to_pin, divider)
+
+        edge = TimingEdge(
+            source=source,
+            sink=sink,
+            delay=entry.delay_paths,
+            entry_type=entry.type,
+            cell_type=cell_type,
+            instance=instance,
+        )
+        self._graph.add_edge(
+            source,
+            sink,
+            delay=entry.delay_paths,
+            entry_type=entry.type,
+            cell_type=cell_type,
+            instance=instance,
+            timing_edge=edge,
+        )
 
     @property
     def graph(self) -> nx.MultiDiGraph:
         """Expose the underlying NetworkX MultiDiGraph for advanced analysis.
 
+        Each edge carries ``delay``, ``entry_type``, ``cell_type`` and
+        ``instance`` attributes, plus ``timing_edge``, the
+        :class:`TimingEdge` returned for it by this class.
+
         Returns
         -------
         nx.MultiDiGraph
@@ -318,15 +376,51 @@ class TimingGraph:
         list[list[TimingEdge]]
             All simple paths as lists of TimingEdge objects.
         """
+        return list(self.iter_paths(source, sink, max_depth))
+
+    def iter_paths(
+        self,
+        source: str,
+        sink: str,
+        max_depth: int = 50,
+    ) -> Iterator[list[TimingEdge]]:
+        """Lazily yield the simple paths between source and sink.
+
+        Yields the same paths in the same order as :meth:`find_paths`,
+        but one at a time, so callers can print or stop early without
+        holding every path in memory.
+
+        Parameters
+        ----------
+        source : str
+            The source node name.
+        sink : str
+            The sink node name.
+        max_depth : int, optional
+            Maximum path length (number of edges), by default 50.
+
+        Returns
+        -------
+        Iterator[list[TimingEdge]]
+            Simple paths as lists of TimingEdge objects.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If source or sink is not in the graph. Raised immediately,
+            not on first iteration.
+        """
         if source not in self._graph:
             raise nx.NodeNotFound(f"Source node {source!r} not in graph")
         if sink not in self._graph:
             raise nx.NodeNotFound(f"Sink node {sink!r} not in graph")
         if source == sink:
-            return []
-
-        edge_paths: list[list[TimingEdge]] = []
+            return iter(())
+        return self._iter_paths(source, sink, max_depth)
 
+    def _iter_paths(
+        self, source: str, sink: str, max_depth: int
+    ) -> Iterator[list[TimingEdge]]:
         # nx.all_simple_paths on MultiDiGraph may yield duplicate node
         # sequences (one per parallel-edge combination).  Deduplicate
         # so the product expansion below counts each edge combo once.
@@ -348,9 +442,7 @@ class TimingGraph:
                 hop_options.append(hop_edges)
 
             for combination in itertools.product(*hop_options):
-                edge_paths.append(list(combination))
-
-        return edge_paths
+                yield list(combination)
 
     def compose_delay(self, path: list[TimingEdge]) -> DelayPaths:
         """Sum the delays along a path of timing edges.
@@ -390,8 +482,36 @@ class TimingGraph:
         list[DelayPaths]
             Composed delays for each path found between source and sink.
         """
-        paths = self.find_paths(source, sink)
-        return [self.compose_delay(p) for p in paths]
+        return [delay for _edges, delay in self.iter_composed(source, sink)]
+
+    def iter_composed(
+        self,
+        source: str,
+        sink: str,
+        max_depth: int = 50,
+    ) -> Iterator[tuple[list[TimingEdge], DelayPaths]]:
+        """Lazily yield each path together with its composed delay.
+
+        Consecutive paths from :meth:`iter_paths` usually share a prefix,
+        so the running sums of the previous path are kept and only the
+        edges after the shared prefix are added. Each result equals
+        ``compose_delay(path)``.
+
+        Parameters
+        ----------
+        source : str
+            The source node name.
+        sink : str
+            The sink node name.
+        max_depth : int, optional
+            Maximum path length (number of edges), by default 50.
+
+        Returns
+        -------
+        Iterator[tuple[list[TimingEdge], DelayPaths]]
+            ``(path, composed_delay)`` pairs in :meth:`iter_paths` order.
+        """
+        return _compose_prefix_sums(self.iter_paths(source, sink, max_depth))
 
 
 def verify_path(
@@ -433,6 +553,68 @@ def verify_path(
     )
 
 
+def _compose_prefix_sums(
+    paths: Iterator[list[TimingEdge]],
+) -> Iterator[tuple[list[TimingEdge], DelayPaths]]:
+    """Yield each path with its composed delay, reusing shared prefixes."""
+    prev: list[TimingEdge] = []
+    # sums[i] is the composed delay of prev[: i + 1].
+    sums: list[DelayPaths] = []
+    for edges in paths:
+        shared = 0
+        limit = min(len(prev), len(edges))
+        while shared < limit and edges[shared] is prev[shared]:
+            shared += 1
+        del sums[shared:]
+        for edge in edges[shared:]:
+            sums.append(sums[-1] + edge.delay if sums else edge.delay)
+        prev = edges
+        yield edges, sums[-1]
+
+
+def _path_scalar(
+    edges: list[TimingEdge],
+    get_scalar: Callable[[DelayPaths], float | None],
+    edge_scalars: dict[int, tuple[TimingEdge, float | None]],
+) -> float | None:
+    """Return the scalar of a path's composed delay without composing it.
+
+    Delay composition adds field-wise and propagates None, so the scalar
+    of the composed delay equals the left-to-right float sum of the edge
+    scalars, or None if any edge lacks one. Edge scalars are memoized in
+    *edge_scalars*, keyed by ``id`` and holding the edge so the id stays
+    valid while the cache lives.
+    """
+    total: float | None = None
+    for edge in edges:
+        hit = edge_scalars.get(id(edge))
+        if hit is None:
+            hit = edge_scalars[id(edge)] = (edge, get_scalar(edge.delay))
+        scalar = hit[1]
+        if scalar is None:
+            return None
+        total = scalar if total is None else total + scalar
+    return total
+
+
+def _score_paths(
+    edge_paths: list[list[TimingEdge]],
+    field: DelayFieldLike,
+    metric: DelayMetricLike,
+) -> list[tuple[DelayPaths, float | None]]:
+    """Compose each path's delay and extract its scalar.
+
+    Module-level so that :func:`rank_paths` can ship it to worker
+    processes.
+    """
+    get_scalar = DelayPaths.scalar_getter(field, metric)
+    scored: list[tuple[DelayPaths, float | None]] = []
+    for edges in edge_paths:
+        delay = functools.reduce(operator.add, (edge.delay for edge in edges))
+        scored.append((delay, get_scalar(delay)))
+    return scored
+
+
 def rank_paths(
     graph: TimingGraph,
     source: str,
@@ -440,6 +622,7 @@ def rank_paths(
     field: DelayFieldLike = DelayField.SLOW,
     metric: DelayMetricLike = DelayMetric.MAX,
     descending: bool = True,
+    n_jobs: int = 1,
 ) -> list[RankedPath]:
     """Find all paths between source and sink, sorted by scalar delay.
 
@@ -457,6 +640,11 @@ def rank_paths(
         Metric to extract (min, avg, max).
     descending : bool
         If True, sort largest scalar first. Paths with None scalar go last.
+    n_jobs : int
+        Number of worker processes for composing path delays. With
+        ``n_jobs > 1`` and enough paths to amortise the pool, the paths
+        are scored in chunks across processes. Results are identical to
+        the sequential run.
 
     Returns
     -------
@@ -464,11 +652,29 @@ def rank_paths(
         Ranked list of paths.
     """
     edge_paths = graph.find_paths(source, sink)
-    ranked: list[RankedPath] = []
-    for edges in edge_paths:
-        delay = graph.compose_delay(edges)
-        scalar = delay.get_scalar(field, metric)
-        ranked.append(RankedPath(edges=edges, delay=delay, scalar=scalar))
+    if n_jobs > 1 and len(edge_paths) >= _PARALLEL_MIN_PATHS:
+        # A few chunks per worker balances uneven path lengths.
+        size = -(-len(edge_paths) // (n_jobs * 4))
+        chunks = [edge_paths[i : i + size] for i in range(0, len(edge_paths), size)]
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            # map() yields in submission order, so scores line up with paths.
+            scored = list(
+                itertools.chain.from_iterable(
+                    executor.map(
+                        _score_paths,
+                        chunks,
+                        itertools.repeat(field),
+                        itertools.repeat(metric),
+                    )
+                )
+            )
+    else:
+        scored = _score_paths(edge_paths, field, metric)
+
+    ranked = [
+        RankedPath(edges=edges, delay=delay, scalar=scalar)
+        for edges, (delay, scalar) in zip(edge_paths, scored, strict=True)
+    ]
 
     def _sort_key(rp: RankedPath) -> tuple[int, float]:
         if rp.scalar is None:
@@ -530,8 +736,26 @@ def critical_path(
     >>> cp.scalar
     4.5
     """
-    ranked = rank_paths(graph, source, sink, field, metric, descending=True)
-    return ranked[0] if ranked else None
+    # Rank on per-edge scalars summed as plain floats and compose the full
+    # DelayPaths only for the winner. This matches rank_paths()[0]: the
+    # first path with the largest scalar, or the first path if none has one.
+    get_scalar = DelayPaths.scalar_getter(field, metric)
+    edge_scalars: dict[int, tuple[TimingEdge, float | None]] = {}
+    first: list[TimingEdge] | None = None
+    best: list[TimingEdge] | None = None
+    best_scalar: float | None = None
+    for edges in graph.iter_paths(source, sink):
+        if first is None:
+            first = edges
+        scalar = _path_scalar(edges, get_scalar, edge_scalars)
+        if scalar is not None and (best_scalar is None or scalar > best_scalar):
+            best, best_scalar = edges, scalar
+
+    if first is None:
+        return None
+    if best is None:
+        best = first
+    return RankedPath(edges=best, delay=graph.compose_delay(best), scalar=best_scalar)
 
 
 def compute_slack(
@@ -671,28 +895,31 @@ def batch_endpoint_analysis(
     if sinks is None:
         sinks = sorted(graph.endpoints())
 
+    get_scalar = DelayPaths.scalar_getter(field, metric)
+    # Shared across all pairs: each edge's scalar is extracted once.
+    edge_scalars: dict[int, tuple[TimingEdge, float | None]] = {}
+
     results: list[EndpointResult] = []
     for src in sources:
         for snk in sinks:
-            paths = graph.find_paths(src, snk)
-            if not paths:
+            path_count = 0
+            critical_delay: float | None = None
+            for edges in graph.iter_paths(src, snk):
+                path_count += 1
+                scalar = _path_scalar(edges, get_scalar, edge_scalars)
+                if scalar is not None and (
+                    critical_delay is None or scalar > critical_delay
+                ):
+                    critical_delay = scalar
+            if not path_count:
                 continue
 
-            # Compute critical delay directly from found paths to avoid
-            # a redundant second find_paths call via critical_path().
-            scalars = [
-                s
-                for p in paths
-                if (s := graph.compose_delay(p).get_scalar(field, metric)) is not None
-            ]
-            critical_delay = max(scalars) if scalars else None
-
             results.append(
                 EndpointResult(
                     source=src,
                     sink=snk,
                     critical_delay=critical_delay,
-                    path_count=len(paths),
+                    path_count=path_count,
                 )
             )
 
@@ -18,9 +18,34 @@
 
 """Utility functions for SDF timescale conversion."""
 
+import functools
 import re
 
-
+_TIMESCALE_RE = re.compile(r"(10{0,2})(\.0)? *([munpf]?s)")
+
+# Femtoseconds per unit, kept as ints so no float->int conversion is needed.
+_SC_LUT = {
+    "s": 10**15,
+    "ms": 10**12,
+    "us": 10**9,
+    "ns": 10**6,
+    "ps": 10**3,
+    "fs": 1,
+}
+
+# Every spelling the SDF writers in this package (and most tools) produce,
+# e.g. "1ps", "10 ns", "100.0 us", mapped straight to femtoseconds.  Anything
+# else falls back to the regex so prefix matches keep working.
+_SCALE_TABLE = {
+    f"{base}{frac}{sep}{unit}": int(base) * fs
+    for base in ("1", "10", "100")
+    for frac in ("", ".0")
+    for sep in ("", " ")
+    for unit, fs in _SC_LUT.items()
+}
+
+
+@functools.lru_cache(maxsize=64)
 def get_scale_fs(timescale: str) -> int:
     """Convert sdf timescale to scale factor to femtoseconds as int.
 
@@ -42,6 +67,9 @@ def get_scale_fs(timescale: str) -> int:
     >>> get_scale_fs('100 s')
     100000000000000000
 
+    >>> get_scale_fs('1  ps')
+    1000
+
     >>> try:
     ...     get_scale_fs('2s')
     ... except ValueError as e:
@@ -49,23 +77,20 @@ def get_scale_fs(timescale: str) -> int:
     Invalid SDF timescale 2s
 
     """
-    mm = re.match(r"(10{0,2})(\.0)? *([munpf]?s)", timescale)
-    sc_lut = {
-        "s": 1e15,
-        "ms": 1e12,
-        "us": 1e9,
-        "ns": 1e6,
-        "ps": 1e3,
-        "fs": 1,
-    }
+    scale = _SCALE_TABLE.get(timescale)
+    if scale is not None:
+        return scale
+
+    mm = _TIMESCALE_RE.match(timescale)
     if mm is None:
         msg = f"Invalid SDF timescale {timescale}"
         raise ValueError(msg)
 
     base, _, sc = mm.groups()
-    return int(base) * int(sc_lut[sc])
+    return int(base) * _SC_LUT[sc]
 
 
+@functools.lru_cache(maxsize=64)
 def get_scale_seconds(timescale: str) -> float:
     """Convert sdf timescale to scale factor to floating point seconds.
 
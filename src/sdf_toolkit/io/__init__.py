@@ -2,12 +2,19 @@
 
 Parsing has moved to :mod:`sdf_toolkit.parser`.  The ``parse_sdf`` and
 ``parse_sdf_file`` names are re-exported here for backward compatibility.
+
+The names are imported on first access, so that importing one I/O module
+does not load Jinja2 for the annotator or Lark for the parser.
 """
 
-from sdf_toolkit.io.annotate import annotate_verilog
-from sdf_toolkit.io.sdfparse import emit, parse
-from sdf_toolkit.io.writer import emit_sdf
-from sdf_toolkit.parser import parse_sdf, parse_sdf_file
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sdf_toolkit.io.annotate import annotate_verilog
+    from sdf_toolkit.io.sdfparse import emit, parse
+    from sdf_toolkit.io.writer import emit_sdf
+    from sdf_toolkit.parser import parse_sdf, parse_sdf_file
 
 __all__ = [
     # annotate
@@ -21,3 +28,29 @@ __all__ = [
     # writer
     "emit_sdf",
 ]
+
+# Public name -> module __getattr__ imports it from on first access.
+_EXPORTS: dict[str, str] = {
+    "annotate_verilog": "sdf_toolkit.io.annotate",
+    "parse_sdf": "sdf_toolkit.parser",
+    "parse_sdf_file": "sdf_toolkit.parser",
+    "emit": "sdf_toolkit.io.sdfparse",
+    "parse": "sdf_toolkit.io.sdfparse",
+    "emit_sdf": "sdf_toolkit.io.writer",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names alongside the module globals."""
+    return sorted({*globals(), *__all__})
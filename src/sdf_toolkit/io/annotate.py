@@ -5,11 +5,14 @@ Embeds SDF timing data directly into Verilog cell library modules as
 Requires Yosys for robust Verilog parsing.
 """
 
-import json
+import functools
 import re
 import subprocess
+import tempfile
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
+from operator import attrgetter
 from pathlib import Path  # noqa: TC003 - used at runtime in signatures
 
 import jinja2
@@ -26,6 +29,8 @@ from sdf_toolkit.core.model import (
     SDFFile,
     Values,
 )
+from sdf_toolkit.io import jsonio
+from sdf_toolkit.io.verilog import VerilogBackend, scan_verilog
 
 
 class SpecifyKind(StrEnum):
@@ -51,7 +56,7 @@ class PortDirection(StrEnum):
 # ── Yosys JSON data structures ──────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class YosysPort:
     """A port in a Yosys module."""
 
@@ -60,7 +65,7 @@ class YosysPort:
     bits: list[int | str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class YosysCell:
     """A cell instance in a Yosys module."""
 
@@ -69,7 +74,7 @@ class YosysCell:
     connections: dict[str, list[int | str]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class YosysModule:
     """A module parsed from Yosys JSON output."""
 
@@ -79,7 +84,7 @@ class YosysModule:
     netnames: dict[str, list[int]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class YosysDesign:
     """Top-level Yosys design containing multiple modules."""
 
@@ -89,7 +94,7 @@ class YosysDesign:
 # ── Specify block data structures ───────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecifyEntry:
     """A single entry in a Verilog specify block."""
 
@@ -105,7 +110,7 @@ class SpecifyEntry:
     hold_limit: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WireDelay:
     """A delay annotation for a wire declaration."""
 
@@ -117,6 +122,28 @@ class WireDelay:
 # ── Yosys integration ───────────────────────────────────────────────
 
 
+@functools.cache
+def yosys_version() -> str | None:
+    """Return the ``yosys -V`` version banner.
+
+    Returns
+    -------
+    str | None
+        The version line, or None if Yosys is not installed or fails.
+    """
+    try:
+        proc = subprocess.run(
+            ["yosys", "-V"],  # noqa: S607
+            capture_output=True,
+            check=False,
+        )
+    except FileNotFoundError:
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.decode(errors="replace").strip()
+
+
 def run_yosys(verilog_path: Path) -> dict:
     """Run Yosys to parse a Verilog file and return JSON representation.
 
@@ -136,6 +163,13 @@ def run_yosys(verilog_path: Path) -> dict:
         If Yosys is not installed or not in PATH.
     RuntimeError
         If Yosys returns a non-zero exit code.
+
+    Notes
+    -----
+    The JSON dump is read from the stdout pipe into a single ``bytes``
+    buffer (no chunk list joined at the end, no ``str`` decode) and handed
+    straight to :func:`sdf_toolkit.io.jsonio.loads`, which uses orjson when
+    the optional extra is installed.
     """
     verilog_abs = str(verilog_path.resolve())
     cmd = [
@@ -144,25 +178,33 @@ def run_yosys(verilog_path: Path) -> dict:
         "-p",
         f"read_verilog {verilog_abs}; write_json -",
     ]
-    try:
-        result = subprocess.run(  # noqa: S603
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except FileNotFoundError:
-        msg = (
-            "Yosys is required for Verilog annotation but was not found. "
-            "Install it from https://github.com/YosysHQ/yosys"
-        )
-        raise FileNotFoundError(msg) from None
+    # stderr goes to a temporary file so that a chatty Yosys cannot fill
+    # its pipe and stall while we are still reading stdout.
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            proc = subprocess.Popen(  # noqa: S603
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            )
+        except FileNotFoundError:
+            msg = (
+                "Yosys is required for Verilog annotation but was not found. "
+                "Install it from https://github.com/YosysHQ/yosys"
+            )
+            raise FileNotFoundError(msg) from None
+
+        with proc:
+            data = proc.stdout.read()
+            returncode = proc.wait()
 
-    if result.returncode != 0:
-        msg = f"Yosys failed (exit {result.returncode}):\n{result.stderr}"
-        raise RuntimeError(msg)
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+            msg = f"Yosys failed (exit {returncode}):\n{stderr}"
+            raise RuntimeError(msg)
 
-    return json.loads(result.stdout)
+    return jsonio.loads(data)
 
 
 def parse_yosys_json(json_data: dict) -> YosysDesign:
@@ -251,16 +293,50 @@ def match_sdf_to_modules(
     dict[str, list[BaseEntry]]
         Mapping from module name to list of all entries.
     """
+    return {
+        cell_type: entries
+        for cell_type, instances in sdf.cells.items()
+        if cell_type in design.modules and (entries := _cell_type_entries(instances))
+    }
+
+
+def _cell_type_entries(instances: dict[str, dict[str, BaseEntry]]) -> list[BaseEntry]:
+    """Flatten the entries of every instance of one cell type."""
+    flat: list[BaseEntry] = []
+    for entries in instances.values():
+        flat.extend(entries.values())
+    return flat
+
+
+def _collect_entries(
+    sdf: SDFFile, design: YosysDesign
+) -> tuple[dict[str, list[BaseEntry]], list[BaseEntry]]:
+    """Match modules and gather INTERCONNECT entries in one pass over *sdf*.
+
+    Returns the result of :func:`match_sdf_to_modules` together with every
+    INTERCONNECT entry in the file, whatever its cell type.
+    """
     matched: dict[str, list[BaseEntry]] = {}
+    interconnects: list[BaseEntry] = []
     for cell_type, instances in sdf.cells.items():
-        if cell_type not in design.modules:
-            continue
-        entries: list[BaseEntry] = []
-        for _inst_name, inst_entries in instances.items():
-            entries.extend(inst_entries.values())
-        if entries:
+        entries = _cell_type_entries(instances)
+        interconnects += [
+            entry for entry in entries if entry.type == EntryType.INTERCONNECT
+        ]
+        if entries and cell_type in design.modules:
             matched[cell_type] = entries
-    return matched
+    return matched, interconnects
+
+
+_worst_case_key = attrgetter(
+    "type",
+    "from_pin",
+    "to_pin",
+    "from_pin_edge",
+    "to_pin_edge",
+    "is_cond",
+    "cond_equation",
+)
 
 
 def select_worst_case_delays(
@@ -287,36 +363,36 @@ def select_worst_case_delays(
     -------
     list[BaseEntry]
         One entry per unique key, with the worst-case delay.
+
+    Raises
+    ------
+    ValueError
+        If *field_name* or *metric* is not a valid name.
     """
+    get_scalar = DelayPaths.scalar_getter(field_name, metric)
     groups: dict[tuple, BaseEntry] = {}
+    # Scalar of the entry held in ``groups``, filled in on the first
+    # collision for a key so it is never extracted twice.
+    scalars: dict[tuple, float | None] = {}
     for entry in entries:
-        key = (
-            entry.type,
-            entry.from_pin,
-            entry.to_pin,
-            entry.from_pin_edge,
-            entry.to_pin_edge,
-            entry.is_cond,
-            entry.cond_equation,
-        )
-        if key not in groups:
+        key = _worst_case_key(entry)
+        existing = groups.setdefault(key, entry)
+        if existing is entry or entry.delay_paths is None:
+            continue
+        new_scalar = get_scalar(entry.delay_paths)
+        if new_scalar is None:
+            continue
+        if key in scalars:
+            existing_scalar = scalars[key]
+        elif existing.delay_paths is not None:
+            existing_scalar = get_scalar(existing.delay_paths)
+        else:
+            existing_scalar = None
+        if existing_scalar is None or new_scalar > existing_scalar:
             groups[key] = entry
+            scalars[key] = new_scalar
         else:
-            existing = groups[key]
-            existing_scalar = (
-                existing.delay_paths.get_scalar(field_name, metric)
-                if existing.delay_paths
-                else None
-            )
-            new_scalar = (
-                entry.delay_paths.get_scalar(field_name, metric)
-                if entry.delay_paths
-                else None
-            )
-            if new_scalar is not None and (
-                existing_scalar is None or new_scalar > existing_scalar
-            ):
-                groups[key] = entry
+            scalars[key] = existing_scalar
     return list(groups.values())
 
 
@@ -447,43 +523,71 @@ def _extract_single_delay(dp: DelayPaths) -> str:
     return "0"
 
 
-def _format_specify_entry(entry: SpecifyEntry) -> str:
-    """Format a single SpecifyEntry as a Verilog specify statement line."""
-    indent = "        "
-    data_str = _format_pin(entry.from_pin, entry.from_edge)
-    ref_str = _format_pin(entry.to_pin or "", entry.to_edge)
+_SPECIFY_INDENT = "        "
+
+
+def _format_iopath(entry: SpecifyEntry, data_str: str, ref_str: str) -> str:
+    """Format a module path delay, with an optional ``if`` condition."""
+    if entry.fall_delay is not None:
+        delay_str = f"({entry.rise_delay}, {entry.fall_delay})"
+    else:
+        delay_str = f"({entry.rise_delay})"
+    path_str = f"({data_str} => {ref_str}) = {delay_str}"
+    if entry.condition:
+        return f"{_SPECIFY_INDENT}if ({entry.condition}) {path_str};"
+    return f"{_SPECIFY_INDENT}{path_str};"
+
+
+def _format_setup(entry: SpecifyEntry, data_str: str, ref_str: str) -> str:
+    """Format a ``$setup`` timing check."""
+    return f"{_SPECIFY_INDENT}$setup({data_str}, {ref_str}, {entry.rise_delay});"
+
+
+def _format_setuphold(entry: SpecifyEntry, data_str: str, ref_str: str) -> str:
+    """Format a ``$setuphold`` timing check."""
+    s, h = entry.setup_limit, entry.hold_limit
+    return f"{_SPECIFY_INDENT}$setuphold({ref_str}, {data_str}, {s}, {h});"
 
-    if entry.kind == SpecifyKind.IOPATH:
-        if entry.fall_delay is not None:
-            delay_str = f"({entry.rise_delay}, {entry.fall_delay})"
-        else:
-            delay_str = f"({entry.rise_delay})"
-        path_str = f"({data_str} => {ref_str}) = {delay_str}"
-        if entry.condition:
-            return f"{indent}if ({entry.condition}) {path_str};"
-        return f"{indent}{path_str};"
 
-    if entry.kind == SpecifyKind.SETUP:
-        return f"{indent}$setup({data_str}, {ref_str}, {entry.rise_delay});"
+def _format_width(entry: SpecifyEntry, data_str: str, _ref_str: str) -> str:
+    """Format a ``$width`` timing check."""
+    return f"{_SPECIFY_INDENT}$width({data_str}, {entry.rise_delay});"
 
-    if entry.kind == SpecifyKind.SETUPHOLD:
-        s, h = entry.setup_limit, entry.hold_limit
-        return f"{indent}$setuphold({ref_str}, {data_str}, {s}, {h});"
 
-    if entry.kind == SpecifyKind.WIDTH:
-        return f"{indent}$width({data_str}, {entry.rise_delay});"
+def _format_ref_data_check(entry: SpecifyEntry, data_str: str, ref_str: str) -> str:
+    """Format ``$hold``, ``$recovery`` or ``$removal``: (ref, data, limit)."""
+    kind, limit = entry.kind, entry.rise_delay
+    return f"{_SPECIFY_INDENT}${kind}({ref_str}, {data_str}, {limit});"
 
-    # hold, recovery, removal all share: $kind(ref, data, limit)
-    if entry.kind in (SpecifyKind.HOLD, SpecifyKind.RECOVERY, SpecifyKind.REMOVAL):
-        return f"{indent}${entry.kind}({ref_str}, {data_str}, {entry.rise_delay});"
 
-    return ""
+_SPECIFY_FORMATTERS: dict[SpecifyKind, Callable[[SpecifyEntry, str, str], str]] = {
+    SpecifyKind.IOPATH: _format_iopath,
+    SpecifyKind.SETUP: _format_setup,
+    SpecifyKind.SETUPHOLD: _format_setuphold,
+    SpecifyKind.WIDTH: _format_width,
+    SpecifyKind.HOLD: _format_ref_data_check,
+    SpecifyKind.RECOVERY: _format_ref_data_check,
+    SpecifyKind.REMOVAL: _format_ref_data_check,
+}
+
+
+def _format_specify_entry(entry: SpecifyEntry) -> str:
+    """Format a single SpecifyEntry as a Verilog specify statement line."""
+    formatter = _SPECIFY_FORMATTERS.get(entry.kind)
+    if formatter is None:
+        return ""
+    data_str = _format_pin(entry.from_pin, entry.from_edge)
+    ref_str = _format_pin(entry.to_pin or "", entry.to_edge)
+    return formatter(entry, data_str, ref_str)
 
 
 _jinja_env = jinja2.Environment(
     loader=jinja2.PackageLoader("sdf_toolkit.io", "templates"),
     keep_trailing_newline=True,
 )
+# Loaded once: get_template() repeats a cache lookup and an up-to-date
+# check on the template file every time it is called.
+_specify_template = _jinja_env.get_template("specify.j2")
 
 
 def render_specify_block(entries: list[SpecifyEntry]) -> str:
@@ -500,8 +604,7 @@ def render_specify_block(entries: list[SpecifyEntry]) -> str:
         A complete ``specify ... endspecify`` block.
     """
     lines = [_format_specify_entry(e) for e in entries]
-    template = _jinja_env.get_template("specify.j2")
-    return template.render(lines=lines)
+    return _specify_template.render(lines=lines)
 
 
 # ── INTERCONNECT --> Wire delays ────────────────────────────────────
@@ -536,23 +639,25 @@ def resolve_interconnects(
     module = design.modules[top_module]
     bit_map = build_bit_to_net_map(module)
 
+    get_cell = module.cells.get
+    get_net = bit_map.get
+
     wire_delays: list[WireDelay] = []
     for entry in entries:
         if entry.type != EntryType.INTERCONNECT:
             continue
-        if not entry.to_pin or not entry.delay_paths:
+        to_pin = entry.to_pin
+        delay_paths = entry.delay_paths
+        if not to_pin or not delay_paths:
             continue
 
         # Split to_pin on last divider to get (instance_path, pin_name)
-        to_pin = entry.to_pin
-        divider_pos = to_pin.rfind(sdf_divider)
-        if divider_pos < 0:
+        instance_path, divider, pin_name = to_pin.rpartition(sdf_divider)
+        if not divider:
             continue
-        instance_path = to_pin[:divider_pos]
-        pin_name = to_pin[divider_pos + 1 :]
 
         # Find instance in top module cells
-        cell = module.cells.get(instance_path)
+        cell = get_cell(instance_path)
         if cell is None:
             continue
 
@@ -563,9 +668,11 @@ def resolve_interconnects(
 
         # Look up net name from bit index
         for bit in conn_bits:
-            if isinstance(bit, int) and bit in bit_map:
-                net_name = bit_map[bit]
-                rise_str, fall_str = _extract_rise_fall(entry.delay_paths)
+            if not isinstance(bit, int):
+                continue
+            net_name = get_net(bit)
+            if net_name is not None:
+                rise_str, fall_str = _extract_rise_fall(delay_paths)
                 wd = WireDelay(
                     net_name=net_name,
                     rise_delay=rise_str,
@@ -580,10 +687,33 @@ def resolve_interconnects(
 # ── Text insertion ──────────────────────────────────────────────────
 
 
+# One line of Verilog that opens a module, or is exactly ``specify`` or
+# ``endmodule`` once surrounding whitespace is stripped.  ``[^\S\n]`` is
+# whitespace other than the newline, so no match spans two lines.
+_MODULE_SCAN_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"module (?=[^\n]*\S)(?P<module>[^\s(;]*)"
+    r"|(?P<keyword>specify|endmodule)[^\S\n]*$"
+    r")",
+    re.MULTILINE,
+)
+
+# Below this many annotated nets, wire lines are searched for each name in
+# turn; above it, substrings of the line are looked up in a dictionary.
+_NET_SCAN_THRESHOLD = 64
+
+# A ``wire`` declaration line without a ``#`` delay annotation.
+_WIRE_DECL_RE = re.compile(
+    r"^(?P<indent>[^\S\n]*)wire (?=[^#\n]*[^\s#])(?P<rest>[^#\n]*)$",
+    re.MULTILINE,
+)
+
+
 def insert_specify_blocks(verilog_text: str, module_blocks: dict[str, str]) -> str:
-    """Insert specify blocks into Verilog module definitions.
+    r"""Insert specify blocks into Verilog module definitions.
 
-    Scans the Verilog text line-by-line, tracking the current module name.
+    Scans the Verilog text for ``module``, ``specify`` and ``endmodule``
+    lines in a single regex pass, tracking the current module name.
     When hitting ``endmodule``, inserts the corresponding specify block
     before it. Skips modules that already contain a ``specify`` block.
 
@@ -598,42 +728,52 @@ def insert_specify_blocks(verilog_text: str, module_blocks: dict[str, str]) -> s
     -------
     str
         Modified Verilog text with specify blocks inserted.
+
+    Examples
+    --------
+    >>> text = "module INV(input i, output z);\nendmodule\n"
+    >>> print(insert_specify_blocks(text, {"INV": "  specify\n  endspecify"}))
+    module INV(input i, output z);
+      specify
+      endspecify
+    endmodule
+    <BLANKLINE>
     """
-    lines = verilog_text.split("\n")
-    result: list[str] = []
+    parts: list[str] = []
+    last = 0
     current_module: str | None = None
     has_specify = False
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Track current module
-        if stripped.startswith("module "):
-            # Module name ends at whitespace, '(', or ';'
-            current_module = re.split(r"[\s(;]", stripped[7:], maxsplit=1)[0]
+    for match in _MODULE_SCAN_RE.finditer(verilog_text):
+        keyword = match["keyword"]
+        if keyword is None:
+            current_module = match["module"]
             has_specify = False
-
-        # Track if module already has specify
-        if stripped == "specify":
+        elif keyword == "specify":
             has_specify = True
-
-        # Insert before endmodule
-        if stripped == "endmodule" and current_module and not has_specify:
+        elif current_module and not has_specify:
             block = module_blocks.get(current_module)
             if block:
-                result.append(block)
+                start = match.start()
+                parts.append(verilog_text[last:start])
+                parts.append(block)
+                parts.append("\n")
+                last = start
             current_module = None
 
-        result.append(line)
-
-    return "\n".join(result)
+    if not parts:
+        return verilog_text
+    parts.append(verilog_text[last:])
+    return "".join(parts)
 
 
 def insert_wire_delays(verilog_text: str, wire_delays: list[WireDelay]) -> str:
     """Insert delay annotations into wire declarations.
 
     For each ``wire`` declaration matching a net name in the delay list,
-    inserts ``#(rise, fall)`` after the ``wire`` keyword.
+    inserts ``#(rise, fall)`` after the ``wire`` keyword. Net names are
+    matched through a dictionary of substrings of each declaration, so
+    the cost does not grow with the number of annotated nets.
 
     Parameters
     ----------
@@ -651,24 +791,52 @@ def insert_wire_delays(verilog_text: str, wire_delays: list[WireDelay]) -> str:
         return verilog_text
 
     delay_map: dict[str, WireDelay] = {wd.net_name: wd for wd in wire_delays}
-    lines = verilog_text.split("\n")
-    result: list[str] = []
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("wire ") and "#" not in stripped:
-            # Check if this wire declaration matches a known net
-            for net_name, wd in delay_map.items():
-                if net_name in stripped:
-                    if wd.fall_delay is not None:
-                        delay_str = f"#({wd.rise_delay}, {wd.fall_delay})"
-                    else:
-                        delay_str = f"#({wd.rise_delay})"
-                    line = line.replace("wire ", f"wire {delay_str} ", 1)
-                    break
-        result.append(line)
-
-    return "\n".join(result)
+    # A net listed earlier wins when several occur in one declaration.
+    rank = {net_name: i for i, net_name in enumerate(delay_map)}
+    lengths = sorted({len(net_name) for net_name in rank})
+    net_names = list(delay_map)
+
+    def annotate(match: re.Match[str]) -> str:
+        stripped = match[0].strip()
+        best = _first_net_in(stripped, rank, lengths)
+        if best is None:
+            return match[0]
+        wd = delay_map[net_names[best]]
+        if wd.fall_delay is not None:
+            delay_str = f"#({wd.rise_delay}, {wd.fall_delay})"
+        else:
+            delay_str = f"#({wd.rise_delay})"
+        return f"{match['indent']}wire {delay_str} {match['rest']}"
+
+    return _WIRE_DECL_RE.sub(annotate, verilog_text)
+
+
+def _first_net_in(text: str, rank: dict[str, int], lengths: list[int]) -> int | None:
+    """Return the lowest rank of any net name occurring in *text*.
+
+    With few nets each name is simply searched for in turn. Otherwise
+    every substring of *text* whose length is one of the net name lengths
+    is looked up in *rank*, so the cost depends on the line length and the
+    number of distinct name lengths rather than on the number of nets.
+    """
+    if len(rank) <= _NET_SCAN_THRESHOLD:
+        for net_name, i in rank.items():
+            if net_name in text:
+                return i
+        return None
+
+    best: int | None = None
+    size = len(text)
+    for length in lengths:
+        if length > size:
+            break
+        for start in range(size - length + 1):
+            found = rank.get(text[start : start + length])
+            if found is not None and (best is None or found < best):
+                if found == 0:
+                    return 0
+                best = found
+    return best
 
 
 # ── Orchestrator ────────────────────────────────────────────────────
@@ -680,6 +848,7 @@ def annotate_verilog(
     output_path: Path | None = None,
     field_name: DelayFieldLike = DelayField.SLOW,
     metric: DelayMetricLike = DelayMetric.MAX,
+    backend: VerilogBackend = VerilogBackend.YOSYS,
 ) -> str:
     """Annotate a Verilog cell library with SDF timing data.
 
@@ -687,6 +856,11 @@ def annotate_verilog(
     SDF cell types to Verilog modules, generates specify blocks, and
     inserts them into the Verilog text.
 
+    With ``backend="scan"`` the Verilog structure is read by the built-in
+    :func:`~sdf_toolkit.io.verilog.scan_verilog` instead, which avoids the
+    Yosys subprocess but only understands structural Verilog (cell
+    libraries and netlists with named port connections).
+
     Parameters
     ----------
     sdf_path : Path
@@ -699,6 +873,8 @@ def annotate_verilog(
         Delay field for worst-case selection (default: "slow").
     metric : str
         Metric for worst-case selection (default: "max").
+    backend : VerilogBackend
+        Verilog front end: ``"yosys"`` (default) or ``"scan"``.
 
     Returns
     -------
@@ -710,12 +886,16 @@ def annotate_verilog(
     # 1. Parse SDF
     sdf = parse_sdf(sdf_path.read_text())
 
-    # 2. Parse Verilog via Yosys
-    yosys_json = run_yosys(verilog_path)
+    # 2. Parse Verilog via Yosys or the built-in scanner
+    verilog_text = verilog_path.read_text()
+    if VerilogBackend(backend) == VerilogBackend.SCAN:
+        yosys_json = scan_verilog(verilog_text)
+    else:
+        yosys_json = run_yosys(verilog_path)
     design = parse_yosys_json(yosys_json)
 
-    # 3. Match SDF cells to modules
-    matched = match_sdf_to_modules(sdf, design)
+    # 3. Match SDF cells to modules, gathering INTERCONNECT entries as we go
+    matched, top_entries = _collect_entries(sdf, design)
 
     # 4. Generate specify blocks per module
     module_blocks: dict[str, str] = {}
@@ -728,17 +908,9 @@ def annotate_verilog(
     # 5. Resolve INTERCONNECT entries from top-level cell
     divider = sdf.header.divider or "/"
     top_module = sdf.header.design or ""
-    top_entries: list[BaseEntry] = []
-    for _cell_type, instances in sdf.cells.items():
-        for _inst_name, inst_entries in instances.items():
-            for entry in inst_entries.values():
-                if entry.type == EntryType.INTERCONNECT:
-                    top_entries.append(entry)
-
     wire_delays = resolve_interconnects(top_entries, design, top_module, divider)
 
     # 6. Insert into Verilog text
-    verilog_text = verilog_path.read_text()
     verilog_text = insert_specify_blocks(verilog_text, module_blocks)
     verilog_text = insert_wire_delays(verilog_text, wire_delays)
 
@@ -0,0 +1,112 @@
+"""JSON encoding and decoding with an optional orjson fast path.
+
+orjson is an optional extra. When it is installed these helpers use it;
+otherwise they fall back to the stdlib :mod:`json` module, so callers never
+need to check which one is available.
+"""
+
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_kwargs(pretty: bool) -> dict[str, object]:
+    """Return stdlib ``json.dump(s)`` options for pretty or compact output."""
+    if pretty:
+        return {"indent": 2}
+    return {"separators": (",", ":")}
+
+
+def _orjson_option(pretty: bool) -> int:
+    """Return orjson options for pretty or compact output.
+
+    ``OPT_NON_STR_KEYS`` is always set: orjson rejects keys that are not
+    exactly ``str``, and ``DelayPaths.to_dict`` is keyed by ``DelayField``
+    members.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def dumps(obj: object, pretty: bool = False) -> str:
+    """Serialize *obj* to JSON text.
+
+    Parameters
+    ----------
+    obj : object
+        JSON-serializable object.
+    pretty : bool
+        Indent by two spaces instead of emitting compact JSON.
+
+    Returns
+    -------
+    str
+        The JSON text.
+
+    Examples
+    --------
+    >>> dumps({"a": [1, 2]})
+    '{"a":[1,2]}'
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_orjson_option(pretty)).decode()
+    return json.dumps(obj, **_json_kwargs(pretty))
+
+
+def echo(obj: object, pretty: bool = False) -> None:
+    """Write *obj* to stdout as JSON followed by a newline.
+
+    The document is streamed rather than built as one string: orjson's
+    bytes go straight to the binary stdout buffer, and the stdlib
+    fallback encodes chunk by chunk.
+
+    Parameters
+    ----------
+    obj : object
+        JSON-serializable object.
+    pretty : bool
+        Indent by two spaces instead of emitting compact JSON.
+    """
+    if orjson is None:
+        json.dump(obj, sys.stdout, **_json_kwargs(pretty))
+        sys.stdout.write("\n")
+        return
+    data = orjson.dumps(obj, option=_orjson_option(pretty))
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        sys.stdout.write("\n")
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def loads(data: str | bytes) -> object:
+    """Deserialize JSON text or UTF-8 bytes.
+
+    Parameters
+    ----------
+    data : str | bytes
+        The JSON document.
+
+    Returns
+    -------
+    object
+        The decoded value.
+
+    Examples
+    --------
+    >>> loads(b'{"a": null}')
+    {'a': None}
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -22,12 +22,11 @@ function here delegates to :func:`sdf_toolkit.parser.parse_sdf` for
 backward compatibility.
 """
 
-import json
 import sys
 from pathlib import Path
 
 from sdf_toolkit.core.model import SDFFile
-from sdf_toolkit.io import writer
+from sdf_toolkit.io import jsonio, writer
 from sdf_toolkit.parser.parser import parse_sdf
 
 
@@ -85,17 +84,26 @@ def parse(input: str) -> SDFFile:  # noqa: A002
 
 
 def main() -> None:
-    """Run the command line SDF parser."""
-    if len(sys.argv) != 2:
-        print("Usage: sdf_toolkit_parse <sdf_file>")  # noqa: T201
+    """Run the command line SDF parser.
+
+    The parsed file is streamed to stdout as compact JSON by
+    :func:`sdf_toolkit.io.jsonio.echo`. Pass ``--pretty`` to get indented
+    output instead.
+    """
+    args = sys.argv[1:]
+    pretty = "--pretty" in args
+    if pretty:
+        args.remove("--pretty")
+    if len(args) != 1:
+        print("Usage: sdf_toolkit_parse [--pretty] <sdf_file>")  # noqa: T201
         sys.exit(1)
 
-    sdf_file = sys.argv[1]
+    sdf_file = args[0]
 
     try:
         content = Path(sdf_file).read_text()
         result = parse(content)
-        print(json.dumps(result.to_dict(), indent=2))  # noqa: T201
+        jsonio.echo(result.to_dict(), pretty=pretty)
     except Exception as e:  # noqa: BLE001
         print(f"Error parsing SDF file: {e}")  # noqa: T201
         sys.exit(1)
@@ -0,0 +1,312 @@
+"""Lightweight structural Verilog scanner.
+
+Extracts what SDF back-annotation needs -- module names, port directions,
+cell instances with their named port connections, and net names -- with a
+handful of regular expressions instead of running Yosys. The result has the
+same layout as Yosys' ``write_json`` output, so it can be passed straight to
+:func:`sdf_toolkit.io.annotate.parse_yosys_json`.
+
+Only the structural subset of Verilog is understood. Behavioural code is
+skipped, positional port connections are not resolved, and parameterised
+ranges are treated as single-bit nets. Use the Yosys back end for anything
+beyond plain cell libraries and gate-level netlists.
+"""
+
+import re
+from enum import StrEnum
+
+
+class VerilogBackend(StrEnum):
+    """How :func:`~sdf_toolkit.io.annotate.annotate_verilog` reads Verilog."""
+
+    YOSYS = "yosys"
+    SCAN = "scan"
+
+
+_IDENT = r"(?:\\\S+|[A-Za-z_][\w$]*)"
+
+# Line and block comments, and ``(* attribute *)`` lists (but not ``@(*)``).
+_COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/|\(\*(?!\)).*?\*\)", re.DOTALL)
+
+_MODULE_RE = re.compile(
+    rf"\b(?:macro)?module\s+(?P<name>{_IDENT})(?P<body>.*?)\bendmodule\b",
+    re.DOTALL,
+)
+
+# ``input``/``output``/``inout``/net declarations: kind, optional net type,
+# optional ``signed``, optional range, then the comma-separated names.
+_DECL_RE = re.compile(
+    r"^(?P<kind>input|output|inout|wire|reg|tri|wand|wor|supply0|supply1)\b\s*"
+    r"(?:(?:wire|reg|tri|wand|wor)\b\s*)?"
+    r"(?:signed\b\s*)?"
+    r"(?:#\s*(?:\([^)]*\)|\S+)\s*)?"
+    r"(?P<range>\[[^\]]*\])?\s*"
+    r"(?P<names>.*)$",
+    re.DOTALL,
+)
+
+_RANGE_RE = re.compile(r"\[\s*(-?\d+)\s*(?::\s*(-?\d+)\s*)?\]")
+
+_INSTANCE_RE = re.compile(
+    rf"^(?P<type>{_IDENT})\s*"
+    r"(?:#\s*\((?:[^()]|\([^()]*\))*\)\s*)?"
+    rf"(?P<name>{_IDENT})\s*\((?P<ports>.*)\)$",
+    re.DOTALL,
+)
+
+_CONNECTION_RE = re.compile(
+    rf"\.\s*(?P<pin>{_IDENT})\s*\((?P<expr>(?:[^()]|\([^()]*\))*)\)",
+)
+
+_SELECT_RE = re.compile(
+    rf"^(?P<name>{_IDENT})\s*(?:\[\s*(?P<left>-?\d+)\s*(?::\s*(?P<right>-?\d+)\s*)?\])?$"
+)
+
+_BINARY_CONST_RE = re.compile(r"^\d*\s*'[sS]?[bB]\s*(?P<digits>[01xXzZ?_]+)$")
+
+# Block keywords without a semicolon of their own, which end up glued to
+# the front of the following statement when splitting on ``;``.
+_LEADING_KEYWORDS_RE = re.compile(
+    r"^(?:(?:begin|end|endcase|endfunction|endgenerate|endspecify|endtask"
+    r"|else|generate)\b\s*)+"
+)
+
+_DIRECTIONS = frozenset({"input", "output", "inout"})
+
+# Statements that look like ``word word (...)`` but are not instances.
+_NOT_INSTANCE_TYPES = frozenset(
+    {
+        "always",
+        "assign",
+        "begin",
+        "case",
+        "else",
+        "end",
+        "for",
+        "function",
+        "generate",
+        "if",
+        "initial",
+        "localparam",
+        "parameter",
+        "specify",
+        "task",
+        "while",
+    }
+)
+
+
+def _name(ident: str) -> str:
+    """Strip the backslash from an escaped identifier, as Yosys does."""
+    return ident.removeprefix("\\")
+
+
+def _split_top_level(text: str) -> list[str]:
+    """Split *text* on commas that are not nested in brackets."""
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(text):
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _range_of(range_text: str | None) -> tuple[int, int]:
+    """Return ``(msb, lsb)`` for a ``[msb:lsb]`` range, or ``(0, 0)``."""
+    if range_text:
+        match = _RANGE_RE.fullmatch(range_text)
+        if match:
+            left = int(match[1])
+            return left, int(match[2]) if match[2] is not None else left
+    return 0, 0
+
+
+class _ModuleScan:
+    """Bit allocation and JSON assembly for one module."""
+
+    def __init__(self) -> None:
+        self.next_bit = 2  # Yosys reserves 0 and 1 for constants
+        self.ranges: dict[str, tuple[int, int]] = {}
+        self.netnames: dict[str, dict] = {}
+        self.directions: dict[str, str] = {}
+        self.port_order: list[str] = []
+        self.cells: dict[str, dict] = {}
+
+    def declare(self, name: str, msb: int = 0, lsb: int = 0) -> list[int | str]:
+        """Allocate bits for net *name* (LSB first) unless already declared."""
+        if name not in self.netnames:
+            width = abs(msb - lsb) + 1
+            bits: list[int | str] = list(range(self.next_bit, self.next_bit + width))
+            self.next_bit += width
+            self.ranges[name] = (msb, lsb)
+            self.netnames[name] = {"bits": bits}
+        return self.netnames[name]["bits"]
+
+    def bit(self, name: str, index: int) -> int | str | None:
+        """Return the bit of *name* at Verilog *index*, or None if out of range."""
+        bits = self.declare(name)
+        msb, lsb = self.ranges[name]
+        offset = index - lsb if msb >= lsb else lsb - index
+        return bits[offset] if 0 <= offset < len(bits) else None
+
+    def expr_bits(self, expr: str) -> list[int | str]:
+        """Resolve a connection expression to Yosys-style bits (LSB first)."""
+        expr = expr.strip()
+        if not expr:
+            return []
+        if expr.startswith("{") and expr.endswith("}"):
+            bits: list[int | str] = []
+            for part in reversed(_split_top_level(expr[1:-1])):
+                bits.extend(self.expr_bits(part))
+            return bits
+        const = _BINARY_CONST_RE.match(expr)
+        if const:
+            digits = const["digits"].replace("_", "").lower().replace("?", "z")
+            return list(reversed(digits))
+        select = _SELECT_RE.match(expr)
+        if select is None:
+            return []
+        name = _name(select["name"])
+        if select["left"] is None:
+            return list(self.declare(name))
+        left = int(select["left"])
+        right = int(select["right"]) if select["right"] is not None else left
+        step = 1 if left >= right else -1
+        selected = [self.bit(name, i) for i in range(right, left + step, step)]
+        return [] if None in selected else selected
+
+    def declare_names(self, kind: str, range_text: str | None, names: str) -> None:
+        """Record one declaration statement or ANSI port group."""
+        msb, lsb = _range_of(range_text)
+        for item in _split_top_level(names):
+            ident = re.match(_IDENT, item)
+            if ident is None:
+                continue
+            name = _name(ident[0])
+            self.declare(name, msb, lsb)
+            if kind in _DIRECTIONS:
+                self.directions[name] = kind
+
+    def to_json(self) -> dict:
+        """Return the module in Yosys ``write_json`` layout."""
+        ports = {
+            name: {
+                "direction": self.directions.get(name, "input"),
+                "bits": self.declare(name),
+            }
+            for name in self.port_order
+        }
+        return {"ports": ports, "cells": self.cells, "netnames": self.netnames}
+
+
+def _scan_header(scan: _ModuleScan, header: str) -> None:
+    """Parse the port list of a module header (ANSI or plain names)."""
+    header = header.strip()
+    if header.startswith("#"):
+        # Skip the parameter list, which may itself contain parentheses.
+        depth = 0
+        for i, char in enumerate(header):
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    header = header[i + 1 :].strip()
+                    break
+    if not (header.startswith("(") and header.endswith(")")):
+        return
+
+    kind: str | None = None
+    range_text: str | None = None
+    for item in _split_top_level(header[1:-1]):
+        decl = _DECL_RE.match(item)
+        if decl and decl["kind"] in _DIRECTIONS:
+            kind, range_text = decl["kind"], decl["range"]
+            names = decl["names"]
+        else:
+            names = item
+        ident = re.match(_IDENT, names)
+        if ident is None:
+            continue
+        name = _name(ident[0])
+        scan.port_order.append(name)
+        if kind is not None:
+            scan.declare_names(kind, range_text, name)
+
+
+def _scan_module(text: str) -> dict:
+    """Scan the text between a module name and ``endmodule``."""
+    scan = _ModuleScan()
+    header, _, body = text.partition(";")
+    _scan_header(scan, header)
+
+    statements = [
+        _LEADING_KEYWORDS_RE.sub("", stmt.strip()) for stmt in body.split(";")
+    ]
+    instances: list[re.Match[str]] = []
+    for stmt in statements:
+        decl = _DECL_RE.match(stmt)
+        if decl:
+            names = re.sub(r"=[^,]*", "", decl["names"])
+            scan.declare_names(decl["kind"], decl["range"], names)
+            continue
+        instance = _INSTANCE_RE.match(stmt)
+        if instance and instance["type"] not in _NOT_INSTANCE_TYPES:
+            instances.append(instance)
+
+    # Instances go second so that nets declared after use keep their width.
+    for instance in instances:
+        connections = {
+            _name(conn["pin"]): scan.expr_bits(conn["expr"])
+            for conn in _CONNECTION_RE.finditer(instance["ports"])
+        }
+        scan.cells[_name(instance["name"])] = {
+            "type": _name(instance["type"]),
+            "connections": connections,
+        }
+    return scan.to_json()
+
+
+def scan_verilog(verilog_text: str) -> dict:
+    """Scan Verilog source into a Yosys ``write_json``-style dict.
+
+    Parameters
+    ----------
+    verilog_text : str
+        Verilog source text.
+
+    Returns
+    -------
+    dict
+        ``{"modules": {name: {"ports", "cells", "netnames"}}}``, with each
+        net given synthetic integer bit ids starting at 2 as Yosys does.
+
+    Examples
+    --------
+    >>> design = scan_verilog('''
+    ... module top(input a, output y);
+    ...     wire n1;
+    ...     INV u0 (.i(a), .z(n1));
+    ...     INV u1 (.i(n1), .z(y));
+    ... endmodule
+    ... ''')
+    >>> top = design["modules"]["top"]
+    >>> top["ports"]["y"]
+    {'direction': 'output', 'bits': [3]}
+    >>> top["cells"]["u1"]
+    {'type': 'INV', 'connections': {'i': [4], 'z': [3]}}
+    """
+    text = _COMMENT_RE.sub(" ", verilog_text)
+    return {
+        "modules": {
+            _name(match["name"]): _scan_module(match["body"])
+            for match in _MODULE_RE.finditer(text)
+        }
+    }
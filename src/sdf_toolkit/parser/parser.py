@@ -1,5 +1,9 @@
 """Lark-based SDF file parser with thread-safe caching."""
 
+import functools
+import mmap
+import os
+import stat
 import threading
 from pathlib import Path
 
@@ -9,24 +13,51 @@ from sdf_toolkit.core.model import SDFFile
 from sdf_toolkit.parser.transformers import SDFTransformer
 
 
+@functools.lru_cache(maxsize=1)
+def _get_lark() -> Lark:
+    """Build the SDF grammar parser once and share it between instances.
+
+    The returned ``Lark`` object holds no per-parse state, so a single
+    compiled instance can back every ``SDFLarkParser``.
+    """
+    grammar_path = (Path(__file__).parent / "sdf.lark").resolve()
+
+    try:
+        with grammar_path.open() as f:
+            grammar = f.read()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Grammar file not found: {grammar_path}") from exc
+
+    # NOTE: We intentionally do NOT pass transformer= here. Passing it
+    # would bind a single SDFTransformer instance whose mutable state
+    # leaks between parse() calls. Instead, we apply a fresh transformer
+    # in SDFLarkParser.parse() so each invocation starts with clean state.
+    #
+    # ``cache=True`` stores the LALR analysis in the system temp
+    # directory, keyed on a hash of the grammar, options and Lark
+    # version, so later processes skip table construction entirely.
+    #
+    # ``maybe_placeholders`` stays on: ``real_triple`` and the optional
+    # header/instance slots rely on empty ``[...]`` items arriving as None
+    # at a fixed position. No handler reads tree ``.meta``, so position
+    # propagation is disabled explicitly.
+    return Lark(
+        grammar,
+        parser="lalr",
+        lexer="contextual",
+        start="start",
+        maybe_placeholders=True,
+        propagate_positions=False,
+        cache=True,
+    )
+
+
 class SDFLarkParser:
     """Lark-based SDF parser that replaces the PLY implementation."""
 
     def __init__(self) -> None:
-        """Initialize the parser with the SDF grammar."""
-        grammar_path = (Path(__file__).parent / "sdf.lark").resolve()
-
-        try:
-            with grammar_path.open() as f:
-                grammar = f.read()
-        except FileNotFoundError as exc:
-            raise FileNotFoundError(f"Grammar file not found: {grammar_path}") from exc
-
-        # NOTE: We intentionally do NOT pass transformer= here. Passing it
-        # would bind a single SDFTransformer instance whose mutable state
-        # leaks between parse() calls. Instead, we apply a fresh transformer
-        # in parse() so each invocation starts with clean state.
-        self.parser = Lark(grammar, parser="lalr", start="start")
+        """Initialize the parser with the shared compiled SDF grammar."""
+        self.parser = _get_lark()
 
     def parse(self, input_text: str) -> SDFFile:
         """Parse SDF input text and return an SDFFile."""
@@ -38,35 +69,58 @@ class SDFLarkParser:
                 f"SDF parsing failed at {getattr(e, 'line', 'unknown')}:"
                 f"{getattr(e, 'column', 'unknown')} - {e!s}"
             ) from e
-        except Exception as e:
-            raise type(e)(f"Unexpected error during SDF parsing: {e!s}") from e
 
     def parse_file(self, filepath: Path | str) -> SDFFile:
-        """Read and parse an SDF file from disk."""
+        """Read and parse an SDF file from disk.
+
+        Regular files are memory-mapped and decoded straight from the
+        mapping, so large inputs are not first copied into an intermediate
+        ``bytes`` object before becoming the ``str`` handed to Lark. Pipes
+        and other non-regular files are read normally.
+        """
         try:
-            content = Path(filepath).read_text()
+            with Path(filepath).open("rb") as f:
+                st = os.fstat(f.fileno())
+                if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, "utf-8")
+                else:
+                    # Empty files cannot be mapped, and pipes, FIFOs and
+                    # /dev/stdin report a size of zero however much they hold.
+                    content = f.read().decode("utf-8")
         except OSError as e:
             raise OSError(f"Error reading SDF file {filepath}: {e!s}") from e
         return self.parse(content)
 
 
-_local = threading.local()
+class _ParserLocal(threading.local):
+    """Thread-local holder whose parser is created lazily on first access per thread."""
+
+    def __init__(self) -> None:
+        self.parser = SDFLarkParser()
+
+
+_local = _ParserLocal()
 
 
 def get_parser() -> SDFLarkParser:
-    """Get or create a thread-local parser instance."""
-    if not hasattr(_local, "parser"):
-        _local.parser = SDFLarkParser()
+    """Get the thread-local parser instance."""
     return _local.parser
 
 
 def parse_sdf(input_text: str) -> SDFFile:
-    """Parse SDF text using a thread-local Lark parser."""
+    """Parse SDF text using a thread-local Lark parser.
+
+    Identical delay triples share one (immutable) ``Values`` object.
+    """
     parser = get_parser()
     return parser.parse(input_text)
 
 
 def parse_sdf_file(filepath: Path | str) -> SDFFile:
-    """Parse an SDF file from disk using a thread-local Lark parser."""
+    """Parse an SDF file from disk using a thread-local Lark parser.
+
+    As with :func:`parse_sdf`, identical delay triples share one ``Values``.
+    """
     parser = get_parser()
     return parser.parse_file(filepath)
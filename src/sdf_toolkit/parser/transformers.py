@@ -1,14 +1,17 @@
 """SDF parse tree transformer that converts Lark trees into data structures."""
 
+import sys
+from math import copysign
 from typing import TypeVar
 
-from lark import Token, Transformer, v_args
+from lark import Token, Transformer_NonRecursive, v_args
 
 from sdf_toolkit.core.model import (
     BaseEntry,
     DelayPaths,
     Device,
     EdgeType,
+    HeaderField,
     Hold,
     Interconnect,
     Iopath,
@@ -28,10 +31,18 @@ from sdf_toolkit.core.model import (
 
 _TC = TypeVar("_TC", bound=TimingCheck)
 
+_HEADER_KEYS = frozenset(HeaderField)
+
 
 def remove_quotation(s: str) -> str:
-    """Remove quotation marks from string."""
-    return s.replace('"', "")
+    """Strip the surrounding quotation marks from a QSTRING token.
+
+    The grammar only allows quotes at either end of a QSTRING, so slicing
+    them off avoids scanning and copying the interior of the string.
+    """
+    if len(s) >= 2 and s[0] == '"' and s[-1] == '"':
+        return s[1:-1]
+    return s
 
 
 def _format_value(val: float | None) -> str:
@@ -48,36 +59,35 @@ def _format_values_triple(v: Values) -> str:
     return ":".join(_format_value(val) for val in (v.min, v.avg, v.max))
 
 
-class SDFTransformer(Transformer):
+class SDFTransformer(Transformer_NonRecursive):
     """Transformer that processes the SDF parse tree into data structures."""
 
     def __init__(self) -> None:
         super().__init__()
         self.sdf_file_obj = SDFFile()
         self.delays_list: list[BaseEntry] = []
+        # Identical triples are very common (many instances of one cell
+        # share the same delays), so each distinct (min, avg, max) is built
+        # once per parse and shared by every entry that uses it.
+        self._values_cache: dict[
+            tuple[float | None, float | None, float | None], Values
+        ] = {}
 
     # ── Top-level structure ──────────────────────────────────────────
 
     @v_args(inline=True)
-    def sdf_file(self, _tag: Token, *items: dict[str, str]) -> SDFFile:
+    def sdf_file(self, _tag: Token, *items: dict[str, str] | None) -> SDFFile:
         """Process the top-level SDF file structure."""
+        header = self.sdf_file_obj.header
         for item in items:
-            if isinstance(item, dict):
-                for key, value in item.items():
-                    if hasattr(self.sdf_file_obj.header, key):
-                        setattr(self.sdf_file_obj.header, key, value)
+            # Cells are stored as a side effect and yield None.
+            if item is None:
+                continue
+            for key, value in item.items():
+                if key in _HEADER_KEYS:
+                    setattr(header, key, value)
         return self.sdf_file_obj
 
-    @v_args(inline=True)
-    def sdf_item(self, item: dict[str, str]) -> dict[str, str]:
-        """Process individual SDF items (header or cell)."""
-        return item
-
-    @v_args(inline=True)
-    def sdf_header_item(self, item: dict[str, str]) -> dict[str, str]:
-        """Pass through header items."""
-        return item
-
     # ── Header fields ────────────────────────────────────────────────
 
     @v_args(inline=True)
@@ -140,39 +150,40 @@ class SDFTransformer(Transformer):
     # ── Value processing ─────────────────────────────────────────────
 
     @v_args(inline=True)
-    def rvalue(self, *args: float | Values | Token | None) -> Values:
-        """Process single value or real triple."""
-        for arg in args:
-            if isinstance(arg, Values):
-                return arg
-            if isinstance(arg, float):
-                return Values(min=None, avg=arg, max=None)
-            if isinstance(arg, Token) and arg.type == "FLOAT":
-                return Values(min=None, avg=float(arg), max=None)
-        return Values()
-
-    @v_args(inline=True)
-    def real_triple(self, min_val: Token, avg_val: Token, max_val: Token) -> Values:
-        """Process real triple (min:avg:max)."""
-        return Values(
-            min=float(min_val) if min_val is not None else None,
-            avg=float(avg_val) if avg_val is not None else None,
-            max=float(max_val) if max_val is not None else None,
-        )
+    def rvalue_scalar(self, value: float) -> Values:
+        """Process a bare single value, stored as the typical (avg) value."""
+        return self._values(None, value, None)
 
     @v_args(inline=True)
-    def delval_list(self, *items: Values | None) -> DelayPaths:
-        """Process delay value list (1, 2, or 3 real triples)."""
-        valid_items = [item for item in items if isinstance(item, Values)]
+    def rvalue_triple(self, triple: Values | None) -> Values:
+        """Process a parenthesised triple; ``()`` yields an empty Values."""
+        return triple if triple is not None else self._values(None, None, None)
 
-        if len(valid_items) == 1:
-            return DelayPaths(nominal=valid_items[0])
-        if len(valid_items) == 2:
-            return DelayPaths(fast=valid_items[0], slow=valid_items[1])
-        if len(valid_items) == 3:
-            return DelayPaths(
-                fast=valid_items[0], nominal=valid_items[1], slow=valid_items[2]
-            )
+    @v_args(inline=True)
+    def real_triple(
+        self, min_val: float | None, avg_val: float | None, max_val: float | None
+    ) -> Values:
+        """Process real triple (min:avg:max).
+
+        Each optional ``[FLOAT]`` slot arrives at its fixed position, already
+        converted by the ``FLOAT`` terminal callback, or as None when the
+        slot is empty. No shape detection is needed.
+        """
+        return self._values(min_val, avg_val, max_val)
+
+    @v_args(inline=True)
+    def delval_list(self, *items: Values) -> DelayPaths:
+        """Process delay value list (1, 2, or 3 real triples).
+
+        Every child is an ``rvalue``, which always yields a Values, so the
+        items need no filtering.
+        """
+        if len(items) == 1:
+            return DelayPaths(nominal=items[0])
+        if len(items) == 2:
+            return DelayPaths(fast=items[0], slow=items[1])
+        if len(items) == 3:
+            return DelayPaths(fast=items[0], nominal=items[1], slow=items[2])
         return DelayPaths(nominal=Values())
 
     # ── Cell structure ───────────────────────────────────────────────
@@ -183,47 +194,56 @@ class SDFTransformer(Transformer):
         celltype: str,
         instance: str | None,
         delays: None = None,
-    ) -> dict[str, str]:
-        """Process individual cell definition."""
+    ) -> None:
+        """Process individual cell definition.
+
+        The cell is stored on ``sdf_file_obj`` directly; nothing is returned
+        so no per-cell value is kept alive in the tree until ``sdf_file``.
+        """
         inst = str(instance) if instance is not None else ""
-        self._add_cell(str(celltype), inst)
+        cell_dict = self._add_cell(str(celltype), inst)
         if delays is not None:
-            self._add_delays_to_cell(str(celltype), inst, self.delays_list)
-        self.delays_list = []
-        return {}
+            self._add_delays_to_cell(cell_dict, self.delays_list)
+        # Clear in place rather than rebinding so the list object (and any
+        # bound methods taken from it) stays the same for the whole parse.
+        self.delays_list.clear()
 
     @v_args(inline=True)
     def celltype(self, val: Token) -> str:
-        """Process cell type."""
-        return remove_quotation(str(val))
+        """Process cell type.
+
+        Cell type names repeat across every instance of a cell, so they are
+        interned to share one string object per distinct name.
+        """
+        return sys.intern(remove_quotation(str(val)))
 
     @v_args(inline=True)
     def instance(self, val: Token | None = None) -> str | None:
-        """Process instance name."""
+        """Process instance name.
+
+        Instance names key the cells dict and every per-instance lookup
+        downstream, so they are interned like cell types.
+        """
         if val is None:
             return None
-        return str(val)
+        return sys.intern(str(val))
 
     # ── Delay blocks ─────────────────────────────────────────────────
 
-    @v_args(inline=True)
-    def delay_entry(self, item: BaseEntry) -> BaseEntry:
-        """Unwrap delay entry."""
-        return item
-
     def _collect_delays(
         self, delays: tuple[BaseEntry | tuple[BaseEntry, ...], ...], *, flag: str
     ) -> None:
         """Flatten delay entries and set the given boolean flag on each."""
+        append = self.delays_list.append
         for d in delays:
             if isinstance(d, tuple):
                 for sub_d in d:
                     if isinstance(sub_d, BaseEntry):
                         setattr(sub_d, flag, True)
-                        self.delays_list.append(sub_d)
+                        append(sub_d)
             elif isinstance(d, BaseEntry):
                 setattr(d, flag, True)
-                self.delays_list.append(d)
+                append(d)
 
     @v_args(inline=True)
     def absolute(self, *delays: BaseEntry | tuple[BaseEntry, ...]) -> None:
@@ -295,42 +315,44 @@ class SDFTransformer(Transformer):
 
     @v_args(inline=True)
     def port_spec(self, *args: Token) -> PortSpec:
-        """Process port specification."""
+        """Process port specification.
+
+        Port names are interned since the same pins appear on many entries.
+        """
         if len(args) == 1:
-            return PortSpec(port=str(args[0]), port_edge=None)
+            return PortSpec(port=sys.intern(str(args[0])), port_edge=None)
         if len(args) == 2:
-            return PortSpec(port=str(args[1]), port_edge=EdgeType(str(args[0]).lower()))
+            return PortSpec(
+                port=sys.intern(str(args[1])),
+                port_edge=EdgeType(str(args[0]).lower()),
+            )
         raise ValueError(f"Invalid port_spec args: {args}")
 
     @v_args(inline=True)
-    def port_condition(self, token: Token) -> str:
-        """Process port condition (posedge/negedge)."""
-        return str(token)
-
-    @v_args(inline=True)
-    def timing_port(self, *args: PortSpec | str) -> TimingPortSpec:
+    def timing_port(self, *args: PortSpec | str) -> PortSpec:
         """Process timing port with optional condition.
 
         Grammar: ``timing_port: port_spec | "(" "COND" equation port_spec ")"``
 
         Receives either 1 arg (bare port_spec) or 2 args (equation, port_spec).
+        A bare port_spec is returned as-is: PortSpec is frozen, so sharing it
+        is safe, and only conditional ports need a TimingPortSpec.
         """
         if len(args) == 1:
             ps = args[0]
             if not isinstance(ps, PortSpec):
                 raise TypeError(f"Expected PortSpec, got {type(ps).__name__}")
-            return TimingPortSpec(port=ps.port, port_edge=ps.port_edge)
+            return ps
 
         if len(args) == 2:
             condition, ps = args
             if not isinstance(ps, PortSpec):
                 raise TypeError(f"Expected PortSpec, got {type(ps).__name__}")
-            cond_eq = str(condition) if condition else ""
             return TimingPortSpec(
                 port=ps.port,
                 port_edge=ps.port_edge,
                 cond=True,
-                cond_equation=cond_eq,
+                cond_equation=condition,
             )
 
         raise ValueError(f"Invalid timing_port args: {args}")
@@ -340,16 +362,17 @@ class SDFTransformer(Transformer):
     def _make_timing_check(
         self,
         cls: type[_TC],
-        to_port: TimingPortSpec,
-        from_port: TimingPortSpec,
+        to_port: PortSpec,
+        from_port: PortSpec,
         paths: DelayPaths,
     ) -> _TC:
         """Build a timing check entry from port specs and delay paths."""
+        is_cond = isinstance(from_port, TimingPortSpec) and from_port.cond
         return cls(
             name=f"{cls.__name__.lower()}_{from_port.port}_{to_port.port}",
             is_timing_check=True,
-            is_cond=from_port.cond,
-            cond_equation=from_port.cond_equation,
+            is_cond=is_cond,
+            cond_equation=from_port.cond_equation if is_cond else None,
             from_pin=from_port.port,
             to_pin=to_port.port,
             from_pin_edge=from_port.port_edge,
@@ -359,7 +382,7 @@ class SDFTransformer(Transformer):
 
     @v_args(inline=True)
     def setup_check(
-        self, to_port: TimingPortSpec, from_port: TimingPortSpec, values: Values
+        self, to_port: PortSpec, from_port: PortSpec, values: Values
     ) -> Setup:
         """Process setup timing check."""
         paths = DelayPaths(nominal=values)
@@ -367,7 +390,7 @@ class SDFTransformer(Transformer):
 
     @v_args(inline=True)
     def hold_check(
-        self, to_port: TimingPortSpec, from_port: TimingPortSpec, values: Values
+        self, to_port: PortSpec, from_port: PortSpec, values: Values
     ) -> Hold:
         """Process hold timing check."""
         paths = DelayPaths(nominal=values)
@@ -375,7 +398,7 @@ class SDFTransformer(Transformer):
 
     @v_args(inline=True)
     def removal_check(
-        self, to_port: TimingPortSpec, from_port: TimingPortSpec, values: Values
+        self, to_port: PortSpec, from_port: PortSpec, values: Values
     ) -> Removal:
         """Process removal timing check."""
         paths = DelayPaths(nominal=values)
@@ -383,14 +406,14 @@ class SDFTransformer(Transformer):
 
     @v_args(inline=True)
     def recovery_check(
-        self, to_port: TimingPortSpec, from_port: TimingPortSpec, values: Values
+        self, to_port: PortSpec, from_port: PortSpec, values: Values
     ) -> Recovery:
         """Process recovery timing check."""
         paths = DelayPaths(nominal=values)
         return self._make_timing_check(Recovery, to_port, from_port, paths)
 
     @v_args(inline=True)
-    def width_check(self, port: TimingPortSpec, values: Values) -> Width:
+    def width_check(self, port: PortSpec, values: Values) -> Width:
         """Process width timing check."""
         paths = DelayPaths(nominal=values)
         return self._make_timing_check(Width, port, port, paths)
@@ -398,8 +421,8 @@ class SDFTransformer(Transformer):
     @v_args(inline=True)
     def setuphold_check(
         self,
-        to_port: TimingPortSpec,
-        from_port: TimingPortSpec,
+        to_port: PortSpec,
+        from_port: PortSpec,
         setup_val: Values,
         hold_val: Values,
     ) -> SetupHold:
@@ -407,11 +430,6 @@ class SDFTransformer(Transformer):
         paths = DelayPaths(setup=setup_val, hold=hold_val)
         return self._make_timing_check(SetupHold, to_port, from_port, paths)
 
-    @v_args(inline=True)
-    def t_check(self, item: BaseEntry) -> BaseEntry:
-        """Pass through timing check entry."""
-        return item
-
     @v_args(inline=True)
     def timing_check_list(self, *items: BaseEntry) -> None:
         """Process timing check list."""
@@ -428,22 +446,9 @@ class SDFTransformer(Transformer):
         return delays
 
     @v_args(inline=True)
-    def delay_condition(self, *args: str | Token) -> str:
-        """Handle delay condition."""
-        for arg in args:
-            if isinstance(arg, str) and arg not in ("(", ")"):
-                return arg
-        return "".join(str(a) for a in args if str(a) not in ("(", ")"))
-
-    @v_args(inline=True)
-    def equation(self, *items: str | Token) -> str:
-        """Process equation for conditions."""
-        return " ".join(str(item) for item in items)
-
-    @v_args(inline=True)
-    def equation_item(self, item: Token) -> str:
-        """Process equation items."""
-        return str(item)
+    def equation(self, *items: str | float) -> str:
+        """Process equation for conditions into its space-joined string form."""
+        return " ".join(map(str, items))
 
     # ── Constraints ──────────────────────────────────────────────────
 
@@ -474,27 +479,49 @@ class SDFTransformer(Transformer):
 
     # ── Helpers ──────────────────────────────────────────────────────
 
-    def _add_cell(self, name: str, instance: str) -> None:
-        """Add cell to cells dictionary."""
-        self.sdf_file_obj.cells.setdefault(name, {}).setdefault(instance, {})
+    def _values(
+        self, min_val: float | None, avg_val: float | None, max_val: float | None
+    ) -> Values:
+        """Return the shared Values for a triple, creating it on first use.
+
+        Triples containing ``-0.0`` are never shared, because ``-0.0 == 0.0``
+        would otherwise let them alias a positive-zero triple.
+        """
+        key = (min_val, avg_val, max_val)
+        if 0.0 in key and any(
+            v is not None and v == 0.0 and copysign(1.0, v) < 0 for v in key
+        ):
+            return Values(min_val, avg_val, max_val)
+        values = self._values_cache.get(key)
+        if values is None:
+            values = self._values_cache[key] = Values(min_val, avg_val, max_val)
+        return values
+
+    def _add_cell(self, name: str, instance: str) -> dict[str, BaseEntry]:
+        """Add cell to cells dictionary and return its entry dict."""
+        return self.sdf_file_obj.cells.setdefault(name, {}).setdefault(instance, {})
 
     def _add_delays_to_cell(
         self,
-        celltype: str,
-        instance: str,
+        cell_dict: dict[str, BaseEntry],
         delays: list[BaseEntry],
     ) -> None:
         """Add delays to a cell, appending _1, _2, etc. on name collision."""
-        cell_dict = self.sdf_file_obj.cells[celltype][instance]
+        setdefault = cell_dict.setdefault
+        # Next suffix to try per base name, so N entries sharing a name cost
+        # O(N) probes instead of O(N**2).
+        name_counts: dict[str, int] = {}
         for entry in delays:
             base_name = entry.name
-            key = base_name
-            if key in cell_dict:
-                counter = 1
-                while f"{base_name}_{counter}" in cell_dict:
-                    counter += 1
-                key = f"{base_name}_{counter}"
-                entry.name = key
+            # Common case: the name is free and a single hash probe stores it.
+            if setdefault(base_name, entry) is entry:
+                continue
+            counter = name_counts.get(base_name, 1)
+            while f"{base_name}_{counter}" in cell_dict:
+                counter += 1
+            name_counts[base_name] = counter + 1
+            key = f"{base_name}_{counter}"
+            entry.name = key
             cell_dict[key] = entry
 
     # ── Terminal values ──────────────────────────────────────────────
@@ -504,10 +531,10 @@ class SDFTransformer(Transformer):
         """Convert STRING token to str."""
         return str(value)
 
-    @v_args(inline=True)
-    def FLOAT(self, value: Token) -> float:  # noqa: N802
-        """Convert FLOAT token to float."""
-        return float(value)
+    # Bound to the builtin directly so each FLOAT token is converted by a
+    # single C call, with no Python frame or v_args wrapper per token.
+    # ``real_triple`` and ``rvalue_scalar`` therefore receive floats.
+    FLOAT = float
 
     @v_args(inline=True)
     def QSTRING(self, value: Token) -> str:  # noqa: N802
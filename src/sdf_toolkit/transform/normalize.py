@@ -2,7 +2,13 @@
 
 import copy
 
-from sdf_toolkit.core.model import DelayField, DelayPaths, SDFFile, Values
+from sdf_toolkit.core.model import (
+    DELAY_FIELDS,
+    BaseEntry,
+    DelayPaths,
+    SDFFile,
+    Values,
+)
 from sdf_toolkit.core.utils import get_scale_fs
 
 
@@ -53,38 +59,72 @@ def normalize_delays(sdf: SDFFile, target_timescale: str) -> SDFFile:
     target_fs = get_scale_fs(target_timescale)
     ratio = source_fs / target_fs
 
-    result = copy.deepcopy(sdf)
-    result.header.timescale = target_timescale
+    header = copy.copy(sdf.header)
+    header.timescale = target_timescale
 
-    for instances in result.cells.values():
-        for entries in instances.values():
-            for entry in entries.values():
-                _scale_delay_paths(entry.delay_paths, ratio)
+    # One pass that copies each entry and builds its scaled delays directly,
+    # instead of deep-copying every Values only to replace it afterwards.
+    # The other entry fields are immutable, so a shallow copy is enough.
+    cells = {
+        cell_type: {
+            instance: {
+                name: _scaled_entry(entry, ratio) for name, entry in entries.items()
+            }
+            for instance, entries in instances.items()
+        }
+        for cell_type, instances in sdf.cells.items()
+    }
+    return SDFFile(header=header, cells=cells)
 
-    return result
 
+def _scaled_entry(entry: BaseEntry, ratio: float) -> BaseEntry:
+    """Return a copy of *entry* with its delays scaled by *ratio*.
 
-def _scale_delay_paths(
-    delay_paths: DelayPaths | None,
-    ratio: float,
-) -> None:
-    """Scale all non-None fields of *delay_paths* in place by *ratio*.
+    Parameters
+    ----------
+    entry : BaseEntry
+        The entry to copy. It is not modified.
+    ratio : float
+        The multiplicative scaling factor.
+
+    Returns
+    -------
+    BaseEntry
+        A shallow copy of *entry* owning a new, scaled DelayPaths.
+    """
+    scaled = copy.copy(entry)
+    if entry.delay_paths is not None:
+        scaled.delay_paths = _scale_delay_paths(entry.delay_paths, ratio)
+    return scaled
+
+
+def _scale_values(values: Values | None, ratio: float) -> Values | None:
+    """Return *values* with every non-None field multiplied by *ratio*."""
+    if values is None:
+        return None
+    vmin, vavg, vmax = values.min, values.avg, values.max
+    return Values(
+        vmin * ratio if vmin is not None else None,
+        vavg * ratio if vavg is not None else None,
+        vmax * ratio if vmax is not None else None,
+    )
+
+
+def _scale_delay_paths(delay_paths: DelayPaths, ratio: float) -> DelayPaths:
+    """Return a new DelayPaths with all non-None fields scaled by *ratio*.
 
     Parameters
     ----------
-    delay_paths : DelayPaths | None
-        The delay paths to scale. If None, this is a no-op.
+    delay_paths : DelayPaths
+        The delay paths to scale. They are not modified.
     ratio : float
         The multiplicative scaling factor.
+
+    Returns
+    -------
+    DelayPaths
+        The scaled delay paths.
     """
-    if delay_paths is None:
-        return
-
-    for field_name in DelayField:
-        values: Values | None = getattr(delay_paths, field_name)
-        if values is not None:
-            setattr(
-                delay_paths,
-                field_name,
-                values._map_fields(lambda v: v * ratio),  # noqa: SLF001
-            )
+    return DelayPaths(
+        *[_scale_values(getattr(delay_paths, name), ratio) for name in DELAY_FIELDS]
+    )
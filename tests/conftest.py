@@ -16,3 +16,9 @@ def spec1_graph() -> TimingGraph:
     sdf_content = (DATA_DIR / "spec-example1.sdf").read_text()
     sdf = parse_sdf(sdf_content)
     return TimingGraph(sdf)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory, monkeypatch) -> None:
+    """Point the CLI's parse cache at a per-test directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
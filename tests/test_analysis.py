@@ -1,5 +1,6 @@
 import pytest
 
+from sdf_toolkit.core import pathgraph
 from sdf_toolkit.core.model import DelayPaths, SDFFile, SDFHeader, Values
 from sdf_toolkit.core.pathgraph import (
     RankedPath,
@@ -46,6 +47,26 @@ class TestGetScalar:
         assert dp.get_scalar() == 3.0
 
 
+class TestScalarGetter:
+    @pytest.mark.parametrize("field", ["nominal", "fast", "slow"])
+    @pytest.mark.parametrize("metric", ["min", "avg", "max"])
+    def test_matches_get_scalar(self, field: str, metric: str) -> None:
+        get = DelayPaths.scalar_getter(field, metric)
+        dp = DelayPaths(
+            fast=Values(min=1.0, avg=None, max=3.0),
+            slow=Values(min=4.0, avg=5.0, max=6.0),
+        )
+        assert get(dp) == dp.get_scalar(field, metric)
+
+    def test_invalid_field(self) -> None:
+        with pytest.raises(ValueError, match="Invalid field"):
+            DelayPaths.scalar_getter("invalid", "max")
+
+    def test_invalid_metric(self) -> None:
+        with pytest.raises(ValueError, match="Invalid metric"):
+            DelayPaths.scalar_getter("slow", "invalid")
+
+
 class TestStartpointsEndpoints:
     def test_startpoints(self, spec1_graph: TimingGraph) -> None:
         starts = spec1_graph.startpoints()
@@ -99,6 +120,14 @@ class TestRankPaths:
         for rp in ranked:
             assert rp.scalar is not None
 
+    def test_rank_paths_parallel_matches_sequential(
+        self, spec1_graph: TimingGraph, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(pathgraph, "_PARALLEL_MIN_PATHS", 1)
+        sequential = rank_paths(spec1_graph, "P1/z", "P2/i")
+        parallel = rank_paths(spec1_graph, "P1/z", "P2/i", n_jobs=2)
+        assert parallel == sequential
+
 
 class TestCriticalPath:
     def test_critical_path(self, spec1_graph: TimingGraph) -> None:
@@ -117,6 +146,24 @@ class TestCriticalPath:
         cp = critical_path(spec1_graph, "P2/i", "P1/z")
         assert cp is None
 
+    @pytest.mark.parametrize(
+        ("field", "metric"),
+        [("slow", "max"), ("fast", "min"), ("slow", "avg"), ("nominal", "max")],
+    )
+    def test_critical_path_matches_rank_paths(
+        self, spec1_graph: TimingGraph, field: str, metric: str
+    ) -> None:
+        sources = sorted(spec1_graph.startpoints())
+        sinks = sorted(spec1_graph.endpoints())
+        for src in sources:
+            for snk in sinks:
+                ranked = rank_paths(spec1_graph, src, snk, field, metric)
+                cp = critical_path(spec1_graph, src, snk, field, metric)
+                if not ranked:
+                    assert cp is None
+                    continue
+                assert cp == ranked[0]
+
 
 class TestComputeSlack:
     def test_positive_slack(self, spec1_graph: TimingGraph) -> None:
@@ -1,7 +1,9 @@
 """Tests for Verilog SDF back-annotation."""
 
+import io
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
@@ -25,6 +27,7 @@ from sdf_toolkit.core.model import (
 )
 from sdf_toolkit.io.annotate import (
     SpecifyEntry,
+    VerilogBackend,
     WireDelay,
     YosysCell,
     YosysDesign,
@@ -41,12 +44,28 @@ from sdf_toolkit.io.annotate import (
     run_yosys,
     select_worst_case_delays,
 )
+from sdf_toolkit.io.verilog import scan_verilog
 
 DATA_DIR = (Path(__file__).parent / "data").resolve()
 
 HAS_YOSYS = shutil.which("yosys") is not None
 
 
+class TestSlots:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            YosysCell(name="u0", cell_type="INV"),
+            YosysModule(name="INV"),
+            YosysDesign(),
+            SpecifyEntry(kind="iopath", from_pin="i"),
+            WireDelay(net_name="n1", rise_delay="1"),
+        ],
+    )
+    def test_no_instance_dict(self, obj: object) -> None:
+        assert not hasattr(obj, "__dict__")
+
+
 # ── Yosys JSON parsing ──────────────────────────────────────────────
 
 
@@ -255,6 +274,24 @@ class TestSelectWorstCaseDelays:
         result = select_worst_case_delays(entries, "nominal", "max")
         assert len(result) == 2
 
+    def test_three_way_collision_keeps_max(self) -> None:
+        entries = [
+            Iopath(
+                name=str(i),
+                from_pin="i",
+                to_pin="z",
+                delay_paths=DelayPaths(nominal=Values(d, None, d)) if d else None,
+                is_absolute=True,
+            )
+            for i, d in enumerate([None, 3.0, 5.0, 4.0])
+        ]
+        result = select_worst_case_delays(entries, "nominal", "max")
+        assert [e.name for e in result] == ["2"]
+
+    def test_invalid_field(self) -> None:
+        with pytest.raises(ValueError, match="Invalid field"):
+            select_worst_case_delays([], "bogus", "max")
+
 
 # ── entries_to_specify ──────────────────────────────────────────────
 
@@ -641,6 +678,15 @@ class TestInsertWireDelays:
         result = insert_wire_delays(verilog, delays)
         assert result == verilog  # Already has #, should not re-annotate
 
+    def test_many_nets(self) -> None:
+        verilog = "".join(f"wire n{i};\n" for i in range(200)) + "wire m0;\n"
+        delays = [WireDelay(net_name=f"n{i}", rise_delay=str(i)) for i in range(100)]
+        result = insert_wire_delays(verilog, delays)
+        assert "wire #(7) n7;" in result
+        # "n1" is listed before "n150" and is a substring of it
+        assert "wire #(1) n150;" in result
+        assert result.endswith("wire m0;\n")
+
 
 # ── Resolve INTERCONNECT ────────────────────────────────────────────
 
@@ -694,6 +740,267 @@ class TestResolveInterconnects:
         result = resolve_interconnects(entries, design, "top", "/")
         assert result == []
 
+    def test_skips_unresolvable_pins(self) -> None:
+        entries = [
+            Interconnect(
+                name=f"ic_{to_pin}",
+                from_pin="a",
+                to_pin=to_pin,
+                delay_paths=DelayPaths(nominal=Values(1.0, None, 1.0)),
+                is_absolute=True,
+            )
+            for to_pin in ["u0", "u9/i", "u0/z", "u0/k", "u0/i"]
+        ]
+        design = YosysDesign(
+            modules={
+                "top": YosysModule(
+                    name="top",
+                    cells={
+                        "u0": YosysCell(
+                            name="u0",
+                            cell_type="INV",
+                            connections={"i": ["x", 3], "z": ["0"], "k": [7]},
+                        ),
+                    },
+                    netnames={"n3": [3]},
+                ),
+            },
+        )
+        result = resolve_interconnects(entries, design, "top", "/")
+        assert [wd.net_name for wd in result] == ["n3"]
+
+
+def _fake_yosys(stdout: bytes, returncode: int = 0, stderr: bytes = b""):
+    """Build a stand-in for ``subprocess.Popen`` that replays canned output."""
+
+    class FakePopen:
+        def __init__(self, _cmd, **kwargs) -> None:
+            self.stdout = io.BytesIO(stdout)
+            kwargs["stderr"].write(stderr)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc) -> None:
+            self.stdout.close()
+
+        def wait(self) -> int:
+            return returncode
+
+    return patch("sdf_toolkit.io.annotate.subprocess.Popen", FakePopen)
+
+
+class TestRunYosysOutput:
+    """Decoding of the Yosys JSON dump, with the subprocess mocked out."""
+
+    def test_decodes_bytes_stdout(self, tmp_path: Path) -> None:
+        with _fake_yosys(b'{"modules": {"INV": {}}}'):
+            assert run_yosys(tmp_path / "x.v") == {"modules": {"INV": {}}}
+
+    def test_failure_reports_stderr(self, tmp_path: Path) -> None:
+        with (
+            _fake_yosys(b"", returncode=1, stderr=b"syntax error"),
+            pytest.raises(RuntimeError, match="syntax error"),
+        ):
+            run_yosys(tmp_path / "x.v")
+
+    def test_missing_yosys(self, tmp_path: Path) -> None:
+        with (
+            patch(
+                "sdf_toolkit.io.annotate.subprocess.Popen",
+                side_effect=FileNotFoundError,
+            ),
+            pytest.raises(FileNotFoundError, match="Yosys is required"),
+        ):
+            run_yosys(tmp_path / "x.v")
+
+
+# ── Built-in Verilog scanner ────────────────────────────────────────
+
+_NETLIST = r"""
+// top-level netlist
+(* keep *) module system #(parameter W = 2) (clk, d, q);
+  input clk;
+  input [1:0] d;
+  output q;
+  wire [1:0] bus; /* two-bit
+                     bus */
+  wire \B1/n ;
+  always @(*) begin bus = d; end
+  INV \B1/C1  (.i(d[1]), .z(\B1/n ));
+  AND2 #(.W(W)) u2 (.i1(bus[0]), .i2(1'b1), .z(q));
+  OR2 u3 (.i1({d[0], clk}), .i2(), .z());
+endmodule
+"""
+
+
+class TestScanVerilog:
+    """Test the Yosys-free Verilog scanner."""
+
+    def test_cell_library(self) -> None:
+        design = parse_yosys_json(scan_verilog((DATA_DIR / "test_cells.v").read_text()))
+        assert list(design.modules) == ["INV", "OR2", "AND2"]
+        inv = design.modules["INV"]
+        assert inv.ports["i"].direction == "input"
+        assert inv.ports["z"].direction == "output"
+
+    def test_netlist_structure(self) -> None:
+        top = scan_verilog(_NETLIST)["modules"]["system"]
+        assert top["ports"]["d"] == {"direction": "input", "bits": [3, 4]}
+        assert top["netnames"]["bus"] == {"bits": [6, 7]}
+        assert top["cells"]["B1/C1"] == {
+            "type": "INV",
+            "connections": {"i": [4], "z": [8]},
+        }
+        assert top["cells"]["u2"]["connections"] == {
+            "i1": [6],
+            "i2": ["1"],
+            "z": [5],
+        }
+        # Concatenations list bits LSB first, like Yosys
+        assert top["cells"]["u3"]["connections"]["i1"] == [2, 3]
+
+    def test_resolves_interconnects(self) -> None:
+        design = parse_yosys_json(scan_verilog(_NETLIST))
+        entries = [
+            Interconnect(
+                name="ic",
+                from_pin="x",
+                to_pin="B1/C1/z",
+                delay_paths=DelayPaths(nominal=Values(1.0, None, 1.0)),
+                is_absolute=True,
+            )
+        ]
+        result = resolve_interconnects(entries, design, "system", "/")
+        assert [wd.net_name for wd in result] == ["B1/n"]
+
+
+class TestAnnotateScanBackend:
+    """End-to-end annotation without Yosys."""
+
+    def test_annotate_spec_example1(self) -> None:
+        result = annotate_verilog(
+            sdf_path=DATA_DIR / "spec-example1.sdf",
+            verilog_path=DATA_DIR / "test_cells.v",
+            backend=VerilogBackend.SCAN,
+        )
+        assert "(i => z) = (0.38::0.38, 0.38::0.38);" in result
+        assert result.count("endspecify") == 3
+
+    def test_cli_backend_option(self) -> None:
+        result = CliRunner().invoke(
+            app,
+            [
+                "annotate",
+                str(DATA_DIR / "spec-example1.sdf"),
+                str(DATA_DIR / "test_cells.v"),
+                "--backend",
+                "scan",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "endspecify" in result.stdout
+
+    def test_cli_rejects_unknown_backend(self) -> None:
+        result = CliRunner().invoke(
+            app,
+            [
+                "annotate",
+                str(DATA_DIR / "spec-example1.sdf"),
+                str(DATA_DIR / "test_cells.v"),
+                "--backend",
+                "fast",
+            ],
+        )
+        assert result.exit_code == 2
+        assert not isinstance(result.exception, ValueError)
+
+
+class TestAnnotateCache:
+    """The CLI reuses annotated output for unchanged inputs."""
+
+    @staticmethod
+    def _args(verilog: Path, *extra: str) -> list[str]:
+        sdf = str(DATA_DIR / "spec-example1.sdf")
+        return ["annotate", sdf, str(verilog), "--backend", "scan", *extra]
+
+    def test_second_run_skips_annotation(self) -> None:
+        runner = CliRunner()
+        args = self._args(DATA_DIR / "test_cells.v")
+        first = runner.invoke(app, args)
+        assert first.exit_code == 0
+        with patch(
+            "sdf_toolkit.io.annotate.annotate_verilog", side_effect=AssertionError
+        ):
+            second = runner.invoke(app, args)
+        assert second.exit_code == 0
+        assert second.stdout == first.stdout
+
+    def test_cached_output_file(self, tmp_path: Path) -> None:
+        runner = CliRunner()
+        expected = runner.invoke(app, self._args(DATA_DIR / "test_cells.v")).stdout
+        output = tmp_path / "out.v"
+        result = runner.invoke(
+            app, self._args(DATA_DIR / "test_cells.v", "-o", str(output))
+        )
+        assert result.exit_code == 0
+        assert output.read_text() + "\n" == expected
+
+    def test_no_cache_and_changed_input(self, tmp_path: Path) -> None:
+        runner = CliRunner()
+        verilog = tmp_path / "cells.v"
+        verilog.write_text((DATA_DIR / "test_cells.v").read_text())
+        assert runner.invoke(app, self._args(verilog)).exit_code == 0
+
+        with patch(
+            "sdf_toolkit.io.annotate.annotate_verilog", wraps=annotate_verilog
+        ) as run:
+            runner.invoke(app, self._args(verilog, "--no-cache"))
+            assert run.call_count == 1
+            verilog.write_text(verilog.read_text() + "\n")
+            runner.invoke(app, self._args(verilog))
+            assert run.call_count == 2
+
+    def test_yosys_version_is_part_of_key(self) -> None:
+        runner = CliRunner()
+        args = [
+            "annotate",
+            str(DATA_DIR / "spec-example1.sdf"),
+            str(DATA_DIR / "test_cells.v"),
+        ]
+        outputs = []
+        for version in ("Yosys 0.40", "Yosys 0.40", "Yosys 0.41"):
+            with (
+                patch("sdf_toolkit.io.annotate.yosys_version", return_value=version),
+                patch(
+                    "sdf_toolkit.io.annotate.annotate_verilog",
+                    return_value=f"// {version} run {len(outputs)}",
+                ),
+            ):
+                outputs.append(runner.invoke(app, args).stdout)
+        assert outputs == [
+            "// Yosys 0.40 run 0\n",
+            "// Yosys 0.40 run 0\n",
+            "// Yosys 0.41 run 2\n",
+        ]
+
+    def test_missing_yosys_is_not_cached(self) -> None:
+        runner = CliRunner()
+        args = [
+            "annotate",
+            str(DATA_DIR / "spec-example1.sdf"),
+            str(DATA_DIR / "test_cells.v"),
+        ]
+        with (
+            patch("sdf_toolkit.io.annotate.yosys_version", return_value=None),
+            patch(
+                "sdf_toolkit.io.annotate.annotate_verilog", return_value="// out"
+            ) as run,
+        ):
+            runner.invoke(app, args)
+            runner.invoke(app, args)
+        assert run.call_count == 2
+
 
 # ── Integration tests (require Yosys) ──────────────────────────────
 
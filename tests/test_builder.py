@@ -1,11 +1,14 @@
 """Tests for CellBuilder.add_entry collision handling."""
 
+import pytest
+
 from sdf_toolkit.core.builder import CellBuilder, SDFBuilder
 from sdf_toolkit.core.model import (
     BaseEntry,
     EntryType,
     Hold,
     Iopath,
+    Values,
 )
 
 
@@ -51,6 +54,34 @@ class TestAddEntry:
         assert e3.name == "iopath_A_B_1"
         assert len(entries) == 3
 
+    def test_collision_skips_existing_suffix(self):
+        cb, entries = _make_cell_builder()
+        cb.add_entry(Iopath(name="iopath_A_B_1", from_pin="A", to_pin="B"))
+        e1 = Iopath(name="iopath_A_B", from_pin="A", to_pin="B")
+        e2 = Iopath(name="iopath_A_B", from_pin="A", to_pin="B")
+        e3 = Iopath(name="iopath_A_B", from_pin="A", to_pin="B")
+
+        cb.add_entry(e1)
+        cb.add_entry(e2)
+        cb.add_entry(e3)
+
+        assert e2.name == "iopath_A_B_2"
+        assert e3.name == "iopath_A_B_3"
+        assert len(entries) == 4
+
+    def test_collisions_across_builders_for_same_cell(self):
+        builder = SDFBuilder()
+        first = builder.add_cell("cell", "inst")
+        second = builder.add_cell("cell", "inst")
+        names = []
+        for cb in (first, second, first, second):
+            entry = Iopath(name="iopath_A_B", from_pin="A", to_pin="B")
+            cb.add_entry(entry)
+            names.append(entry.name)
+
+        assert names == ["iopath_A_B", "iopath_A_B_1", "iopath_A_B_2", "iopath_A_B_3"]
+        assert len(builder.build().cells["cell"]["inst"]) == 4
+
 
 class TestCellBuilderDelegation:
     def test_set_header_via_cell_builder(self):
@@ -88,3 +119,83 @@ class TestCellBuilderDelegation:
         assert len(entries) == 1
         entry = next(iter(entries.values()))
         assert entry.type == EntryType.PATHCONSTRAINT
+
+
+class TestDelaysFromDict:
+    def test_partial_triples_and_unknown_fields(self):
+        sdf = (
+            SDFBuilder()
+            .add_cell("BUF", "b0")
+            .add_iopath(
+                "A",
+                "Y",
+                {"slow": {"max": 3.0}, "fast": {"min": 1.0, "avg": 2.0}, "x": {}},
+            )
+            .build()
+        )
+        dp = sdf.cells["BUF"]["b0"]["iopath_A_Y"].delay_paths
+        assert dp.slow == Values(None, None, 3.0)
+        assert dp.fast == Values(1.0, 2.0, None)
+        assert dp.nominal is None
+
+    def test_unexpected_value_key_raises(self):
+        with pytest.raises(TypeError, match="'slow' delay values: typ"):
+            SDFBuilder().add_cell("BUF", "b0").add_iopath(
+                "A", "Y", {"slow": {"min": 1.0, "typ": 2.0}}
+            )
+
+    def test_tuple_and_values_triples(self):
+        sdf = (
+            SDFBuilder()
+            .add_cell("BUF", "b0")
+            .add_iopath(
+                "A", "Y", {"slow": (1.0, 2.0, 3.0), "fast": Values(0.5, None, 1.0)}
+            )
+            .build()
+        )
+        dp = sdf.cells["BUF"]["b0"]["iopath_A_Y"].delay_paths
+        assert dp.slow == Values(1.0, 2.0, 3.0)
+        assert dp.fast == Values(0.5, None, 1.0)
+
+
+class TestAddEntries:
+    def test_matches_fluent_api(self):
+        delays = {"slow": (1.0, 2.0, 3.0)}
+        records = [
+            ("BUF", "b0", EntryType.IOPATH, "A", "Y", delays),
+            ("BUF", "b0", "iopath", "A", "Y", delays),
+            ("BUF", "b0", "port", "A", None, delays),
+            ("BUF", "b1", "interconnect", "b0/Y", "b1/A", delays),
+            ("FF", "r0", "setup", "D", "CLK", delays),
+            ("FF", "r0", "width", "CLK", None, delays),
+            ("FF", "r0", "pathconstraint", "D", "Q", delays),
+        ]
+        bulk = SDFBuilder().add_entries(records).build()
+        fluent = (
+            SDFBuilder()
+            .add_cell("BUF", "b0")
+            .add_iopath("A", "Y", delays)
+            .add_iopath("A", "Y", delays)
+            .add_port("A", delays)
+            .add_cell("BUF", "b1")
+            .add_interconnect("b0/Y", "b1/A", delays)
+            .add_cell("FF", "r0")
+            .add_setup("D", "CLK", delays)
+            .add_width("CLK", delays)
+            .add_path_constraint("D", "Q", delays)
+            .build()
+        )
+        assert bulk.to_dict() == fluent.to_dict()
+        assert list(bulk.cells["BUF"]["b0"]) == ["iopath_A_Y", "iopath_A_Y_1", "port_A"]
+
+    def test_unknown_entry_type_raises(self):
+        with pytest.raises(ValueError, match="Unknown entry type 'bogus'"):
+            SDFBuilder().add_entries([("BUF", "b0", "bogus", "A", "Y", {})])
+
+
+class TestSlots:
+    def test_builders_have_no_instance_dict(self):
+        builder = SDFBuilder()
+        cell_builder = builder.add_cell("BUF", "b0")
+        assert not hasattr(builder, "__dict__")
+        assert not hasattr(cell_builder, "__dict__")
@@ -1,5 +1,6 @@
 """Tests for sdfparse.py -- CLI entry point."""
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -31,3 +32,20 @@ class TestCLIMain:
             assert exc_info.value.code == 1
         captured = capsys.readouterr()
         assert "Error" in captured.out
+
+    def test_compact_output_by_default(self, capsys):
+        test_file = str(DATA_DIR / "empty.sdf")
+        with patch("sys.argv", ["sdf-toolkit", test_file]):
+            main()
+        out = capsys.readouterr().out
+        assert json.loads(out)["header"]
+        assert "\n" not in out.rstrip("\n")
+        assert ", " not in out
+
+    def test_pretty_output(self, capsys):
+        test_file = str(DATA_DIR / "empty.sdf")
+        with patch("sys.argv", ["sdf-toolkit", "--pretty", test_file]):
+            main()
+        out = capsys.readouterr().out
+        assert '\n  "header"' in out
+        assert json.loads(out)["header"]
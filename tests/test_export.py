@@ -1,4 +1,5 @@
 from sdf_toolkit.analysis.export import to_dot
+from sdf_toolkit.core.builder import SDFBuilder
 from sdf_toolkit.core.pathgraph import TimingGraph, critical_path
 
 
@@ -48,3 +49,36 @@ class TestToDotCluster:
         result = to_dot(spec1_graph, highlight_path=cp, cluster_by_instance=True)
         assert "subgraph cluster_" in result
         assert 'color="red"' in result
+
+    def test_clusters_sorted_by_instance(self) -> None:
+        delays = {"slow": {"min": 1.0, "avg": 1.0, "max": 1.0}}
+        sdf = (
+            SDFBuilder()
+            .add_cell("BUF", "a-b")
+            .add_iopath("Z", "A", delays)
+            .add_cell("BUF", "a")
+            .add_iopath("Y", "B", delays)
+            .build()
+        )
+        lines = to_dot(TimingGraph(sdf), cluster_by_instance=True).splitlines()
+        labels = [line.strip() for line in lines if line.startswith("    label=")]
+        assert labels == ['label="a";', 'label="a-b";']
+        first = lines.index('    label="a";')
+        assert lines[first + 1 : first + 3] == ['    "a/B";', '    "a/Y";']
+
+    def test_cluster_members_not_interleaved(self) -> None:
+        delays = {"slow": {"min": 1.0, "avg": 1.0, "max": 1.0}}
+        sdf = (
+            SDFBuilder()
+            .add_cell("BUF", "a")
+            .add_iopath("B", "x", delays)
+            .add_cell("BUF", "a/b")
+            .add_iopath("c", "d", delays)
+            .build()
+        )
+        result = to_dot(TimingGraph(sdf), cluster_by_instance=True)
+        assert result.count("subgraph cluster_") == 2
+        assert (
+            '    label="a";\n    "a/B";\n    "a/x";\n  }\n'
+            '  subgraph cluster_1 {\n    label="a/b";\n    "a/b/c";\n    "a/b/d";\n'
+        ) in result
@@ -0,0 +1,97 @@
+"""Tests for the orjson/stdlib JSON helpers."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from sdf_toolkit.core.model import DelayPaths, Values
+from sdf_toolkit.io import jsonio
+
+DOC = {"header": {"sdfversion": "3.0"}, "cells": [1, None, 2.5]}
+
+
+def _check_keys(obj: object) -> None:
+    """Raise like orjson does for a dict key that is not exactly ``str``."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if type(key) is not str:
+                msg = "Dict key must be str"
+                raise TypeError(msg)
+            _check_keys(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            _check_keys(value)
+
+
+class FakeOrjson:
+    """Stands in for orjson, recording each call."""
+
+    OPT_INDENT_2 = 1
+    OPT_NON_STR_KEYS = 2
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def dumps(self, obj: object, option: int = 0) -> bytes:
+        self.calls.append("dumps")
+        if not option & self.OPT_NON_STR_KEYS:
+            _check_keys(obj)
+        if option & self.OPT_INDENT_2:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: str | bytes) -> object:
+        self.calls.append("loads")
+        return json.loads(data)
+
+
+@pytest.fixture(params=[False, True], ids=["stdlib", "orjson"])
+def fake_orjson(request: pytest.FixtureRequest):
+    """Run a test once with the stdlib fallback and once with orjson."""
+    fake = FakeOrjson() if request.param else None
+    with patch("sdf_toolkit.io.jsonio.orjson", fake):
+        yield fake
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_dumps(fake_orjson: FakeOrjson | None, pretty: bool) -> None:
+    expected = (
+        json.dumps(DOC, indent=2) if pretty else json.dumps(DOC, separators=(",", ":"))
+    )
+    assert jsonio.dumps(DOC, pretty=pretty) == expected
+    if fake_orjson is not None:
+        assert fake_orjson.calls == ["dumps"]
+
+
+@pytest.mark.parametrize("data", [json.dumps(DOC), json.dumps(DOC).encode()])
+def test_loads(fake_orjson: FakeOrjson | None, data: str | bytes) -> None:
+    assert jsonio.loads(data) == DOC
+    if fake_orjson is not None:
+        assert fake_orjson.calls == ["loads"]
+
+
+@pytest.mark.usefixtures("fake_orjson")
+@pytest.mark.parametrize("pretty", [False, True])
+def test_echo(pretty: bool, capsys: pytest.CaptureFixture) -> None:
+    jsonio.echo(DOC, pretty=pretty)
+    assert capsys.readouterr().out == jsonio.dumps(DOC, pretty=pretty) + "\n"
+
+
+def test_echo_orjson_without_binary_buffer() -> None:
+    stream = io.StringIO()
+    with (
+        patch("sdf_toolkit.io.jsonio.orjson", FakeOrjson()),
+        patch("sys.stdout", stream),
+    ):
+        jsonio.echo(DOC)
+    assert stream.getvalue() == '{"header":{"sdfversion":"3.0"},"cells":[1,null,2.5]}\n'
+
+
+def test_enum_keys(fake_orjson: FakeOrjson | None) -> None:
+    delays = DelayPaths(slow=Values(1.0, None, 2.0)).to_dict()
+    assert jsonio.dumps(delays) == '{"slow":{"min":1.0,"avg":null,"max":2.0}}'
+    if fake_orjson is not None:
+        with pytest.raises(TypeError, match="must be str"):
+            fake_orjson.dumps(delays)
@@ -1,8 +1,13 @@
 """Tests for model.py -- dict protocol methods and to_dict."""
 
+import copy
+import dataclasses
+import pickle
+
 import pytest
 
 from sdf_toolkit.core.model import (
+    DELAY_FIELDS,
     BaseEntry,
     DelayPaths,
     EntryType,
@@ -122,6 +127,17 @@ class TestDelayPaths:
         dp = DelayPaths(nominal=v)
         assert dp["nominal"] is v
 
+    def test_pickle_and_copy_round_trip(self):
+        dp = DelayPaths(slow=Values(min=1.0, avg=None, max=3.0))
+        assert pickle.loads(pickle.dumps(dp)) == dp
+        clone = copy.deepcopy(dp)
+        assert clone == dp
+        assert clone.slow is not dp.slow
+
+    def test_delay_fields_match_declaration_order(self):
+        names = [f.name for f in dataclasses.fields(DelayPaths)]
+        assert list(DELAY_FIELDS) == names
+
 
 class TestBaseEntry:
     def test_to_dict(self):
@@ -1,7 +1,13 @@
+import importlib
+import re
+import statistics
+from types import SimpleNamespace
+
 import pytest
 from conftest import DATA_DIR
 
 from sdf_toolkit.analysis.diff import diff
+from sdf_toolkit.analysis.fused import compute_all
 from sdf_toolkit.analysis.query import query
 from sdf_toolkit.analysis.report import _format_float, generate_report
 from sdf_toolkit.analysis.stats import compute_stats
@@ -16,11 +22,18 @@ from sdf_toolkit.core.model import (
     SDFHeader,
     Values,
 )
-from sdf_toolkit.core.pathgraph import batch_endpoint_analysis
+from sdf_toolkit.core.pathgraph import (
+    TimingGraph,
+    batch_endpoint_analysis,
+    compute_slack,
+)
 from sdf_toolkit.parser.parser import parse_sdf
 from sdf_toolkit.transform.merge import ConflictStrategy, merge
 from sdf_toolkit.transform.normalize import normalize_delays
 
+# sdf_toolkit.analysis re-exports query(), which shadows the submodule name.
+query_module = importlib.import_module("sdf_toolkit.analysis.query")
+
 
 def _count_entries(cells: CellsDict) -> int:
     return sum(
@@ -69,6 +82,23 @@ class TestNormalize:
         normalize_delays(sdf, "1ns")
         assert sdf.header.timescale == original_ts
 
+    def test_result_does_not_share_mutable_state(self):
+        sdf = (
+            SDFBuilder()
+            .set_header(timescale="1ns")
+            .add_cell("BUF", "b0")
+            .add_iopath("A", "Y", {"slow": {"min": 1.0, "avg": None, "max": 3.0}})
+            .build()
+        )
+        result = normalize_delays(sdf, "1ps")
+        entry = sdf.cells["BUF"]["b0"]["iopath_A_Y"]
+        scaled = result.cells["BUF"]["b0"]["iopath_A_Y"]
+        assert scaled is not entry
+        assert scaled.delay_paths.slow == Values(1000.0, None, 3000.0)
+        assert scaled.delay_paths.fast is None
+        assert result.header is not sdf.header
+        assert entry.delay_paths.slow == Values(1.0, None, 3.0)
+
 
 class TestBuilder:
     def test_basic_build(self):
@@ -235,6 +265,41 @@ class TestValidate:
         issues = validate(sdf)
         assert any("multiple" in i.message.lower() for i in issues)
 
+    def test_parallel_matches_sequential(self):
+        good = DelayPaths(nominal=Values(min=1.0, avg=2.0, max=3.0))
+        cells: CellsDict = {
+            f"CELL{i}": {
+                f"u{i}": {
+                    "ok": BaseEntry(
+                        name="ok", from_pin="A", to_pin="Y", delay_paths=good
+                    ),
+                    "bad": BaseEntry(name="bad", delay_paths=None),
+                    "empty": BaseEntry(
+                        name="empty",
+                        from_pin="A",
+                        delay_paths=DelayPaths(slow=Values()),
+                    ),
+                },
+                "shared": {},
+            }
+            for i in range(200)
+        }
+        sdf = SDFFile(header=SDFHeader(), cells=cells)
+        assert validate(sdf, n_jobs=4) == validate(sdf)
+
+    def test_instance_under_three_cell_types(self):
+        sdf = SDFFile(
+            header=SDFHeader(timescale="1ps"),
+            cells={
+                "INV": {"u1": {}, "u2": {}},
+                "BUF": {"u1": {}},
+                "AND2": {"u1": {}},
+            },
+        )
+        issues = validate(sdf)
+        assert [i.instance for i in issues] == ["u1"]
+        assert issues[0].message.endswith("cell types: AND2, BUF, INV")
+
 
 class TestStats:
     def test_stats_from_file(self):
@@ -265,6 +330,23 @@ class TestStats:
         )
         assert has_expected_type
 
+    @pytest.mark.parametrize("name", ["bigchip.sdf", "test1.sdf"])
+    def test_stats_match_statistics_module(self, name):
+        sdf = parse_sdf((DATA_DIR / name).read_text())
+        stats = compute_stats(sdf, field="slow", metric="max")
+        scalars = [
+            scalar
+            for instances in sdf.cells.values()
+            for entries in instances.values()
+            for entry in entries.values()
+            if entry.delay_paths is not None
+            and (scalar := entry.delay_paths.get_scalar("slow", "max")) is not None
+        ]
+        assert stats.delay_min == min(scalars)
+        assert stats.delay_max == max(scalars)
+        assert stats.delay_median == statistics.median(scalars)
+        assert stats.delay_mean == pytest.approx(statistics.mean(scalars))
+
 
 class TestQuery:
     def test_filter_by_cell_type(self):
@@ -295,6 +377,19 @@ class TestQuery:
         result = query(sdf)
         assert _count_entries(result.cells) == _count_entries(sdf.cells)
 
+    def test_no_entry_filters_skip_predicate(self, monkeypatch):
+        def fail(entry, **kwargs):
+            raise AssertionError(f"predicate ran for {entry!r} with {kwargs}")
+
+        monkeypatch.setattr(query_module, "_entry_matches", fail)
+        sdf = parse_sdf((DATA_DIR / "spec-example1.sdf").read_text())
+        result = query(sdf, cell_types=["INV"])
+        assert _count_entries(result.cells) == _count_entries({"INV": sdf.cells["INV"]})
+
+    def test_no_filters_drops_empty_instances(self):
+        sdf = SDFBuilder().add_cell("BUF", "b0").build()
+        assert query(sdf).cells == {}
+
     def test_filter_preserves_header(self):
         sdf = parse_sdf((DATA_DIR / "spec-example1.sdf").read_text())
         result = query(sdf, cell_types=["INV"])
@@ -332,6 +427,55 @@ class TestQuery:
                         if scalar is not None:
                             assert scalar <= 0.5
 
+    def test_pin_pattern_uses_re2_when_available(self, monkeypatch):
+        compiled = []
+
+        class FakeRe2:
+            error = re.error
+            Options = SimpleNamespace
+
+            @staticmethod
+            def compile(pattern, options):
+                compiled.append((pattern, options.log_errors))
+                return re.compile(pattern)
+
+        monkeypatch.setattr(query_module, "re2", FakeRe2)
+        sdf = parse_sdf((DATA_DIR / "spec-example1.sdf").read_text())
+        result = query(sdf, pin_pattern="^z$")
+        assert compiled == [("^z$", False)]
+        assert _count_entries(result.cells) > 0
+
+    def test_pin_pattern_falls_back_when_re2_rejects(self, monkeypatch):
+        class FakeRe2:
+            error = re.error
+            Options = SimpleNamespace
+
+            @staticmethod
+            def compile(pattern, _options):
+                raise re.error(f"unsupported: {pattern}")
+
+        monkeypatch.setattr(query_module, "re2", FakeRe2)
+        sdf = parse_sdf((DATA_DIR / "spec-example1.sdf").read_text())
+        result = query(sdf, pin_pattern="(z)\\1|^z$")
+        assert _count_entries(result.cells) > 0
+
+    def test_result_is_independent_copy(self):
+        sdf = parse_sdf((DATA_DIR / "spec-example1.sdf").read_text())
+        result = query(sdf)
+        for cell_type, instances in result.cells.items():
+            for instance, entries in instances.items():
+                for name, entry in entries.items():
+                    original = sdf.cells[cell_type][instance][name]
+                    assert entry == original
+                    assert entry is not original
+                    assert type(entry) is type(original)
+                    if entry.delay_paths is not None:
+                        assert entry.delay_paths is not original.delay_paths
+                        # Frozen triples are shared rather than copied.
+                        assert entry.delay_paths.slow is original.delay_paths.slow
+        result.header.design = "changed"
+        assert sdf.header.design != "changed"
+
 
 class TestDiff:
     def test_identical_files(self):
@@ -425,6 +569,45 @@ class TestBatchEndpointAnalysis:
         for r in results:
             assert r.path_count > 0
 
+    def test_matches_composed_delays(self, spec1_graph):
+        results = batch_endpoint_analysis(spec1_graph, field="slow", metric="max")
+        for r in results:
+            paths = spec1_graph.find_paths(r.source, r.sink)
+            scalars = [
+                s
+                for p in paths
+                if (s := spec1_graph.compose_delay(p).get_scalar("slow", "max"))
+                is not None
+            ]
+            assert r.path_count == len(paths)
+            assert r.critical_delay == (max(scalars) if scalars else None)
+
+
+class TestComputeAll:
+    @pytest.mark.parametrize(
+        "name", ["spec-example1.sdf", "spec-example3.sdf", "bigchip.sdf", "empty.sdf"]
+    )
+    def test_matches_separate_passes(self, name):
+        sdf = parse_sdf((DATA_DIR / name).read_text())
+        stats, issues, graph = compute_all(sdf, field="slow", metric="min")
+        assert stats == compute_stats(sdf, field="slow", metric="min")
+        assert issues == validate(sdf)
+        expected = TimingGraph(sdf)
+        assert list(graph.graph.edges(data=True)) == list(
+            expected.graph.edges(data=True)
+        )
+
+    def test_reports_entry_and_cross_cell_issues(self):
+        sdf = SDFFile(
+            header=SDFHeader(),
+            cells={
+                "A": {"a0": {"e1": BaseEntry(name="e1", delay_paths=None)}},
+                "B": {"a0": {}},
+            },
+        )
+        _, issues, _ = compute_all(sdf)
+        assert issues == validate(sdf)
+
 
 class TestReport:
     def test_basic_report(self):
@@ -438,6 +621,25 @@ class TestReport:
         text = generate_report(sdf, field="slow", metric="min", period=10.0)
         assert "Slack" in text
 
+    def test_report_does_not_interpret_markup(self):
+        sdf = (
+            SDFBuilder()
+            .set_header(design="[bold]top[/bold]", timescale="1ps")
+            .add_cell("BUF", "b0")
+            .add_iopath("A", "Y", {"slow": {"min": 1.0, "avg": 1.0, "max": 1.0}})
+            .build()
+        )
+        text = generate_report(sdf)
+        assert "[bold]top[/bold]" in text
+
+    def test_report_slack_matches_compute_slack(self):
+        sdf = parse_sdf((DATA_DIR / "spec-example1.sdf").read_text())
+        graph = TimingGraph(sdf)
+        top = batch_endpoint_analysis(graph, field="slow", metric="min")[0]
+        expected = compute_slack(graph, top.source, top.sink, 10.0, "slow", "min")
+        text = generate_report(sdf, field="slow", metric="min", period=10.0)
+        assert f"{expected:.6f}" in text
+
     def test_report_returns_string(self):
         sdf = parse_sdf((DATA_DIR / "spec-example1.sdf").read_text())
         text = generate_report(sdf, field="slow", metric="min")
@@ -1,5 +1,7 @@
 """Tests for sdf_lark_parser.py -- error handling and public API."""
 
+import os
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -8,6 +10,7 @@ from lark import LarkError
 
 from sdf_toolkit.parser.parser import (
     SDFLarkParser,
+    _get_lark,
     _local,
     get_parser,
     parse_sdf,
@@ -21,20 +24,33 @@ class TestSDFLarkParserErrors:
         with pytest.raises(LarkError, match="SDF parsing failed"):
             parser.parse("THIS IS NOT VALID SDF")
 
-    def test_generic_exception_path(self):
+    def test_generic_exception_propagates(self):
         parser = SDFLarkParser()
+        error = RuntimeError("boom")
         with (
-            patch.object(parser.parser, "parse", side_effect=RuntimeError("boom")),
-            pytest.raises(RuntimeError, match="Unexpected error during SDF parsing"),
+            patch.object(parser.parser, "parse", side_effect=error),
+            pytest.raises(RuntimeError) as exc_info,
+        ):
+            parser.parse("(DELAYFILE)")
+        assert exc_info.value is error
+
+    def test_multi_arg_exception_propagates(self):
+        parser = SDFLarkParser()
+        error = UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+        with (
+            patch.object(parser.parser, "parse", side_effect=error),
+            pytest.raises(UnicodeDecodeError),
         ):
             parser.parse("(DELAYFILE)")
 
     def test_grammar_file_missing(self):
+        _get_lark.cache_clear()
         with (
             patch("pathlib.Path.open", side_effect=FileNotFoundError("not found")),
             pytest.raises(FileNotFoundError, match="Grammar file not found"),
         ):
             SDFLarkParser()
+        _get_lark.cache_clear()
 
 
 class TestParseFile:
@@ -65,6 +81,35 @@ class TestParseFile:
         assert len(result.cells) == 1
         assert "BUF" in result.cells
 
+    def test_parse_file_matches_parse(self):
+        path = DATA_DIR / "test1.sdf"
+        parser = SDFLarkParser()
+        assert parser.parse_file(path) == parser.parse(path.read_text())
+
+    def test_parse_file_empty(self, tmp_path):
+        empty = tmp_path / "empty.sdf"
+        empty.write_text("")
+        with pytest.raises(LarkError, match="SDF parsing failed"):
+            SDFLarkParser().parse_file(empty)
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+    def test_parse_file_fifo(self, tmp_path):
+        fifo = tmp_path / "design.sdf"
+        os.mkfifo(fifo)
+        content = (DATA_DIR / "test1.sdf").read_bytes()
+
+        def feed() -> None:
+            with fifo.open("wb") as f:
+                f.write(content)
+
+        writer = threading.Thread(target=feed)
+        writer.start()
+        try:
+            result = SDFLarkParser().parse_file(fifo)
+        finally:
+            writer.join()
+        assert result == parse_sdf(content.decode())
+
     def test_parse_file_nonexistent(self):
         parser = SDFLarkParser()
         with pytest.raises(Exception, match="Error reading SDF file"):
@@ -78,11 +123,17 @@ class TestModuleLevelFunctions:
         assert hasattr(result, "cells")
 
     def test_get_parser_caching(self):
-        if hasattr(_local, "parser"):
-            del _local.parser
         p1 = get_parser()
         p2 = get_parser()
         assert p1 is p2
+        assert p1 is _local.parser
+
+    def test_get_parser_per_thread(self):
+        other: list[SDFLarkParser] = []
+        thread = threading.Thread(target=lambda: other.append(get_parser()))
+        thread.start()
+        thread.join()
+        assert other[0] is not get_parser()
 
     def test_parse_sdf(self):
         sdf_content = (DATA_DIR / "test1.sdf").read_text()
@@ -108,3 +159,13 @@ class TestModuleLevelFunctions:
         assert len(result1.cells) == len(result2.cells)
         for c1, c2 in zip(result1.cells, result2.cells, strict=True):
             assert c1 == c2
+
+
+class TestGrammarCache:
+    def test_lalr_cache_enabled(self):
+        """The compiled LALR tables are cached on disk between processes."""
+        assert SDFLarkParser().parser.options.cache is True
+
+    def test_compiled_grammar_shared(self):
+        """Parser instances reuse one compiled grammar."""
+        assert SDFLarkParser().parser is SDFLarkParser().parser
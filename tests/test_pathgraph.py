@@ -1,5 +1,6 @@
 import networkx as nx
 import pytest
+from conftest import DATA_DIR
 
 from sdf_toolkit.core.builder import SDFBuilder
 from sdf_toolkit.core.model import (
@@ -17,6 +18,7 @@ from sdf_toolkit.core.pathgraph import (
     rank_paths,
     verify_path,
 )
+from sdf_toolkit.parser.parser import parse_sdf_file
 
 EXPECTED_NODES = {
     "P1/z",
@@ -59,6 +61,16 @@ class TestTimingGraphBuild:
     def test_graph_property(self, spec1_graph: TimingGraph) -> None:
         assert isinstance(spec1_graph.graph, nx.MultiDiGraph)
 
+    def test_add_entry_matches_constructor(self, spec1_graph: TimingGraph) -> None:
+        sdf = parse_sdf_file(DATA_DIR / "spec-example1.sdf")
+        graph = TimingGraph()
+        for cell_type, instances in sdf.cells.items():
+            for instance, entries in instances.items():
+                for entry in entries.values():
+                    graph.add_entry(entry, cell_type, instance)
+        assert graph.nodes() == EXPECTED_NODES
+        assert graph.edges() == spec1_graph.edges()
+
 
 class TestFindPaths:
     def test_find_paths_p1_to_p2(self, spec1_graph: TimingGraph) -> None:
@@ -69,6 +81,22 @@ class TestFindPaths:
         paths = spec1_graph.find_paths("P2/i", "P1/z")
         assert paths == []
 
+    def test_paths_reuse_graph_edges(self, spec1_graph: TimingGraph) -> None:
+        edge_ids = {id(edge) for edge in spec1_graph.edges()}
+        for path in spec1_graph.find_paths("P1/z", "P2/i"):
+            assert all(id(edge) in edge_ids for edge in path)
+
+    def test_iter_paths_matches_find_paths(self, spec1_graph: TimingGraph) -> None:
+        paths = spec1_graph.iter_paths("P1/z", "P2/i")
+        assert not isinstance(paths, list)
+        assert list(paths) == spec1_graph.find_paths("P1/z", "P2/i")
+
+    def test_iter_paths_unknown_node_raises_eagerly(
+        self, spec1_graph: TimingGraph
+    ) -> None:
+        with pytest.raises(nx.NodeNotFound):
+            spec1_graph.iter_paths("nope", "P2/i")
+
 
 class TestComposeDelay:
     def test_compose_single_edge(self, spec1_graph: TimingGraph) -> None:
@@ -310,6 +338,16 @@ class TestParallelEdgesMultiHop:
         paths = multi_hop_parallel_graph.find_paths("a/Y", "b/Y")
         assert len(paths) == 2
 
+    def test_iter_composed_matches_compose_delay(
+        self, multi_hop_parallel_graph: TimingGraph
+    ) -> None:
+        pairs = list(multi_hop_parallel_graph.iter_composed("a/Y", "b/Y"))
+        assert [edges for edges, _ in pairs] == multi_hop_parallel_graph.find_paths(
+            "a/Y", "b/Y"
+        )
+        for edges, delay in pairs:
+            assert delay == multi_hop_parallel_graph.compose_delay(edges)
+
 
 class TestNoneScalarSorting:
     """Bug #3: None scalars should sort last in rank_paths, not first."""
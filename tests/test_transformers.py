@@ -1,12 +1,15 @@
 """Tests for sdf_transformers.py -- transformer coverage for edge cases."""
 
+import sys
+from dataclasses import FrozenInstanceError
+
 import pytest
 from conftest import DATA_DIR
 from lark import Token
 
 from sdf_toolkit.core.model import EntryType
 from sdf_toolkit.parser.parser import parse_sdf
-from sdf_toolkit.parser.transformers import SDFTransformer
+from sdf_toolkit.parser.transformers import SDFTransformer, remove_quotation
 
 
 class TestIncrementDelays:
@@ -152,8 +155,8 @@ class TestDeviceDelays:
 
 class TestEmptyRvalue:
     def test_empty_rvalue_produces_default_values(self):
-        """rvalue with no args or empty token list produces Values()."""
-        result = SDFTransformer().rvalue()
+        """An empty ``()`` rvalue produces Values()."""
+        result = SDFTransformer().rvalue_triple(None)
         assert result.min is None
         assert result.avg is None
         assert result.max is None
@@ -169,3 +172,84 @@ class TestInvalidPortSpec:
                 Token("ID", "CLK"),
                 Token("ID", "extra"),
             )
+
+
+class TestRemoveQuotation:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [('"BUF"', "BUF"), ('""', ""), ("BUF", "BUF"), ('"', '"')],
+    )
+    def test_strips_surrounding_quotes_only(self, raw, expected):
+        assert remove_quotation(raw) == expected
+
+
+class TestInternedNames:
+    def test_port_names_share_one_object(self):
+        transformer = SDFTransformer()
+        a = transformer.port_spec("".join(["C", "LK"]))
+        b = transformer.port_spec("".join(["CL", "K"]))
+        assert a.port is b.port
+
+    def test_instance_interned(self):
+        instance = SDFTransformer().instance(Token("STRING", "top.u1"))
+        assert instance is sys.intern("top.u1")
+
+    def test_celltype_interned(self):
+        celltype = SDFTransformer().celltype(Token("QSTRING", '"BUF"'))
+        assert celltype is sys.intern("BUF")
+
+
+class TestEntryNameCollisions:
+    def test_repeated_iopaths_get_sequential_suffixes(self):
+        iopaths = "\n".join(f"(IOPATH A Y ({i}:{i}:{i}))" for i in range(1, 5))
+        sdf_content = f"""(DELAYFILE
+(SDFVERSION "3.0")
+(TIMESCALE 1ps)
+(CELL (CELLTYPE "BUF") (INSTANCE b0)
+  (DELAY (ABSOLUTE {iopaths}))
+)
+)"""
+        entries = parse_sdf(sdf_content).cells["BUF"]["b0"]
+        names = list(entries)
+        assert names == [
+            "iopath_A_Y",
+            "iopath_A_Y_1",
+            "iopath_A_Y_2",
+            "iopath_A_Y_3",
+        ]
+        assert [entries[n].name for n in names] == names
+
+
+class TestSharedValues:
+    @staticmethod
+    def _parse(iopaths: str) -> dict:
+        sdf_content = f"""(DELAYFILE
+(SDFVERSION "3.0")
+(TIMESCALE 1ps)
+(CELL (CELLTYPE "BUF") (INSTANCE b0)
+  (DELAY (ABSOLUTE {iopaths}))
+)
+(CELL (CELLTYPE "BUF") (INSTANCE b1)
+  (DELAY (ABSOLUTE {iopaths}))
+)
+)"""
+        return parse_sdf(sdf_content).cells["BUF"]
+
+    def test_identical_triples_share_one_object(self):
+        cells = self._parse("(IOPATH A Y (1:2:3) (1:2:3))")
+        first = cells["b0"]["iopath_A_Y"].delay_paths
+        second = cells["b1"]["iopath_A_Y"].delay_paths
+        assert first.fast is first.slow is second.fast
+
+    def test_shared_triples_are_immutable(self):
+        cells = self._parse("(IOPATH A Y (1:2:3) (1:2:3))")
+        values = cells["b0"]["iopath_A_Y"].delay_paths.fast
+        with pytest.raises(FrozenInstanceError):
+            values.min = 0.5
+        assert cells["b1"]["iopath_A_Y"].delay_paths.fast.min == 1.0
+
+    def test_negative_zero_not_aliased(self):
+        cells = self._parse("(IOPATH A Y (0:1:2) (-0.0:1:2))")
+        dp = cells["b0"]["iopath_A_Y"].delay_paths
+        assert str(dp.fast.min) == "0.0"
+        assert str(dp.slow.min) == "-0.0"
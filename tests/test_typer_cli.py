@@ -1,13 +1,39 @@
+import importlib
 import json
+import os
+import pickle
+import re
+import stat
 import subprocess
 import sys
+from collections import Counter
 from pathlib import Path
-from unittest.mock import patch
+from typing import BinaryIO
+from unittest.mock import Mock, patch
 
+import pytest
 from conftest import DATA_DIR
 from typer.testing import CliRunner
 
-from sdf_toolkit.cli import app, main
+from sdf_toolkit.analysis.export import to_dot
+from sdf_toolkit.analysis.report import generate_report
+from sdf_toolkit.analysis.validate import _PARALLEL_MIN_CELLS
+from sdf_toolkit.cli import (
+    _delay_paths_from_dict,
+    _graph_cache_path,
+    _load_graph,
+    _load_graph_cached,
+    _load_sdf,
+    _sdffile_from_dict,
+    _write_cache_file,
+    app,
+    main,
+)
+from sdf_toolkit.core.builder import SDFBuilder
+from sdf_toolkit.core.model import DelayPaths, Values
+from sdf_toolkit.core.pathgraph import TimingGraph
+from sdf_toolkit.io.writer import emit_sdf
+from sdf_toolkit.parser.parser import parse_sdf_file
 
 runner = CliRunner()
 
@@ -23,6 +49,28 @@ class TestParse:
         assert "header" in data
         assert "cells" in data
 
+    def test_parse_json_matches_to_dict(self) -> None:
+        result = runner.invoke(app, ["parse", SPEC_EXAMPLE1])
+        assert result.exit_code == 0
+        expected = json.dumps(
+            parse_sdf_file(SPEC_EXAMPLE1).to_dict(), separators=(",", ":")
+        )
+        assert result.output == expected + "\n"
+
+    def test_parse_json_pretty(self) -> None:
+        result = runner.invoke(app, ["parse", SPEC_EXAMPLE1, "--pretty"])
+        assert result.exit_code == 0
+        expected = json.dumps(parse_sdf_file(SPEC_EXAMPLE1).to_dict(), indent=2)
+        assert result.output == expected + "\n"
+
+    def test_parse_crlf_file(self, tmp_path: Path) -> None:
+        sdf_file = tmp_path / "crlf.sdf"
+        text = Path(SPEC_EXAMPLE1).read_text()
+        sdf_file.write_bytes(text.replace("\n", "\r\n").encode())
+        result = runner.invoke(app, ["parse", str(sdf_file)])
+        assert result.exit_code == 0
+        assert result.output == runner.invoke(app, ["parse", SPEC_EXAMPLE1]).output
+
     def test_parse_sdf(self) -> None:
         result = runner.invoke(app, ["parse", SPEC_EXAMPLE1, "--format", "sdf"])
         assert result.exit_code == 0
@@ -45,6 +93,24 @@ class TestEmit:
         assert emit_result.exit_code == 0
         assert "DELAYFILE" in emit_result.output
 
+    def test_sdffile_from_dict_roundtrip(self) -> None:
+        sdf = parse_sdf_file(SPEC_EXAMPLE1)
+        data = json.loads(json.dumps(sdf.to_dict()))
+        assert _sdffile_from_dict(data).to_dict() == sdf.to_dict()
+
+    def test_sdffile_from_dict_rejects_unknown_type(self) -> None:
+        data = {"cells": {"BUF": {"b0": {"e": {"name": "e", "type": "bogus"}}}}}
+        with pytest.raises(ValueError, match="bogus"):
+            _sdffile_from_dict(data)
+
+    def test_delay_paths_from_dict_partial_triple(self) -> None:
+        dp = _delay_paths_from_dict({"slow": {"min": 1.0, "max": 2.0}, "fast": None})
+        assert dp == DelayPaths(slow=Values(min=1.0, avg=None, max=2.0))
+
+    def test_delay_paths_from_dict_rejects_unknown_keys(self) -> None:
+        with pytest.raises(TypeError, match="mx"):
+            _delay_paths_from_dict({"slow": {"min": 1.0, "mx": 2.0}})
+
 
 class TestInfo:
     def test_info(self) -> None:
@@ -53,6 +119,35 @@ class TestInfo:
         assert "SDF Header" in result.output
         assert "Cell Summary" in result.output
 
+    def test_info_many_instances_uses_columns(self, tmp_path: Path) -> None:
+        builder = SDFBuilder().set_header(timescale="1ps")
+        for i in range(250):
+            builder = builder.add_cell("BUF", f"b{i}").add_iopath(
+                "A", "Y", {"slow": {"min": 1.0, "avg": 1.0, "max": 1.0}}
+            )
+        sdf_file = tmp_path / "many.sdf"
+        sdf_file.write_text(emit_sdf(builder.build()))
+
+        result = runner.invoke(app, ["info", str(sdf_file)])
+        assert result.exit_code == 0
+        assert "Instances" in result.output
+        assert "b0 " in result.output
+        assert "b249" in result.output
+        assert "│ b249" not in result.output
+
+    def test_info_entry_type_counts(self) -> None:
+        sdf = parse_sdf_file(SPEC_EXAMPLE1)
+        counts = Counter(
+            str(entry.type)
+            for instances in sdf.cells.values()
+            for entries in instances.values()
+            for entry in entries.values()
+        )
+        result = runner.invoke(app, ["info", SPEC_EXAMPLE1])
+        assert result.exit_code == 0
+        for entry_type, count in counts.items():
+            assert re.search(rf"\b{entry_type}\s+│\s+{count}\b", result.output)
+
 
 class TestCompose:
     def test_compose(self) -> None:
@@ -65,6 +160,28 @@ class TestCompose:
         assert result.exit_code == 0
         assert "->" in result.output
 
+    def test_compose_compact_by_default(self) -> None:
+        result = runner.invoke(app, ["compose", SPEC_EXAMPLE1, "P1/z", "P2/i"])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert len(lines) == 2
+        assert all(line.startswith("Path ") for line in lines)
+
+    def test_compose_pretty(self) -> None:
+        result = runner.invoke(
+            app, ["compose", SPEC_EXAMPLE1, "P1/z", "P2/i", "--pretty"]
+        )
+        assert result.exit_code == 0
+        assert '\n  "fast": {' in result.output
+
+    def test_compose_limit(self) -> None:
+        result = runner.invoke(
+            app, ["compose", SPEC_EXAMPLE1, "P1/z", "P2/i", "-n", "1"]
+        )
+        assert result.exit_code == 0
+        assert "Path 1" in result.output
+        assert "Path 2" not in result.output
+
 
 class TestVerify:
     def test_verify_pass(self) -> None:
@@ -128,6 +245,91 @@ class TestCriticalPathCmd:
         assert "No path found" in result.output
 
 
+class TestGraphCache:
+    ARGS = ("critical-path", SPEC_EXAMPLE1, "P1/z", "P2/i")
+
+    @pytest.fixture(autouse=True)
+    def _clear_memo(self) -> None:
+        _load_graph_cached.cache_clear()
+
+    def test_second_run_skips_parse(self) -> None:
+        first = runner.invoke(app, list(self.ARGS))
+        assert first.exit_code == 0
+        _load_graph_cached.cache_clear()
+        with patch("sdf_toolkit.cli._load_sdf", side_effect=AssertionError):
+            second = runner.invoke(app, list(self.ARGS))
+        assert second.exit_code == 0
+        assert second.output == first.output
+
+    def test_memoized_in_process(self) -> None:
+        sdf_file = Path(SPEC_EXAMPLE1)
+        assert _load_graph(sdf_file) is _load_graph(sdf_file)
+        assert _load_graph(sdf_file, use_cache=False) is not _load_graph(sdf_file)
+
+    def test_no_cache_always_parses(self) -> None:
+        runner.invoke(app, list(self.ARGS))
+        with patch("sdf_toolkit.cli._load_sdf", wraps=_load_sdf) as load:
+            result = runner.invoke(app, [*self.ARGS, "--no-cache"])
+        assert result.exit_code == 0
+        load.assert_called_once()
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path) -> None:
+        sdf_file = tmp_path / "design.sdf"
+        sdf_file.write_text(Path(SPEC_EXAMPLE1).read_text())
+        args = ["critical-path", str(sdf_file), "P1/z", "P2/i"]
+        assert runner.invoke(app, args).exit_code == 0
+
+        sdf_file.write_text(Path(SPEC_EXAMPLE1).read_text() + "\n")
+        with patch("sdf_toolkit.cli._load_sdf", wraps=_load_sdf) as load:
+            result = runner.invoke(app, args)
+        assert result.exit_code == 0
+        load.assert_called_once()
+        # The edited file's entry replaces the old one.
+        assert [p.name for p in _graph_cache_path(sdf_file).parent.iterdir()] == [
+            _graph_cache_path(sdf_file).name
+        ]
+
+    def test_corrupt_cache_is_rebuilt(self) -> None:
+        cache_path = _graph_cache_path(Path(SPEC_EXAMPLE1).resolve())
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(b"not a pickle")
+        result = runner.invoke(app, list(self.ARGS))
+        assert result.exit_code == 0
+        assert "Critical path scalar" in result.output
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache" / "graph.pkl"
+
+        def dump(f: BinaryIO) -> None:
+            f.write(b"partial")
+            raise pickle.PicklingError
+
+        _write_cache_file(cache_path, dump)
+        assert list(cache_path.parent.iterdir()) == []
+
+    def test_unexpected_error_removes_temp_file(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache" / "graph.pkl"
+        with pytest.raises(KeyboardInterrupt):
+            _write_cache_file(cache_path, Mock(side_effect=KeyboardInterrupt))
+        assert list(cache_path.parent.iterdir()) == []
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    @pytest.mark.parametrize("target", ["file", "dir"])
+    def test_writable_cache_is_not_loaded(self, target: str) -> None:
+        runner.invoke(app, list(self.ARGS))
+        _load_graph_cached.cache_clear()
+        cache_path = _graph_cache_path(Path(SPEC_EXAMPLE1).resolve())
+        path = cache_path if target == "file" else cache_path.parent
+        path.chmod(path.stat().st_mode | stat.S_IWOTH)
+        with (
+            patch("sdf_toolkit.cli.pickle.load", side_effect=AssertionError),
+            patch("sdf_toolkit.cli._load_sdf", wraps=_load_sdf) as load,
+        ):
+            result = runner.invoke(app, list(self.ARGS))
+        assert result.exit_code == 0
+        load.assert_called_once()
+
+
 class TestRankPathsCmd:
     def test_rank_paths(self) -> None:
         result = runner.invoke(app, ["rank-paths", SPEC_EXAMPLE1, "P1/z", "P2/i"])
@@ -143,6 +345,12 @@ class TestRankPathsCmd:
         assert "#1" in result.output
         assert "#2" not in result.output
 
+    def test_rank_paths_jobs(self) -> None:
+        args = ["rank-paths", SPEC_EXAMPLE1, "P1/z", "P2/i"]
+        result = runner.invoke(app, [*args, "--jobs", "2"])
+        assert result.exit_code == 0
+        assert result.output == runner.invoke(app, args).output
+
     def test_rank_paths_ascending(self) -> None:
         result = runner.invoke(
             app, ["rank-paths", SPEC_EXAMPLE1, "P1/z", "P2/i", "--ascending"]
@@ -206,6 +414,14 @@ class TestDotCmd:
         content = out.read_text()
         assert "digraph timing" in content
 
+    def test_dot_streams_same_text_as_to_dot(self, tmp_path: Path) -> None:
+        expected = to_dot(TimingGraph(parse_sdf_file(SPEC_EXAMPLE1)))
+        result = runner.invoke(app, ["dot", SPEC_EXAMPLE1])
+        assert result.output == expected + "\n"
+        out = tmp_path / "graph.dot"
+        runner.invoke(app, ["dot", SPEC_EXAMPLE1, "-o", str(out)])
+        assert out.read_text() == expected
+
 
 TEST1 = str(DATA_DIR / "test1.sdf")
 
@@ -237,6 +453,25 @@ class TestLintCmd:
         assert result.exit_code == 0
         assert "Lint Issues" in result.output
 
+    def test_lint_jobs(self, tmp_path: Path) -> None:
+        """Threaded entry checks report the same issues in the same order."""
+        # Every other cell has an empty IOPATH triple, which lint warns about.
+        cells = "".join(
+            f'(CELL (CELLTYPE "CELL{i}") (INSTANCE u{i})'
+            f" (DELAY (ABSOLUTE (IOPATH A Y ({'' if i % 2 else '1:2:3'})))))\n"
+            for i in range(_PARALLEL_MIN_CELLS + 16)
+        )
+        sdf_file = tmp_path / "many_cells.sdf"
+        sdf_file.write_text(
+            f'(DELAYFILE (SDFVERSION "3.0") (TIMESCALE 1ps)\n{cells})\n'
+        )
+
+        serial = runner.invoke(app, ["lint", str(sdf_file), "--jobs", "1"])
+        threaded = runner.invoke(app, ["lint", str(sdf_file), "--jobs", "4"])
+        assert serial.exit_code == threaded.exit_code == 0
+        assert "CELL79" in serial.output
+        assert threaded.output == serial.output
+
     def test_lint_severity_filter(self) -> None:
         result = runner.invoke(app, ["lint", SPEC_EXAMPLE1, "--severity", "error"])
         assert result.exit_code == 0
@@ -365,6 +600,11 @@ class TestReportCmd:
         result = runner.invoke(app, ["report", SPEC_EXAMPLE1, "--period", "10.0"])
         assert result.exit_code == 0
 
+    def test_report_matches_generate_report(self) -> None:
+        result = runner.invoke(app, ["report", SPEC_EXAMPLE1])
+        assert result.exit_code == 0
+        assert result.output == generate_report(parse_sdf_file(SPEC_EXAMPLE1))
+
 
 class TestMainEntry:
     def test_main_callable(self) -> None:
@@ -390,6 +630,26 @@ class TestMainEntry:
         assert proc.returncode == 0
         assert "Usage" in proc.stdout
 
+    def test_import_skips_graph_and_annotate_layers(self) -> None:
+        code = (
+            "import sys, sdf_toolkit.cli; "
+            "print(sorted({'networkx', 'sdf_toolkit.io.annotate'} & set(sys.modules)))"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=30
+        )
+        assert proc.returncode == 0
+        assert proc.stdout.strip() == "[]"
+
+    @pytest.mark.parametrize("package", ["sdf_toolkit", "sdf_toolkit.io"])
+    def test_lazy_exports_resolve(self, package: str) -> None:
+        module = importlib.import_module(package)
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+        assert set(module.__all__) <= set(dir(module))
+        with pytest.raises(AttributeError, match="no_such_name"):
+            module.no_such_name  # noqa: B018
+
 
 class TestNoArgs:
     def test_no_args_shows_help(self) -> None: